@@ -6,19 +6,67 @@ Usage:
 """
 
 from __future__ import annotations
-import json, argparse, pathlib, urllib.parse, time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import json, marshal, os, pathlib, sys, time
 from typing import List, Dict, Any
 
+# Server-only modules (http.server, urllib.parse, orjson, profiler) and argparse
+# are imported where they are used so library callers and CLI commands start fast.
 MANIFEST_PATH = pathlib.Path(__file__).parent / "agent.json"
 try:
-    from telemetry import get_telemetry  # local module
+    from telemetry import NULL_TIMER, get_telemetry, new_timer  # local module
 except Exception:  # pragma: no cover
+    from contextlib import nullcontext
+    from types import SimpleNamespace
+
+    # Minimal stand-in for telemetry.NULL_TIMER: no stages, no-op stage()
+    NULL_TIMER = SimpleNamespace(stages={}, stage=lambda name: nullcontext())
     get_telemetry = lambda manifest: None  # type: ignore
+    new_timer = lambda manifest: NULL_TIMER  # type: ignore
+
+_orjson: Any = None  # resolved on first _dumps_compact call; False if missing
+_json_memo: Dict[str, Any] = {}
+
+
+def _load_json(path: pathlib.Path, memo: bool = False) -> Any:
+    """Parse a JSON file via a marshal snapshot keyed on its mtime and size.
+
+    Snapshots live in a __pycache__ directory next to the file; set
+    EVENTKIT_NO_SNAPSHOT=1 to stop writing them. With memo=True the parsed value is also kept
+    in-process and returned as-is while the file is unchanged; callers must not
+    mutate it.
+    """
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    key = str(path.resolve())
+    if memo and key in _json_memo and _json_memo[key][0] == sig:
+        return _json_memo[key][1]
+    snap_name = f"{path.name}.{sys.implementation.cache_tag}.snap"
+    snap = path.parent / "__pycache__" / snap_name
+    data: Any = None
+    try:
+        with snap.open("rb") as f:
+            cached_sig, cached = marshal.load(f)
+        if tuple(cached_sig) == sig:
+            data = cached
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    if data is None:
+        data = json.loads(path.read_bytes())
+        if not os.environ.get("EVENTKIT_NO_SNAPSHOT"):
+            try:
+                snap.parent.mkdir(exist_ok=True)
+                tmp = snap.with_name(f"{snap.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(marshal.dumps((sig, data)))
+                os.replace(tmp, snap)
+            except (OSError, ValueError):
+                pass
+    if memo:
+        _json_memo[key] = (sig, data)
+    return data
 
 
 def load_manifest(path: pathlib.Path = MANIFEST_PATH) -> Dict[str, Any]:
-    return json.loads(path.read_text())
+    return _load_json(path)
 
 
 def _load_external_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -40,7 +88,7 @@ def _load_external_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not p.exists():
         return []
     try:
-        data = json.loads(p.read_text())
+        data = _load_json(p, memo=True)
         if isinstance(data, list):
             return [d for d in data if isinstance(d, dict)]
     except Exception:
@@ -100,13 +148,17 @@ def score_session(
 
 
 def recommend(
-    manifest: Dict[str, Any], interests: List[str], top_n: int
+    manifest: Dict[str, Any], interests: List[str], top_n: int, timer=NULL_TIMER
 ) -> Dict[str, Any]:
     w = manifest["weights"]
-    sessions = get_sessions(manifest)
-    scored = [score_session(s, interests, w) for s in sessions]
-    ranked = sorted(scored, key=lambda x: x["score"], reverse=True)[:top_n]
-    conflicts = _count_conflicts([r["session"] for r in ranked])
+    with timer.stage("session_load"):
+        sessions = get_sessions(manifest)
+    with timer.stage("scoring"):
+        scored = [score_session(s, interests, w) for s in sessions]
+    with timer.stage("ranking"):
+        ranked = sorted(scored, key=lambda x: x["score"], reverse=True)[:top_n]
+    with timer.stage("conflicts"):
+        conflicts = _count_conflicts([r["session"] for r in ranked])
     return {
         "sessions": [r["session"] for r in ranked],
         "scoring": [
@@ -122,14 +174,16 @@ def recommend(
 
 
 def explain(
-    manifest: Dict[str, Any], title: str, interests: List[str]
+    manifest: Dict[str, Any], title: str, interests: List[str], timer=NULL_TIMER
 ) -> Dict[str, Any]:
     w = manifest["weights"]
-    sessions = get_sessions(manifest)
+    with timer.stage("session_load"):
+        sessions = get_sessions(manifest)
     session = next((s for s in sessions if s["title"].lower() == title.lower()), None)
     if not session:
         return {"error": "session not found", "title": title}
-    detail = score_session(session, interests, w)
+    with timer.stage("scoring"):
+        detail = score_session(session, interests, w)
     return {
         "title": session["title"],
         "score": detail["score"],
@@ -141,14 +195,26 @@ def explain(
 def _count_conflicts(sessions: List[Dict[str, Any]]) -> int:
     slots = {}
     for s in sessions:
-        slot = (s.get("start"), s.get("end"))
+        slot = (s.get("date"), s.get("start"), s.get("end"))
         slots.setdefault(slot, 0)
         slots[slot] += 1
     return sum(1 for v in slots.values() if v > 1)
 
 
-def _build_adaptive_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
-    body = []
+CARD_VERSION = "1.5"
+CARD_SCHEMA = "http://adaptivecards.io/schemas/adaptive-card.json"
+_CARD_HEADER = {
+    "type": "TextBlock",
+    "text": "Event Recommendations",
+    "weight": "Bolder",
+    "size": "Medium",
+}
+_CARD_CACHE_MAX = 512
+_card_cache: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _render_adaptive_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    body = [_CARD_HEADER]
     actions = []
     for i, s in enumerate(sessions, start=1):
         body.append(
@@ -184,21 +250,47 @@ def _build_adaptive_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
         )
     return {
         "type": "AdaptiveCard",
-        "version": "1.5",
-        "body": [
-            {
-                "type": "TextBlock",
-                "text": "Event Recommendations",
-                "weight": "Bolder",
-                "size": "Medium",
-            }
-        ]
-        + body,
+        "version": CARD_VERSION,
+        "body": body,
         "actions": actions,
-        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+        "$schema": CARD_SCHEMA,
     }
 
 
+def _build_adaptive_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the card for sessions, cached per (rendered fields, card version).
+
+    The key holds every field the card displays, so a reloaded session file
+    that edits a title, time or room renders a fresh card. Cached cards are
+    shared between responses; treat them as read-only.
+    """
+    key = (
+        tuple(
+            (s.get("id"), s["title"], s.get("start"), s.get("end"), s.get("location"))
+            for s in sessions
+        ),
+        CARD_VERSION,
+    )
+    card = _card_cache.get(key)
+    if card is None:
+        if len(_card_cache) >= _CARD_CACHE_MAX:
+            _card_cache.pop(next(iter(_card_cache)))
+        card = _card_cache[key] = _render_adaptive_card(sessions)
+    return card
+
+
+def _dumps_compact(payload: Dict[str, Any]) -> bytes:
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson as _orjson  # optional fast encoder for serve responses
+        except ImportError:  # pragma: no cover
+            _orjson = False
+    if _orjson:
+        return _orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
 def _build_itinerary_markdown(interests: List[str], rec: Dict[str, Any]) -> str:
     lines = ["# Event Itinerary", "", f"Interests: {', '.join(interests)}", ""]
     for s in rec["sessions"]:
@@ -212,7 +304,36 @@ def _build_itinerary_markdown(interests: List[str], rec: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def export_itinerary(
+    manifest: Dict[str, Any],
+    interests: List[str],
+    output: str | None = None,
+    timer=NULL_TIMER,
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build the itinerary markdown, saving it when features.export is enabled.
+
+    Returns (export payload, recommendation result).
+    """
+    top_n = manifest["recommend"]["max_sessions_default"]
+    rec = recommend(manifest, interests, top_n, timer)
+    md = _build_itinerary_markdown(interests, rec)
+    feat_export = manifest.get("features", {}).get("export", {})
+    if feat_export.get("enabled"):
+        out_dir = pathlib.Path(feat_export.get("output_dir", "exports"))
+        fname = output or f"itinerary_{'_'.join(interests[:3])}.md"
+        path = out_dir / fname
+        with timer.stage("export_write"):
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(md)
+        payload = {"saved": str(path), "sessionCount": len(rec["sessions"])}
+    else:
+        payload = {"markdown": md, "sessionCount": len(rec["sessions"])}
+    return payload, rec
+
+
 def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     p = argparse.ArgumentParser("eventkit agent")
     sub = p.add_subparsers(dest="command")
     r = sub.add_parser("recommend")
@@ -231,25 +352,41 @@ def build_parser() -> argparse.ArgumentParser:
     s = sub.add_parser("serve")
     s.add_argument("--port", type=int, default=8010)
     s.add_argument("--card", action="store_true")
+    s.add_argument(
+        "--profile",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Sample live traffic for SECONDS after startup",
+    )
+    s.add_argument("--profile-dir", type=str, default="profiles")
+    s.add_argument("--profile-interval-ms", type=float, default=5.0)
+    s.add_argument(
+        "--admin",
+        action="store_true",
+        help="Enable /admin/profile (loopback clients only)",
+    )
     return p
 
 
 def main() -> None:
-    manifest = load_manifest()
-    telemetry = get_telemetry(manifest)
     parser = build_parser()
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
         return
+    manifest = load_manifest()
+    telemetry = get_telemetry(manifest)
     start_ts = time.time()
+    timer = new_timer(manifest)
     storage_file = manifest.get("profile", {}).get("storage_file")
     if args.command == "recommend":
         interests: List[str] = []
-        if args.profile_load and storage_file:
-            interests = load_profile(storage_file, args.profile_load)
-        if not interests and args.interests:
-            interests = _normalize_interests(args.interests)
+        with timer.stage("normalize"):
+            if args.profile_load and storage_file:
+                interests = load_profile(storage_file, args.profile_load)
+            if not interests and args.interests:
+                interests = _normalize_interests(args.interests)
         if not interests:
             err = {"error": "no interests provided"}
             print(json.dumps(err))
@@ -259,19 +396,22 @@ def main() -> None:
                 )
             return
         top_n = args.top if args.top else manifest["recommend"]["max_sessions_default"]
-        result = recommend(manifest, interests, top_n)
+        result = recommend(manifest, interests, top_n, timer)
         if args.profile_save and storage_file:
             save_profile(storage_file, args.profile_save, interests)
             result["profileSaved"] = args.profile_save
         print(json.dumps(result, indent=2))
         if telemetry:
-            telemetry.log("recommend", result, start_ts, success=True)
+            telemetry.log(
+                "recommend", result, start_ts, success=True, stages=timer.stages
+            )
         return
     if args.command == "explain":
         interests: List[str] = []
-        if args.interests:
-            interests = _normalize_interests(args.interests)
-        result = explain(manifest, args.session, interests)
+        with timer.stage("normalize"):
+            if args.interests:
+                interests = _normalize_interests(args.interests)
+        result = explain(manifest, args.session, interests, timer)
         print(json.dumps(result, indent=2))
         if telemetry:
             telemetry.log(
@@ -280,14 +420,16 @@ def main() -> None:
                 start_ts,
                 success="error" not in result,
                 error=result.get("error"),
+                stages=timer.stages,
             )
         return
     if args.command == "export":
         interests: List[str] = []
-        if args.profile_load and storage_file:
-            interests = load_profile(storage_file, args.profile_load)
-        if not interests and args.interests:
-            interests = _normalize_interests(args.interests)
+        with timer.stage("normalize"):
+            if args.profile_load and storage_file:
+                interests = load_profile(storage_file, args.profile_load)
+            if not interests and args.interests:
+                interests = _normalize_interests(args.interests)
         if not interests:
             err = {"error": "no interests provided"}
             print(json.dumps(err))
@@ -296,35 +438,39 @@ def main() -> None:
                     "export", err, start_ts, success=False, error="empty_interests"
                 )
             return
-        top_n = manifest["recommend"]["max_sessions_default"]
-        rec = recommend(manifest, interests, top_n)
-        md = _build_itinerary_markdown(interests, rec)
-        feat_export = manifest.get("features", {}).get("export", {})
-        if feat_export.get("enabled"):
-            out_dir = pathlib.Path(feat_export.get("output_dir", "exports"))
-            out_dir.mkdir(parents=True, exist_ok=True)
-            fname = args.output or f"itinerary_{'_'.join(interests[:3])}.md"
-            path = out_dir / fname
-            path.write_text(md)
-            export_payload = {"saved": str(path), "sessionCount": len(rec["sessions"])}
-        else:
-            export_payload = {"markdown": md, "sessionCount": len(rec["sessions"])}
+        export_payload, rec = export_itinerary(manifest, interests, args.output, timer)
         if args.profile_save and storage_file:
             save_profile(storage_file, args.profile_save, interests)
             export_payload["profileSaved"] = args.profile_save
         print(json.dumps(export_payload, indent=2))
         if telemetry:
             telemetry.log(
-                "export", {"sessions": rec["sessions"]}, start_ts, success=True
+                "export",
+                {"sessions": rec["sessions"]},
+                start_ts,
+                success=True,
+                stages=timer.stages,
             )
         return
     if args.command == "serve":
+        import urllib.parse
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        try:
+            from telemetry import Metrics  # local module
+        except Exception:  # pragma: no cover
+            Metrics = None  # type: ignore
+
         t = telemetry
 
         def _serve_with_telemetry(
-            manifest: Dict[str, Any], port: int, default_card: bool
+            manifest: Dict[str, Any],
+            port: int,
+            default_card: bool,
+            profiler=None,
+            admin: bool = False,
         ):
             storage_file = manifest.get("profile", {}).get("storage_file")
+            metrics = Metrics() if Metrics else None
 
             class Handler(BaseHTTPRequestHandler):
                 def _send(
@@ -333,21 +479,43 @@ def main() -> None:
                     payload: Dict[str, Any],
                     start_ts: float | None = None,
                     action: str | None = None,
+                    timer=NULL_TIMER,
                 ):
-                    body = json.dumps(payload).encode()
+                    body = _dumps_compact(payload)
                     self.send_response(code)
                     self.send_header("Content-Type", "application/json")
                     self.send_header("Content-Length", str(len(body)))
                     self.end_headers()
                     self.wfile.write(body)
-                    if t and action:
-                        t.log(
-                            action,
-                            payload,
-                            start_ts,
-                            success=(code == 200 and "error" not in payload),
-                            error=payload.get("error"),
-                        )
+                    if action:
+                        success = code == 200 and "error" not in payload
+                        if t:
+                            # Record carries stages up to here; telemetry_write
+                            # itself is only visible on /metrics.
+                            with timer.stage("telemetry_write"):
+                                t.log(
+                                    action,
+                                    payload,
+                                    start_ts,
+                                    success=success,
+                                    error=payload.get("error"),
+                                    stages=dict(timer.stages),
+                                )
+                        if metrics:
+                            metrics.observe(
+                                action,
+                                (time.time() - start_ts) * 1000,
+                                success,
+                                timer.stages,
+                            )
+
+                def _send_text(self, code: int, text: str, content_type: str):
+                    body = text.encode()
+                    self.send_response(code)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
 
                 def do_GET(self):  # noqa: N802
                     parsed = urllib.parse.urlparse(self.path)
@@ -356,23 +524,71 @@ def main() -> None:
                     if path == "/health":
                         self._send(200, {"status": "ok"}, time.time(), "health")
                         return
+                    if path == "/metrics":
+                        if not metrics:
+                            self._send(404, {"error": "metrics unavailable"})
+                            return
+                        self._send_text(
+                            200, metrics.render(), "text/plain; version=0.0.4"
+                        )
+                        return
+                    if path == "/admin/profile" and admin and profiler:
+                        if self.client_address[0] not in ("127.0.0.1", "::1"):
+                            self._send(
+                                403, {"error": "admin endpoints are loopback only"}
+                            )
+                            return
+                        seconds_raw = qs.get("seconds", [None])[0]
+                        if seconds_raw is None:
+                            self._send(
+                                200,
+                                {"running": profiler.running, "last": profiler.last},
+                            )
+                            return
+                        try:
+                            seconds = float(seconds_raw)
+                        except ValueError:
+                            seconds = float("nan")
+                        if not seconds > 0:  # also rejects nan
+                            self._send(
+                                400, {"error": "seconds must be a positive number"}
+                            )
+                            return
+                        from profiler import clamp_seconds  # local module
+
+                        seconds = clamp_seconds(seconds)
+                        if not profiler.start(seconds):
+                            self._send(409, {"error": "profile already running"})
+                            return
+                        self._send(
+                            202,
+                            {
+                                "status": "started",
+                                "seconds": seconds,
+                                "outputDir": str(profiler.out_dir),
+                            },
+                        )
+                        return
                     if path == "/recommend":
                         start = time.time()
+                        timer = new_timer(manifest)
                         interests_raw = qs.get("interests", [""])[0]
                         profile_load = qs.get("profileLoad", [None])[0]
                         top = qs.get("top", [None])[0]
                         card_flag = qs.get("card", [None])[0]
                         interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
+                        with timer.stage("normalize"):
+                            if profile_load and storage_file:
+                                interests = load_profile(storage_file, profile_load)
+                            if not interests and interests_raw:
+                                interests = _normalize_interests(interests_raw)
                         if not interests:
                             self._send(
                                 400,
                                 {"error": "no interests provided"},
                                 start,
                                 "recommend",
+                                timer,
                             )
                             return
                         top_n = (
@@ -380,47 +596,60 @@ def main() -> None:
                             if top
                             else manifest["recommend"]["max_sessions_default"]
                         )
-                        result = recommend(manifest, interests, top_n)
+                        result = recommend(manifest, interests, top_n, timer)
                         if default_card or card_flag == "1":
-                            result["adaptiveCard"] = _build_adaptive_card(
-                                result["sessions"]
-                            )
-                        self._send(200, result, start, "recommend")
+                            with timer.stage("card_build"):
+                                result["adaptiveCard"] = _build_adaptive_card(
+                                    result["sessions"]
+                                )
+                        self._send(200, result, start, "recommend", timer)
                         return
                     if path == "/explain":
                         start = time.time()
+                        timer = new_timer(manifest)
                         session_title = qs.get("session", [""])[0]
                         interests_raw = qs.get("interests", [""])[0]
                         profile_load = qs.get("profileLoad", [None])[0]
                         interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
+                        with timer.stage("normalize"):
+                            if profile_load and storage_file:
+                                interests = load_profile(storage_file, profile_load)
+                            if not interests and interests_raw:
+                                interests = _normalize_interests(interests_raw)
                         if not session_title:
                             self._send(
-                                400, {"error": "session required"}, start, "explain"
+                                400,
+                                {"error": "session required"},
+                                start,
+                                "explain",
+                                timer,
                             )
                             return
-                        result = explain(manifest, session_title, interests)
-                        self._send(200, result, start, "explain")
+                        result = explain(manifest, session_title, interests, timer)
+                        self._send(200, result, start, "explain", timer)
                         return
                     if path == "/export":
                         start = time.time()
+                        timer = new_timer(manifest)
                         interests_raw = qs.get("interests", [""])[0]
                         profile_load = qs.get("profileLoad", [None])[0]
                         interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
+                        with timer.stage("normalize"):
+                            if profile_load and storage_file:
+                                interests = load_profile(storage_file, profile_load)
+                            if not interests and interests_raw:
+                                interests = _normalize_interests(interests_raw)
                         if not interests:
                             self._send(
-                                400, {"error": "no interests provided"}, start, "export"
+                                400,
+                                {"error": "no interests provided"},
+                                start,
+                                "export",
+                                timer,
                             )
                             return
                         top_n = manifest["recommend"]["max_sessions_default"]
-                        rec = recommend(manifest, interests, top_n)
+                        rec = recommend(manifest, interests, top_n, timer)
                         md = _build_itinerary_markdown(interests, rec)
                         response = {
                             "markdown": md,
@@ -431,11 +660,12 @@ def main() -> None:
                             out_dir = pathlib.Path(
                                 feat_export.get("output_dir", "exports")
                             )
-                            out_dir.mkdir(parents=True, exist_ok=True)
                             path = out_dir / f"itinerary_{'_'.join(interests[:3])}.md"
-                            path.write_text(md)
+                            with timer.stage("export_write"):
+                                out_dir.mkdir(parents=True, exist_ok=True)
+                                path.write_text(md)
                             response["saved"] = str(path)
-                        self._send(200, response, start, "export")
+                        self._send(200, response, start, "export", timer)
                         return
                     self._send(404, {"error": "not found"}, time.time(), "unknown")
 
@@ -444,7 +674,7 @@ def main() -> None:
 
             server = HTTPServer(("0.0.0.0", port), Handler)
             print(
-                f"[serve] listening on port {port} (endpoints: /recommend /explain /health /export)"
+                f"[serve] listening on port {port} (endpoints: /recommend /explain /health /export /metrics)"
             )
             try:
                 server.serve_forever()
@@ -452,7 +682,21 @@ def main() -> None:
                 print("[serve] shutting down")
                 server.server_close()
 
-        _serve_with_telemetry(manifest, args.port, getattr(args, "card", False))
+        profiler = None
+        if args.profile or args.admin:
+            from profiler import SamplingProfiler  # local module
+
+            profiler = SamplingProfiler(args.profile_dir, args.profile_interval_ms)
+            if args.profile:
+                profiler.start(args.profile)
+                print(f"[serve] profiling for {args.profile}s -> {args.profile_dir}/")
+        _serve_with_telemetry(
+            manifest,
+            args.port,
+            getattr(args, "card", False),
+            profiler=profiler,
+            admin=args.admin,
+        )
         return
     build_parser().print_help()
 
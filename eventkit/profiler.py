@@ -0,0 +1,124 @@
+import marshal, pathlib, sys, threading, time
+from collections import Counter
+from typing import Any, Dict, Tuple
+
+# Frames are keyed as (filename, first line, function name), matching pstats
+Frame = Tuple[str, int, str]
+
+MAX_SECONDS = 300.0
+# Leaf frames in these modules mean the thread is parked waiting for work
+_IDLE_MODULES = ("selectors.py", "threading.py", "socketserver.py")
+
+
+def clamp_seconds(seconds: float) -> float:
+    """Window length actually used for a requested profile duration."""
+    return max(0.1, min(float(seconds), MAX_SECONDS))
+
+
+class SamplingProfiler:
+    """Samples live thread stacks on a background thread for a fixed window.
+
+    Only the sampler thread does work, so serving threads are not instrumented;
+    idle samples (blocked in select/wait) are dropped. Results are written as
+    collapsed stacks (flamegraph.pl / speedscope) and a pstats file built from
+    the samples (snakeviz / `python -m pstats`).
+    """
+
+    def __init__(self, out_dir: str = "profiles", interval_ms: float = 5.0):
+        self.out_dir = pathlib.Path(out_dir)
+        self.interval = interval_ms / 1000
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.samples: Counter = Counter()
+        self.last: Dict[str, Any] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float) -> bool:
+        """Begin a profiling window; returns False if one is already running."""
+        with self._lock:
+            if self.running:
+                return False
+            seconds = clamp_seconds(seconds)
+            self.samples = Counter()
+            self._thread = threading.Thread(
+                target=self._run, args=(seconds,), name="eventkit-profiler", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: float | None = None) -> Dict[str, Any] | None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.last
+
+    def _run(self, seconds: float) -> None:
+        own = threading.get_ident()
+        started = time.time()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            self._sample(own)
+            time.sleep(self.interval)
+        self.last = self.dump(started, seconds)
+
+    def _sample(self, own: int) -> None:
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if not stack or stack[0][0].endswith(_IDLE_MODULES):
+                continue
+            self.samples[tuple(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        lines = []
+        for stack, count in sorted(self.samples.items(), key=lambda kv: -kv[1]):
+            names = ";".join(
+                f"{name} ({pathlib.Path(fn).name}:{line})" for fn, line, name in stack
+            )
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def pstats_dict(self) -> Dict[Frame, tuple]:
+        """Convert samples to the marshalled dict that pstats.Stats loads.
+
+        Call counts are sample counts; tt/ct are sample counts times interval.
+        """
+        tt: Counter = Counter()
+        ct: Counter = Counter()
+        callers: Dict[Frame, Counter] = {}
+        for stack, count in self.samples.items():
+            tt[stack[-1]] += count
+            for func in set(stack):
+                ct[func] += count
+            for caller, callee in set(zip(stack, stack[1:])):
+                callers.setdefault(callee, Counter())[caller] += count
+        stats = {}
+        for func, n in ct.items():
+            edges = {
+                c: (k, k, 0.0, k * self.interval)
+                for c, k in callers.get(func, {}).items()
+            }
+            stats[func] = (n, n, tt[func] * self.interval, n * self.interval, edges)
+        return stats
+
+    def dump(self, started: float, seconds: float) -> Dict[str, Any]:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stem = time.strftime("serve_%Y%m%d_%H%M%S", time.localtime(started))
+        collapsed = self.out_dir / f"{stem}.collapsed"
+        pstats_path = self.out_dir / f"{stem}.pstats"
+        collapsed.write_text(self.collapsed())
+        with pstats_path.open("wb") as f:
+            marshal.dump(self.pstats_dict(), f)
+        return {
+            "seconds": seconds,
+            "samples": sum(self.samples.values()),
+            "collapsed": str(collapsed),
+            "pstats": str(pstats_path),
+        }
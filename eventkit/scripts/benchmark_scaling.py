@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark recommend/explain/export/conflict counting across catalog sizes.
+Catalogs come from scripts/generate_catalog.py (deterministic by seed) and are
+cached in compact binary form so repeated runs skip generation.
+Usage:
+  python scripts/benchmark_scaling.py
+  python scripts/benchmark_scaling.py --sizes 1000 10000 100000 1000000 --repeat 3
+"""
+
+import argparse, json, pathlib, statistics, sys, time
+from typing import Any, Callable, Dict, List
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parents[1]
+for p in (SCRIPT_DIR, SCRIPT_DIR / "scripts"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+import agent  # type: ignore
+from generate_catalog import (  # type: ignore
+    MAGIC,
+    decode_binary,
+    encode_binary,
+    generate_catalog,
+)
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+INTERESTS = ["agents", "ai safety", "observability"]
+
+
+def _time_ms(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def load_or_generate(size: int, seed: int, vocab: int, cache_dir: pathlib.Path | None):
+    """Return (sessions, stats) using a cached binary catalog when available."""
+    stats: Dict[str, Any] = {}
+    path = cache_dir / f"catalog_{size}_{seed}_{vocab}.ekc" if cache_dir else None
+    data = path.read_bytes() if path and path.exists() else b""
+    if data[:4] != MAGIC:  # missing, or written by an older format version
+        t0 = time.perf_counter()
+        sessions = generate_catalog(size, seed=seed, vocab_size=vocab)
+        stats["generate_ms"] = (time.perf_counter() - t0) * 1000
+        data = encode_binary(sessions)
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+    t0 = time.perf_counter()
+    sessions = decode_binary(data)
+    stats["binary_load_ms"] = (time.perf_counter() - t0) * 1000
+    stats["binary_bytes"] = len(data)
+    raw_json = json.dumps(sessions)
+    t0 = time.perf_counter()
+    json.loads(raw_json)
+    stats["json_load_ms"] = (time.perf_counter() - t0) * 1000
+    stats["json_bytes"] = len(raw_json)
+    return sessions, stats
+
+
+def bench_size(
+    size: int, seed: int, vocab: int, repeat: int, cache_dir: pathlib.Path | None
+) -> Dict[str, Any]:
+    sessions, stats = load_or_generate(size, seed, vocab, cache_dir)
+    manifest = {
+        "sessions": sessions,
+        "weights": agent.load_manifest()["weights"],
+        "recommend": {"max_sessions_default": 3},
+        "features": {},
+    }
+    # Explain the last session so the title lookup scans the full catalog
+    title = sessions[-1]["title"]
+    rec = agent.recommend(manifest, INTERESTS, 3)
+    return {
+        "sessions": size,
+        **stats,
+        "recommend_ms": _time_ms(lambda: agent.recommend(manifest, INTERESTS, 3), repeat),
+        "explain_ms": _time_ms(lambda: agent.explain(manifest, title, INTERESTS), repeat),
+        "export_ms": _time_ms(
+            lambda: agent._build_itinerary_markdown(
+                INTERESTS, agent.recommend(manifest, INTERESTS, 3)
+            ),
+            repeat,
+        ),
+        "conflicts_ms": _time_ms(lambda: agent._count_conflicts(sessions), repeat),
+        "top_conflicts": rec["conflicts"],
+    }
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description="eventkit scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vocab", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cache-dir", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+    results: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        results.append(bench_size(size, args.seed, args.vocab, args.repeat, args.cache_dir))
+        print(json.dumps(results[-1]), file=sys.stderr)
+    print(json.dumps({"seed": args.seed, "vocab": args.vocab, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,33 @@
 #!/usr/bin/env python3
-"""Export itinerary via eventkit agent CLI wrapper.
+"""Export itinerary via the eventkit agent library (in-process, no subprocess).
 Usage:
   python scripts/export_itinerary.py "agents, ai safety" [output.md]
 """
 
-import subprocess, sys
+import json, pathlib, sys, time
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+import agent  # type: ignore
 
 
 def main():  # pragma: no cover
     if len(sys.argv) < 2:
         print("Usage: export_itinerary.py 'interest1, interest2' [filename]")
         sys.exit(1)
-    interests = sys.argv[1]
+    start_ts = time.time()
+    manifest = agent.load_manifest()
+    telemetry = agent.get_telemetry(manifest)
+    interests = agent._normalize_interests(sys.argv[1])
     fname = sys.argv[2] if len(sys.argv) > 2 else None
-    cmd = [sys.executable, "agent.py", "export", "--interests", interests]
-    if fname:
-        cmd += ["--output", fname]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    print(result.stdout)
-    if result.returncode != 0:
-        print(result.stderr, file=sys.stderr)
-        sys.exit(result.returncode)
+    if not interests:
+        print(json.dumps({"error": "no interests provided"}))
+        sys.exit(1)
+    payload, rec = agent.export_itinerary(manifest, interests, fname)
+    print(json.dumps(payload, indent=2))
+    if telemetry:
+        telemetry.log("export", {"sessions": rec["sessions"]}, start_ts, success=True)
 
 
 if __name__ == "__main__":
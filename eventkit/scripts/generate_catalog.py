@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Generate large synthetic session catalogs for eventkit benchmarks.
+Sessions follow the generate_sessions_template.py shape plus a `date` field:
+Zipfian tag popularity, overlapping multi-track schedules across several days
+and a configurable tag vocabulary. Output is deterministic for a given seed.
+Usage:
+  python scripts/generate_catalog.py --count 10000 --json catalog.json --binary catalog.ekc
+  python scripts/generate_catalog.py --count 1000000 --vocab 2000 --days 4 --binary big.ekc
+"""
+
+import argparse, datetime, json, pathlib, random, struct, sys
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, List
+
+SEED_TAGS = [
+    "agents",
+    "ai safety",
+    "gen ai",
+    "edge",
+    "observability",
+    "governance",
+    "responsible ai",
+    "privacy",
+    "telemetry",
+    "data platforms",
+]
+TITLE_FORMATS = [
+    "{tag} Deep Dive",
+    "Scaling {tag}",
+    "{tag} in Production",
+    "Intro to {tag}",
+    "{tag} Panel",
+    "Hands-on {tag} Lab",
+]
+DURATIONS = (30, 40, 45, 60)
+DAY_START, DAY_END = 9 * 60, 18 * 60
+MAGIC = b"EKC2"
+
+
+def build_vocabulary(size: int) -> List[str]:
+    tags = SEED_TAGS[:size]
+    tags += [f"topic {i}" for i in range(len(tags), size)]
+    return tags
+
+
+def zipf_cum_weights(n: int, exponent: float) -> List[float]:
+    return list(accumulate(1.0 / (rank**exponent) for rank in range(1, n + 1)))
+
+
+def _hhmm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def generate_catalog(
+    count: int,
+    seed: int = 0,
+    vocab_size: int = 200,
+    zipf_exponent: float = 1.1,
+    days: int = 3,
+    start_date: str = "2025-11-18",
+    max_tags: int = 4,
+) -> List[Dict[str, Any]]:
+    """Return `count` sessions laid out on parallel tracks (rooms) over `days` days."""
+    rng = random.Random(seed)
+    vocab = build_vocabulary(vocab_size)
+    cum = zipf_cum_weights(len(vocab), zipf_exponent)
+    first_day = datetime.date.fromisoformat(start_date)
+    dates = [(first_day + datetime.timedelta(days=d)).isoformat() for d in range(days)]
+    sessions: List[Dict[str, Any]] = []
+    track = 0
+    while len(sessions) < count:
+        track += 1
+        location = f"Room {track}"
+        for date in dates:
+            # Random offsets stagger tracks so sessions overlap across rooms
+            cursor = DAY_START + rng.randrange(0, 40, 5)
+            while len(sessions) < count:
+                end = cursor + rng.choice(DURATIONS)
+                if end > DAY_END:
+                    break
+                k = rng.randint(1, max_tags)
+                tags = list(dict.fromkeys(rng.choices(vocab, cum_weights=cum, k=k)))
+                title = rng.choice(TITLE_FORMATS).format(tag=tags[0].title())
+                sessions.append(
+                    {
+                        "id": f"g{len(sessions) + 1}",
+                        "title": f"{title} #{len(sessions) + 1}",
+                        "start": _hhmm(cursor),
+                        "end": _hhmm(end),
+                        "location": location,
+                        "tags": tags,
+                        "popularity": round(rng.random() ** 2, 2),
+                        "date": date,
+                    }
+                )
+                cursor = end + rng.randrange(0, 25, 5)
+            if len(sessions) >= count:
+                break
+    return sessions
+
+
+# --- Compact binary form -------------------------------------------------------
+# Columnar layout (little-endian): MAGIC, u32 session count, then five string
+# blobs (tag table, location table, date table, ids, titles), each a u32 byte
+# length followed by NUL-joined UTF-8, then fixed-width columns of length count:
+#   u16 date idx, u16 start minute, u16 end minute, u32 location idx,
+#   f64 popularity, u8 tag count, and finally the flattened u32 tag indices.
+# Columns decode with array.frombytes, so loading avoids per-record parsing.
+# Popularity is stored as a full double so decode(encode(x)) == x exactly.
+
+_COLUMNS = (
+    ("H", "date"),
+    ("H", "start"),
+    ("H", "end"),
+    ("I", "loc"),
+    ("d", "pop"),
+    ("B", "ntags"),
+)
+
+
+def _pack_blob(values: List[str]) -> bytes:
+    raw = "\0".join(values).encode("utf-8")
+    return struct.pack("<I", len(raw)) + raw
+
+
+def _unpack_blob(buf: bytes, pos: int):
+    (ln,) = struct.unpack_from("<I", buf, pos)
+    pos += 4
+    text = buf[pos : pos + ln].decode("utf-8")
+    return (text.split("\0") if ln else []), pos + ln
+
+
+def _column_bytes(typecode: str, values) -> bytes:
+    arr = array(typecode, values)
+    if sys.byteorder == "big":  # pragma: no cover
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _read_column(typecode: str, buf: bytes, pos: int, n: int):
+    arr = array(typecode)
+    end = pos + arr.itemsize * n
+    arr.frombytes(buf[pos:end])
+    if sys.byteorder == "big":  # pragma: no cover
+        arr.byteswap()
+    return arr, end
+
+
+def _minutes(hhmm: str) -> int:
+    h, m = hhmm.split(":")
+    return int(h) * 60 + int(m)
+
+
+def encode_binary(sessions: List[Dict[str, Any]]) -> bytes:
+    tables: Dict[str, Dict[str, int]] = {"tag": {}, "loc": {}, "date": {}}
+    for s in sessions:
+        for t in s.get("tags", []):
+            tables["tag"].setdefault(t, len(tables["tag"]))
+        tables["loc"].setdefault(s.get("location", ""), len(tables["loc"]))
+        tables["date"].setdefault(s.get("date", ""), len(tables["date"]))
+    columns = {
+        "date": [tables["date"][s.get("date", "")] for s in sessions],
+        "start": [_minutes(s["start"]) for s in sessions],
+        "end": [_minutes(s["end"]) for s in sessions],
+        "loc": [tables["loc"][s.get("location", "")] for s in sessions],
+        "pop": [float(s.get("popularity", 0)) for s in sessions],
+        "ntags": [len(s.get("tags", [])) for s in sessions],
+    }
+    tag_ids = [tables["tag"][t] for s in sessions for t in s.get("tags", [])]
+    parts = [MAGIC, struct.pack("<I", len(sessions))]
+    parts += [_pack_blob(list(tables[k])) for k in ("tag", "loc", "date")]
+    parts.append(_pack_blob([s["id"] for s in sessions]))
+    parts.append(_pack_blob([s["title"] for s in sessions]))
+    parts += [_column_bytes(code, columns[name]) for code, name in _COLUMNS]
+    parts.append(_column_bytes("I", tag_ids))
+    return b"".join(parts)
+
+
+def decode_binary(data: bytes) -> List[Dict[str, Any]]:
+    if data[:4] != MAGIC:
+        raise ValueError("not an eventkit binary catalog")
+    (count,) = struct.unpack_from("<I", data, 4)
+    pos = 8
+    blobs = []
+    for _ in range(5):
+        values, pos = _unpack_blob(data, pos)
+        blobs.append(values)
+    tags, locations, dates, ids, titles = blobs
+    cols = {}
+    for code, name in _COLUMNS:
+        cols[name], pos = _read_column(code, data, pos, count)
+    tag_ids, _ = _read_column("I", data, pos, sum(cols["ntags"]))
+    hhmm = [_hhmm(m) for m in range(24 * 60)]
+    sessions = []
+    offset = 0
+    for i in range(count):
+        n = cols["ntags"][i]
+        session = {
+            "id": ids[i],
+            "title": titles[i],
+            "start": hhmm[cols["start"][i]],
+            "end": hhmm[cols["end"][i]],
+            "location": locations[cols["loc"][i]],
+            "tags": [tags[t] for t in tag_ids[offset : offset + n]],
+            "popularity": cols["pop"][i],
+        }
+        offset += n
+        date = dates[cols["date"][i]]
+        if date:
+            session["date"] = date
+        sessions.append(session)
+    return sessions
+
+
+def load_catalog(path: pathlib.Path) -> List[Dict[str, Any]]:
+    """Load a catalog written as JSON or in the compact binary form."""
+    data = path.read_bytes()
+    if data[:4] == MAGIC:
+        return decode_binary(data)
+    return json.loads(data)
+
+
+def main():  # pragma: no cover
+    p = argparse.ArgumentParser(description="Generate a synthetic session catalog")
+    p.add_argument("--count", type=int, default=1000)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--vocab", type=int, default=200, help="Tag vocabulary size")
+    p.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent for tags")
+    p.add_argument("--days", type=int, default=3)
+    p.add_argument("--start-date", default="2025-11-18")
+    p.add_argument("--json", type=str, default=None, help="Write JSON to this path")
+    p.add_argument("--binary", type=str, default=None, help="Write binary to this path")
+    args = p.parse_args()
+    sessions = generate_catalog(
+        args.count, args.seed, args.vocab, args.zipf, args.days, args.start_date
+    )
+    if args.binary:
+        pathlib.Path(args.binary).write_bytes(encode_binary(sessions))
+    if args.json:
+        pathlib.Path(args.json).write_text(json.dumps(sessions))
+    if not args.json and not args.binary:
+        print(json.dumps(sessions, indent=2))
+
+
+if __name__ == "__main__":
+    main()
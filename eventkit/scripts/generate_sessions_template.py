@@ -2,9 +2,12 @@
 """Generate a sessions_external.json template to stdout for eventkit.
 Usage:
   python scripts/generate_sessions_template.py > sessions_external.json
+  python scripts/generate_sessions_template.py --count 500 --seed 7 > sessions_external.json
+For large benchmark catalogs (binary output, vocabulary/day options) use
+scripts/generate_catalog.py directly.
 """
 
-import json
+import argparse, json
 
 TEMPLATE = [
     {
@@ -19,4 +22,13 @@ TEMPLATE = [
 ]
 
 if __name__ == "__main__":  # pragma: no cover
-    print(json.dumps(TEMPLATE, indent=2))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=None, help="Generate N sessions")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.count:
+        from generate_catalog import generate_catalog  # type: ignore
+
+        print(json.dumps(generate_catalog(args.count, seed=args.seed), indent=2))
+    else:
+        print(json.dumps(TEMPLATE, indent=2))
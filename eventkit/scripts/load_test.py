@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Asyncio load generator for eventkit serve and the SDK /api/messages host.
+Replays recorded traffic (request logs or telemetry.jsonl) or synthetic interest
+profiles and reports RPS, latency percentiles and error rates as JSON.
+Usage:
+  python scripts/load_test.py --spawn --synthetic 500 --concurrency 4 --check
+  python scripts/load_test.py --url http://127.0.0.1:8010 --replay telemetry.jsonl
+  python scripts/load_test.py --target messages --url http://127.0.0.1:3978 --synthetic 1000
+
+Replay files hold one JSON object per line, either request records
+  {"action": "recommend", "interests": ["agents"], "top": 3}
+  {"action": "explain", "session": "Edge Intelligence Demos", "interests": ["edge"]}
+  {"path": "/recommend?interests=agents"}
+or eventkit telemetry lines (interests are recovered from recorded session tags).
+"""
+
+import argparse, asyncio, json, math, pathlib, random, socket, statistics, subprocess, sys, time
+import urllib.parse
+from typing import Any, Dict, List, Optional
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+import agent  # type: ignore
+
+# Median latency targets (ms) from docs/performance-guide.md
+TARGETS_MS = {"recommend": 25.0, "explain": 15.0, "export": 40.0}
+
+
+def _percentile(ordered: List[float], pct: float) -> Optional[float]:
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def synthetic_requests(
+    manifest: Dict[str, Any], count: int, seed: int = 0, explain_ratio: float = 0.2
+) -> List[Dict[str, Any]]:
+    """Sample interest profiles weighted by tag frequency in the catalog."""
+    rng = random.Random(seed)
+    sessions = agent.get_sessions(manifest)
+    freq: Dict[str, int] = {}
+    for s in sessions:
+        for t in s.get("tags", []):
+            freq[t.lower()] = freq.get(t.lower(), 0) + 1
+    tags = sorted(freq, key=lambda t: -freq[t])
+    weights = [freq[t] for t in tags]
+    titles = [s["title"] for s in sessions]
+    out = []
+    for _ in range(count):
+        k = min(len(tags), rng.randint(1, 3))
+        interests = sorted(set(rng.choices(tags, weights=weights, k=k)))
+        if titles and rng.random() < explain_ratio:
+            out.append(
+                {"action": "explain", "session": rng.choice(titles), "interests": interests}
+            )
+        else:
+            out.append({"action": "recommend", "interests": interests})
+    return out
+
+
+def _from_telemetry(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    payload = entry.get("payload") or {}
+    action = entry.get("action")
+    tags = sorted(
+        {t.lower() for s in payload.get("sessions", []) for t in s.get("tags", [])}
+    )
+    if action in ("recommend", "export") and tags:
+        return {"action": "recommend", "interests": tags[:3]}
+    if action == "explain" and payload.get("title"):
+        return {"action": "explain", "session": payload["title"], "interests": tags}
+    return None
+
+
+def load_replay(path: pathlib.Path) -> List[Dict[str, Any]]:
+    out = []
+    for raw in path.read_text().splitlines():
+        try:
+            entry = json.loads(raw)
+        except Exception:
+            continue
+        if not isinstance(entry, dict):
+            continue
+        if "path" in entry or "interests" in entry or "session" in entry:
+            out.append(entry)
+        else:
+            req = _from_telemetry(entry)
+            if req:
+                out.append(req)
+    return out
+
+
+def to_http(req: Dict[str, Any], target: str) -> Dict[str, Any]:
+    """Map a request record to (method, path, body) for the chosen target."""
+    action = req.get("action", "recommend")
+    interests = req.get("interests", [])
+    if isinstance(interests, str):
+        interests = agent._normalize_interests(interests)
+    if target == "messages":
+        if action == "explain":
+            text = f"explain:{req.get('session', '')}:{', '.join(interests)}"
+        else:
+            text = f"recommend:{', '.join(interests)}"
+        body = json.dumps({"text": text}).encode()
+        return {"action": action, "method": "POST", "path": "/api/messages", "body": body}
+    if "path" in req:
+        action = urllib.parse.urlparse(req["path"]).path.strip("/") or action
+        return {"action": action, "method": "GET", "path": req["path"], "body": b""}
+    qs = {"interests": ",".join(interests)}
+    if action == "explain":
+        qs["session"] = req.get("session", "")
+    if req.get("top"):
+        qs["top"] = str(req["top"])
+    path = f"/{action}?{urllib.parse.urlencode(qs)}"
+    return {"action": action, "method": "GET", "path": path, "body": b""}
+
+
+async def _send(host: str, port: int, call: Dict[str, Any]) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        head = (
+            f"{call['method']} {call['path']} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(call['body'])}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode() + call["body"])
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()  # drain body until the server closes
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def run_load(
+    url: str, calls: List[Dict[str, Any]], concurrency: int
+) -> Dict[str, Any]:
+    parsed = urllib.parse.urlparse(url)
+    host, port = parsed.hostname or "127.0.0.1", parsed.port or 80
+    per_action: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    pending = iter(calls)
+
+    async def worker() -> None:
+        for call in pending:
+            t0 = time.perf_counter()
+            try:
+                status = await _send(host, port, call)
+                ok = 200 <= status < 300
+            except (OSError, ValueError, IndexError):
+                ok = False
+            per_action.setdefault(call["action"], []).append(
+                (time.perf_counter() - t0) * 1000
+            )
+            if not ok:
+                errors[call["action"]] = errors.get(call["action"], 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - started
+    return summarize(per_action, errors, elapsed, concurrency)
+
+
+def _latency_stats(values: List[float]) -> Dict[str, Any]:
+    ordered = sorted(values)
+    return {
+        "p50": statistics.median(ordered) if ordered else None,
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "max": ordered[-1] if ordered else None,
+    }
+
+
+def summarize(
+    per_action: Dict[str, List[float]],
+    errors: Dict[str, int],
+    elapsed: float,
+    concurrency: int,
+) -> Dict[str, Any]:
+    all_lat = [v for vals in per_action.values() for v in vals]
+    total = len(all_lat)
+    n_err = sum(errors.values())
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "rps": total / elapsed if elapsed else None,
+        "errors": n_err,
+        "error_rate": n_err / total if total else 0.0,
+        "latency_ms": _latency_stats(all_lat),
+        "actions": {
+            a: {
+                "count": len(vals),
+                "errors": errors.get(a, 0),
+                "latency_ms": _latency_stats(vals),
+            }
+            for a, vals in per_action.items()
+        },
+    }
+
+
+def check_targets(
+    report: Dict[str, Any], targets: Dict[str, float] = TARGETS_MS, max_error_rate: float = 0.0
+) -> List[str]:
+    """Return human-readable violations of the documented latency targets."""
+    violations = []
+    if report["error_rate"] > max_error_rate:
+        violations.append(f"error_rate {report['error_rate']:.3f} > {max_error_rate}")
+    for action, stats in report["actions"].items():
+        target = targets.get(action)
+        p50 = stats["latency_ms"]["p50"]
+        if target is not None and p50 is not None and p50 > target:
+            violations.append(f"{action} median {p50:.2f} ms > target {target} ms")
+    return violations
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_serve(port: int, cwd: Optional[pathlib.Path] = None, timeout: float = 5.0):
+    """Start `agent.py serve` on port and wait until it accepts connections."""
+    proc = subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / "agent.py"), "serve", "--port", str(port)],
+        cwd=str(cwd) if cwd else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return proc
+        time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError(f"agent.py serve did not start on port {port}")
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description="eventkit load generator")
+    parser.add_argument("--target", choices=["serve", "messages"], default="serve")
+    parser.add_argument("--url", default=None, help="Base URL of a running server")
+    parser.add_argument("--spawn", action="store_true", help="Spawn agent.py serve")
+    parser.add_argument("--replay", type=str, default=None, help="requests/telemetry jsonl")
+    parser.add_argument("--synthetic", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--check", action="store_true", help="Exit 1 if targets regress")
+    args = parser.parse_args()
+
+    if args.replay:
+        records = load_replay(pathlib.Path(args.replay))
+    else:
+        records = synthetic_requests(agent.load_manifest(), args.synthetic, args.seed)
+    calls = [to_http(r, args.target) for r in records]
+
+    proc = None
+    url = args.url
+    if args.spawn:
+        port = _free_port()
+        proc = spawn_serve(port)
+        url = f"http://127.0.0.1:{port}"
+    if not url:
+        url = "http://127.0.0.1:3978" if args.target == "messages" else "http://127.0.0.1:8010"
+    try:
+        report = asyncio.run(run_load(url, calls, args.concurrency))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=3)
+    report["target"] = args.target
+    # Documented latency targets apply to eventkit serve; the SDK host only checks errors
+    violations = check_targets(report, TARGETS_MS if args.target == "serve" else {})
+    report["violations"] = violations
+    print(json.dumps(report, indent=2))
+    if args.check and violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
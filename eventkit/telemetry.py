@@ -1,7 +1,50 @@
-import json, time, pathlib
+import json, time, pathlib, threading
+from contextlib import contextmanager, nullcontext
 from typing import Any, Dict
 
 
+# StageTimer/_NullTimer/NULL_TIMER are kept identical to the copy in
+# innovation-kit-repository/event-agent/starter-code/event_agent/telemetry.py
+# (the two kits ship separately); tests/test_telemetry.py checks both.
+class StageTimer:
+    """Accumulates per-stage wall time (ms) for one request."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - t0) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+
+class _NullTimer:
+    """Disabled timer: stage() hands back one shared no-op context manager."""
+
+    stages: Dict[str, float] = {}
+    _ctx = nullcontext()
+
+    def stage(self, name: str):
+        return self._ctx
+
+
+NULL_TIMER = _NullTimer()
+
+
+def stage_timings_enabled(manifest) -> bool:
+    return bool(
+        manifest.get("features", {}).get("telemetry", {}).get("stage_timings", False)
+    )
+
+
+def new_timer(manifest):
+    return StageTimer() if stage_timings_enabled(manifest) else NULL_TIMER
+
+
 class Telemetry:
     def __init__(self, file: str):
         self.path = pathlib.Path(file)
@@ -13,6 +56,7 @@ class Telemetry:
         start_ts: float,
         success: bool,
         error: str | None = None,
+        stages: Dict[str, float] | None = None,
     ):
         entry = {
             "ts": time.time(),
@@ -24,6 +68,8 @@ class Telemetry:
                 k: v for k, v in payload.items() if k in {"sessions", "title", "score"}
             },
         }
+        if stages:
+            entry["stages_ms"] = stages
         try:
             with self.path.open("a") as f:
                 f.write(json.dumps(entry) + "\n")
@@ -31,6 +77,61 @@ class Telemetry:
             pass
 
 
+class Metrics:
+    """In-process request/stage aggregates rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[tuple, int] = {}
+        self._latency: Dict[str, list] = {}
+        self._stages: Dict[tuple, list] = {}
+
+    def observe(
+        self,
+        action: str,
+        latency_ms: float,
+        success: bool,
+        stages: Dict[str, float] | None = None,
+    ) -> None:
+        with self._lock:
+            key = (action, "true" if success else "false")
+            self._requests[key] = self._requests.get(key, 0) + 1
+            agg = self._latency.setdefault(action, [0, 0.0])
+            agg[0] += 1
+            agg[1] += latency_ms / 1000
+            for name, ms in (stages or {}).items():
+                s = self._stages.setdefault((action, name), [0, 0.0])
+                s[0] += 1
+                s[1] += ms / 1000
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# HELP eventkit_requests_total Requests handled by action and outcome.",
+                "# TYPE eventkit_requests_total counter",
+            ]
+            for (action, ok), n in sorted(self._requests.items()):
+                lines.append(
+                    f'eventkit_requests_total{{action="{action}",success="{ok}"}} {n}'
+                )
+            lines += [
+                "# HELP eventkit_request_seconds Request latency by action.",
+                "# TYPE eventkit_request_seconds summary",
+            ]
+            for action, (n, total) in sorted(self._latency.items()):
+                lines.append(f'eventkit_request_seconds_sum{{action="{action}"}} {total:.6f}')
+                lines.append(f'eventkit_request_seconds_count{{action="{action}"}} {n}')
+            lines += [
+                "# HELP eventkit_stage_seconds Time spent per request stage.",
+                "# TYPE eventkit_stage_seconds summary",
+            ]
+            for (action, name), (n, total) in sorted(self._stages.items()):
+                labels = f'action="{action}",stage="{name}"'
+                lines.append(f"eventkit_stage_seconds_sum{{{labels}}} {total:.6f}")
+                lines.append(f"eventkit_stage_seconds_count{{{labels}}} {n}")
+        return "\n".join(lines) + "\n"
+
+
 def get_telemetry(manifest):  # pragma: no cover
     feat = manifest.get("features", {}).get("telemetry", {})
     if not feat.get("enabled"):
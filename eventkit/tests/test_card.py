@@ -0,0 +1,35 @@
+import json, sys, pathlib
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+import agent  # type: ignore
+
+
+def test_adaptive_card_cached_per_session_ids():
+    sessions = agent.load_manifest()["sessions"][:2]
+    first = agent._build_adaptive_card(sessions)
+    second = agent._build_adaptive_card([dict(s) for s in sessions])
+    assert first is second
+    assert first["version"] == agent.CARD_VERSION
+    assert [a["title"] for a in first["actions"]] == ["Explain #1", "Explain #2"]
+    other = agent._build_adaptive_card(sessions[::-1])
+    assert other is not first
+
+
+def test_adaptive_card_rebuilt_when_session_content_changes():
+    sessions = agent.load_manifest()["sessions"][:2]
+    first = agent._build_adaptive_card(sessions)
+    moved = [dict(s) for s in sessions]
+    moved[0]["location"] = "Room 404"
+    card = agent._build_adaptive_card(moved)
+    assert card is not first
+    assert card["body"][1]["items"][1]["text"].endswith("@ Room 404")
+    assert agent._build_adaptive_card(sessions) is first
+
+
+def test_compact_encoding_round_trips():
+    payload = {"sessions": [{"title": "A"}], "conflicts": 0}
+    body = agent._dumps_compact(payload)
+    assert b", " not in body and b": " not in body
+    assert json.loads(body) == payload
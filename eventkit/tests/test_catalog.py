@@ -0,0 +1,55 @@
+import random, sys, pathlib
+from collections import Counter
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+for p in (ROOT, ROOT / "scripts"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+import agent  # type: ignore
+import generate_catalog  # type: ignore
+
+
+def test_catalog_deterministic_and_binary_round_trip():
+    sessions = generate_catalog.generate_catalog(2000, seed=11, vocab_size=50, days=2)
+    assert len(sessions) == 2000
+    assert sessions == generate_catalog.generate_catalog(
+        2000, seed=11, vocab_size=50, days=2
+    )
+    blob = generate_catalog.encode_binary(sessions)
+    assert generate_catalog.decode_binary(blob) == sessions
+
+
+def test_binary_catalog_round_trips_popularity_exactly():
+    rng = random.Random(3)
+    sessions = generate_catalog.generate_catalog(300, seed=3, vocab_size=20, days=1)
+    for s in sessions:
+        s["popularity"] = rng.random()
+    sessions[0]["popularity"] = 1 / 3
+    sessions[1]["popularity"] = 0.0
+    sessions[2]["popularity"] = 1.0
+    decoded = generate_catalog.decode_binary(generate_catalog.encode_binary(sessions))
+    assert [s["popularity"] for s in decoded] == [s["popularity"] for s in sessions]
+    assert decoded == sessions
+
+
+def test_catalog_shape_zipf_tags_and_overlapping_tracks():
+    sessions = generate_catalog.generate_catalog(3000, seed=5, vocab_size=100, days=3)
+    tag_counts = Counter(t for s in sessions for t in s["tags"])
+    ranked = [t for t, _ in tag_counts.most_common()]
+    assert ranked[0] == "agents"
+    assert tag_counts["agents"] > 5 * tag_counts.get("topic 60", 1)
+    assert len({s["date"] for s in sessions}) == 3
+    assert len({s["location"] for s in sessions}) > 1
+    first_day = [s for s in sessions if s["date"] == "2025-11-18"]
+    starts = {}
+    for s in first_day:
+        starts.setdefault(s["start"], set()).add(s["location"])
+    assert any(len(rooms) > 1 for rooms in starts.values())
+
+
+def test_conflicts_respect_session_date():
+    same_slot = {"start": "09:00", "end": "09:30"}
+    day1 = dict(same_slot, date="2025-11-18")
+    day2 = dict(same_slot, date="2025-11-19")
+    assert agent._count_conflicts([day1, day2]) == 0
+    assert agent._count_conflicts([day1, dict(day1)]) == 1
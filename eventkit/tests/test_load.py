@@ -0,0 +1,54 @@
+import asyncio, sys, pathlib
+
+import pytest
+
+SCRIPTS = pathlib.Path(__file__).resolve().parents[1] / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+import load_test  # type: ignore
+
+
+def _run_serve_load(tmp_path, count):
+    manifest = load_test.agent.load_manifest()
+    records = load_test.synthetic_requests(manifest, count, seed=1)
+    calls = [load_test.to_http(r, "serve") for r in records]
+    port = load_test._free_port()
+    proc = load_test.spawn_serve(port, cwd=tmp_path)
+    try:
+        report = asyncio.run(load_test.run_load(f"http://127.0.0.1:{port}", calls, 2))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=3)
+    assert report["requests"] == len(calls)
+    assert set(report["actions"]) == {"recommend", "explain"}
+    return report
+
+
+def test_serve_load_report(tmp_path):
+    report = _run_serve_load(tmp_path, 40)
+    assert report["errors"] == 0
+    assert sum(a["count"] for a in report["actions"].values()) == 40
+
+
+@pytest.mark.perf
+def test_serve_meets_documented_latency_targets(tmp_path):
+    report = _run_serve_load(tmp_path, 200)
+    assert load_test.check_targets(report) == []
+
+
+def test_replay_telemetry_lines(tmp_path):
+    log = tmp_path / "telemetry.jsonl"
+    log.write_text(
+        '{"action": "recommend", "payload": {"sessions": [{"tags": ["Agents", "edge"]}]}}\n'
+        '{"action": "explain", "payload": {"title": "Edge Intelligence Demos"}}\n'
+        '{"action": "health", "payload": {}}\n'
+        '{"action": "recommend", "interests": ["ai safety"], "top": 2}\n'
+    )
+    records = load_test.load_replay(log)
+    assert records[0] == {"action": "recommend", "interests": ["agents", "edge"]}
+    assert records[1]["session"] == "Edge Intelligence Demos"
+    assert len(records) == 3
+    call = load_test.to_http(records[2], "serve")
+    assert call["path"] == "/recommend?interests=ai+safety&top=2"
+    msg = load_test.to_http(records[1], "messages")
+    assert msg["method"] == "POST" and b"explain:Edge Intelligence Demos:" in msg["body"]
@@ -0,0 +1,87 @@
+import json, marshal, pstats, subprocess, sys, pathlib, time, socket
+import urllib.error, urllib.request
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+for p in (ROOT, ROOT / "scripts"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+import agent  # type: ignore
+from load_test import _free_port  # type: ignore
+from profiler import MAX_SECONDS, SamplingProfiler  # type: ignore
+
+AGENT = ROOT / "agent.py"
+
+
+def _busy(seconds):
+    manifest = agent.load_manifest()
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        agent.recommend(manifest, ["agents", "ai safety"], 3)
+
+
+def test_sampling_profiler_writes_collapsed_and_pstats(tmp_path):
+    prof = SamplingProfiler(str(tmp_path), interval_ms=1.0)
+    assert prof.start(0.3)
+    assert not prof.start(0.3), "second window must be rejected while running"
+    _busy(0.4)
+    result = prof.wait(timeout=5)
+    assert result["samples"] > 0
+    collapsed = pathlib.Path(result["collapsed"]).read_text()
+    assert "recommend (agent.py:" in collapsed
+    stack, count = collapsed.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+    stats = pstats.Stats(result["pstats"])
+    assert any(name == "recommend" for _, _, name in stats.stats)
+    with open(result["pstats"], "rb") as f:
+        assert isinstance(marshal.load(f), dict)
+
+
+def test_admin_profile_endpoint(tmp_path):
+    port = _free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(AGENT),
+            "serve",
+            "--port",
+            str(port),
+            "--admin",
+            "--profile-dir",
+            str(tmp_path),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(50):
+            with socket.socket() as s:
+                if s.connect_ex(("127.0.0.1", port)) == 0:
+                    break
+            time.sleep(0.1)
+        for bad in ("abc", "0", "-1", "nan"):
+            with pytest.raises(urllib.error.HTTPError) as exc:
+                urllib.request.urlopen(f"{base}/admin/profile?seconds={bad}")
+            assert exc.value.code == 400
+        with urllib.request.urlopen(f"{base}/admin/profile?seconds=0.5") as r:
+            assert r.status == 202
+            assert json.loads(r.read())["seconds"] == 0.5
+        deadline = time.time() + 0.5
+        while time.time() < deadline:
+            urllib.request.urlopen(f"{base}/recommend?interests=agents").read()
+        status = {"running": True}
+        for _ in range(50):
+            with urllib.request.urlopen(f"{base}/admin/profile") as r:
+                status = json.loads(r.read())
+            if not status["running"] and status["last"]:
+                break
+            time.sleep(0.1)
+        assert pathlib.Path(status["last"]["collapsed"]).exists()
+        assert pathlib.Path(status["last"]["pstats"]).exists()
+        with urllib.request.urlopen(f"{base}/admin/profile?seconds=1e6") as r:
+            assert json.loads(r.read())["seconds"] == MAX_SECONDS
+    finally:
+        proc.terminate()
+        proc.wait(timeout=3)
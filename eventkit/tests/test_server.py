@@ -1,4 +1,4 @@
-import subprocess, sys, time, urllib.request, json, pathlib, socket
+import subprocess, sys, time, urllib.error, urllib.request, json, pathlib, socket
 
 AGENT = pathlib.Path(__file__).resolve().parents[1] / "agent.py"
 PORT = 8093  # avoid collision with any existing server
@@ -36,6 +36,45 @@ def test_server_recommend_and_explain():
             exp = json.loads(r.read().decode())
         assert exp["title"] == "Generative Agents in Production"
         assert exp["score"] > 0
+        with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/metrics") as r:
+            assert r.headers["Content-Type"].startswith("text/plain")
+            metrics = r.read().decode()
+        assert 'eventkit_requests_total{action="recommend",success="true"} 1' in metrics
+        assert 'eventkit_request_seconds_count{action="explain"} 1' in metrics
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def test_server_runs_without_telemetry_module():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    # Hide the telemetry module, as when agent.py is copied without it
+    script = (
+        "import runpy, sys; sys.modules['telemetry'] = None; "
+        f"sys.argv = [{str(AGENT)!r}, 'serve', '--port', '{port}']; "
+        f"runpy.run_path({str(AGENT)!r}, run_name='__main__')"
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        assert wait_port(port), "server did not start"
+        with urllib.request.urlopen(
+            f"http://127.0.0.1:{port}/recommend?interests=agents&top=2"
+        ) as r:
+            assert len(json.loads(r.read())["sessions"]) == 2
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics")
+            raise AssertionError("/metrics should be unavailable")
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
     finally:
         proc.terminate()
         try:
@@ -0,0 +1,49 @@
+import json, os, subprocess, sys, pathlib
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+import agent  # type: ignore
+
+
+def test_import_skips_server_modules():
+    code = (
+        "import sys, agent; "
+        "print(sorted(m for m in ('http.server', 'urllib.parse', 'argparse', 'orjson')"
+        " if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    assert out.returncode == 0, out.stderr
+    assert "http.server" not in out.stdout and "argparse" not in out.stdout
+
+
+def test_json_snapshot_reused_and_invalidated(tmp_path):
+    src = tmp_path / "catalog.json"
+    src.write_text(json.dumps([{"title": "A"}]))
+    assert agent._load_json(src) == [{"title": "A"}]
+    snaps = list((tmp_path / "__pycache__").glob("catalog.json.*.snap"))
+    assert len(snaps) == 1
+    src.write_text(json.dumps([{"title": "B"}, {"title": "C"}]))
+    assert agent._load_json(src) == [{"title": "B"}, {"title": "C"}]
+    snaps[0].write_bytes(b"corrupt")
+    assert agent._load_json(src) == [{"title": "B"}, {"title": "C"}]
+
+
+def test_memoized_load_returns_same_object(tmp_path):
+    src = tmp_path / "sessions.json"
+    src.write_text(json.dumps([{"title": "A"}]))
+    first = agent._load_json(src, memo=True)
+    assert agent._load_json(src, memo=True) is first
+    os.utime(src, ns=(0, 0))
+    assert agent._load_json(src, memo=True) is not first
+
+
+def test_export_itinerary_in_process(tmp_path):
+    manifest = agent.load_manifest()
+    manifest["features"]["export"] = {"enabled": True, "output_dir": str(tmp_path)}
+    payload, rec = agent.export_itinerary(manifest, ["agents"], "out.md")
+    assert pathlib.Path(payload["saved"]) == tmp_path / "out.md"
+    assert payload["sessionCount"] == len(rec["sessions"])
+    assert "Event Itinerary" in (tmp_path / "out.md").read_text()
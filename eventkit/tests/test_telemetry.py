@@ -1,7 +1,28 @@
-import json, subprocess, sys, pathlib, time
+import importlib.util, inspect, json, subprocess, sys, pathlib, time
 
-AGENT = pathlib.Path(__file__).resolve().parents[1] / "agent.py"
-MANIFEST = pathlib.Path(__file__).resolve().parents[1] / "agent.json"
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+import agent  # type: ignore
+import telemetry  # type: ignore
+
+AGENT = ROOT / "agent.py"
+MANIFEST = ROOT / "agent.json"
+EVENT_AGENT_TELEMETRY = (
+    ROOT.parent
+    / "innovation-kit-repository/event-agent/starter-code/event_agent/telemetry.py"
+)
+
+
+def _event_agent_telemetry():
+    spec = importlib.util.spec_from_file_location(
+        "event_agent_telemetry", EVENT_AGENT_TELEMETRY
+    )
+    module = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
 def telemetry_file():
@@ -34,3 +55,48 @@ def test_telemetry_line_written():
     rec = json.loads(lines[-1])
     assert rec.get("action") == "recommend"
     assert rec.get("success") is True
+
+
+def test_stage_timer_breakdown_and_metrics():
+    manifest = agent.load_manifest()
+    manifest["features"]["telemetry"]["stage_timings"] = True
+    timer = telemetry.new_timer(manifest)
+    agent.recommend(manifest, ["agents"], 3, timer)
+    assert {"session_load", "scoring", "ranking", "conflicts"} <= set(timer.stages)
+    assert all(ms >= 0 for ms in timer.stages.values())
+
+    metrics = telemetry.Metrics()
+    metrics.observe("recommend", 2.0, True, timer.stages)
+    text = metrics.render()
+    assert 'eventkit_requests_total{action="recommend",success="true"} 1' in text
+    assert 'eventkit_stage_seconds_count{action="recommend",stage="scoring"} 1' in text
+
+
+def test_stage_timings_disabled_by_default():
+    manifest = agent.load_manifest()
+    timer = telemetry.new_timer(manifest)
+    assert timer is telemetry.NULL_TIMER
+    agent.recommend(manifest, ["agents"], 3, timer)
+    assert timer.stages == {}
+
+
+def test_stage_timer_copies_match_event_agent():
+    other = _event_agent_telemetry()
+    for name in ("StageTimer", "_NullTimer"):
+        assert inspect.getsource(getattr(telemetry, name)) == inspect.getsource(
+            getattr(other, name)
+        )
+
+
+@pytest.mark.parametrize("load", [lambda: telemetry, _event_agent_telemetry])
+def test_stage_timer_and_null_timer(load):
+    module = load()
+    timer = module.StageTimer()
+    with timer.stage("scoring"):
+        pass
+    with timer.stage("scoring"):
+        pass
+    assert list(timer.stages) == ["scoring"] and timer.stages["scoring"] >= 0
+    with module.NULL_TIMER.stage("scoring"):
+        pass
+    assert module.NULL_TIMER.stages == {}
@@ -1,13 +1,25 @@
 """PyTorch Lightning module for Aurora model training."""
 
+import dataclasses
 from pathlib import Path
 import lightning as L
 import torch
 from aurora import Aurora
 
 from vibe_tune_aurora.data_processing.data_utils import load_normalization_stats, load_surface_stats
-from vibe_tune_aurora.losses import compute_mae_loss as compute_mae_loss_fn
-from vibe_tune_aurora.model_init import create_aurora_model
+from vibe_tune_aurora.delta_checkpoint import is_delta_checkpoint, verify_base_checkpoint
+from vibe_tune_aurora.losses import (
+    fused_mae_loss,
+    inverse_std_tensor,
+    stack_targets,
+    stacked_mae_loss,
+)
+from vibe_tune_aurora.model_init import (
+    build_aurora_architecture,
+    create_aurora_model,
+    surf_vars_from_state_dict,
+)
+from vibe_tune_aurora.trainable import configure_trainable, count_parameters
 
 from vibe_tune_aurora.config import DEFAULT_SURF_VARS, TrainingConfig
 
@@ -25,8 +37,12 @@ class LitAurora(L.LightningModule):
         learning_rate: float = 1e-4,
         lr_scheduler: str | None = None,
         max_epochs: int = 10,
-        num_training_samples: int = 100,
+        steps_per_epoch: int = 100,
         initializer_checkpoint_path: str | None = None,
+        trainable: str = "full",
+        val_target_cache_mb: float = 0,
+        model: Aurora | None = None,
+        num_training_samples: int | None = None,
     ):
         """
         Initialize Lightning module for Aurora training.
@@ -40,28 +56,121 @@ class LitAurora(L.LightningModule):
             learning_rate: Learning rate for optimizer
             lr_scheduler: Learning rate scheduler type (None or 'cosine_annealing')
             max_epochs: Maximum training epochs (used for scheduler)
-            num_training_samples: Number of training samples (used for scheduler)
+            steps_per_epoch: Optimizer steps per epoch on each process, i.e. batches per
+                process divided by accumulate_grad_batches (used for scheduler). Not the
+                number of training samples.
             initializer_checkpoint_path: Path to initializer checkpoint (if init_mode requires it)
+            trainable: Parameters to fine-tune: 'full', 'heads-only', 'heads+last-N-blocks' or
+                'lora' (see trainable.py); the rest are frozen and left out of the optimizer
+            val_target_cache_mb: Memory (on the model's device) for keeping validation target
+                tensors between validation checks, so they are not transferred and stacked
+                again (0 disables the cache). Only batches that carry their sample indices
+                (see data_utils.IndexedDataset) are cached.
+            model: Ready-made Aurora model to use instead of initializing one from init_mode
+                (see restore_from_checkpoint). Not stored in hparams.
+            num_training_samples: Former name of steps_per_epoch, accepted so hparams of older
+                checkpoints still load. Not stored in hparams.
         """
         super().__init__()
-        self.save_hyperparameters()
+        if num_training_samples is not None:
+            steps_per_epoch = num_training_samples
+        self.save_hyperparameters(ignore=["model", "num_training_samples"])
 
         # Create Aurora model internally
-        self.model = create_aurora_model(
-            init_mode=init_mode,
-            surf_vars=surf_vars,
-            surf_stats=surf_stats,
-            initializer_checkpoint_path=initializer_checkpoint_path,
-        )
+        if model is None:
+            model = create_aurora_model(
+                init_mode=init_mode,
+                surf_vars=surf_vars,
+                surf_stats=surf_stats,
+                initializer_checkpoint_path=initializer_checkpoint_path,
+            )
+        # Adds LoRA adapters for 'lora' before restored weights are loaded into them
+        configure_trainable(model, trainable)
+        self.model = model
 
         self.target_vars = target_vars
         self.norm_stats = norm_stats
+        # 1/std per target variable for the fused loss; derived from hparams, so not saved
+        self.register_buffer(
+            "inv_std", inverse_std_tensor(target_vars, norm_stats), persistent=False
+        )
         self.learning_rate = learning_rate
         self.lr_scheduler = lr_scheduler
         self.max_epochs = max_epochs
-        self.num_training_samples = num_training_samples
+        self.steps_per_epoch = steps_per_epoch
+        # Validation sample index -> stacked target tensors of that sample (see validation_losses)
+        self.val_target_cache_bytes = int(val_target_cache_mb * 2**20)
+        self._val_target_cache: dict = {}
+        self._val_target_cache_used = 0
 
         print(f"Target variables for MAE: {self.target_vars}")
+        n_trainable, n_total = count_parameters(self.model)
+        print(
+            f"Trainable parameters ({trainable}): {n_trainable:,} of {n_total:,} "
+            f"({100 * n_trainable / n_total:.2f}%)"
+        )
+
+    def on_save_checkpoint(self, checkpoint: dict) -> None:
+        """Record the model's effective architecture so restores need no initialization."""
+        checkpoint["aurora_architecture"] = {
+            "surf_vars": list(self.model.surf_vars),
+            "surf_stats": self.model.surf_stats,
+        }
+
+    @classmethod
+    def restore_from_checkpoint(
+        cls, checkpoint_path: str | Path, map_location: str | torch.device = "cpu"
+    ) -> "LitAurora":
+        """
+        Restore a LitAurora from a Lightning checkpoint, loading the weights only once.
+
+        Unlike load_from_checkpoint, this does not run the init_mode initialization first (which
+        downloads the pretrained Aurora weights, or loads the initializer checkpoint, only for
+        every weight to be overwritten). The bare architecture is built from the architecture
+        recorded in the checkpoint, or for older checkpoints from its state dict and hparams,
+        so restoring works offline.
+
+        Delta checkpoints (see delta_checkpoint.py) are also accepted: the frozen weights are
+        rebuilt from the base checkpoint they reference, and the stored weights loaded on top.
+
+        Args:
+            checkpoint_path: Path to Lightning or delta checkpoint file
+            map_location: Device to load the weights onto
+
+        Returns:
+            LitAurora with the checkpoint's hparams and weights
+
+        Raises:
+            ValueError: If a delta checkpoint's base checkpoint has changed, or the delta
+                holds weights the model does not have
+        """
+        checkpoint = torch.load(checkpoint_path, map_location=map_location, weights_only=False)
+        hparams = dict(checkpoint["hyper_parameters"])
+        state_dict = checkpoint["state_dict"]
+
+        if is_delta_checkpoint(checkpoint) and checkpoint["base"] is not None:
+            verify_base_checkpoint(checkpoint["base"])
+            # init_mode reloads the base weights; the delta replaces everything trainable
+            module = cls(**hparams)
+            _, unexpected = module.load_state_dict(state_dict, strict=False)
+            if unexpected:
+                raise ValueError(f"Delta checkpoint has weights the model lacks: {unexpected}")
+            return module.to(map_location)
+
+        architecture = checkpoint.get("aurora_architecture")
+        if architecture is not None:
+            surf_vars = tuple(architecture["surf_vars"])
+            surf_stats = architecture["surf_stats"]
+        else:
+            surf_vars = surf_vars_from_state_dict(state_dict)
+            if set(surf_vars) == set(hparams["surf_vars"]):
+                surf_vars = tuple(hparams["surf_vars"])
+            # 'pretrained' keeps Aurora's own statistics; other modes set the hparams ones
+            surf_stats = None if hparams["init_mode"] == "pretrained" else hparams["surf_stats"]
+
+        module = cls(**hparams, model=build_aurora_architecture(surf_vars, surf_stats))
+        module.load_state_dict(state_dict)
+        return module.to(map_location)
 
     def forward(self, batch):
         """
@@ -79,23 +188,17 @@ class LitAurora(L.LightningModule):
         """
         Compute MAE loss over the target variables with normalization.
 
-        This is a convenience wrapper around the unified loss function that
-        automatically provides the model's target_vars, norm_stats, and device.
+        Uses the fused loss (losses.fused_mae_loss) with the module's 1/std buffer, which is
+        already on the model's device.
 
         Args:
             prediction: Model predictions
             target_batch: Target batch
 
         Returns:
-            Tuple of (loss, n_vars) where n_vars is number of variables used
-        """
-        return compute_mae_loss_fn(
-            prediction,
-            target_batch,
-            self.target_vars,
-            self.norm_stats,
-            self.device,
-        )
+            Tuple of (loss, per_variable) where per_variable maps each variable used to its loss
+        """
+        return fused_mae_loss(prediction, target_batch, self.target_vars, self.inv_std)
 
     def training_step(self, batch, batch_idx):
         """
@@ -112,14 +215,39 @@ class LitAurora(L.LightningModule):
         prediction = self.forward(input_batch)
 
         # Compute MAE loss over all variables
-        loss, n_vars = self.compute_mae_loss(prediction, target_batch)
-
-        self.log("train_loss", loss, on_step=True, on_epoch=True, prog_bar=True)
-        self.log("train_n_vars", float(n_vars), prog_bar=False)
+        loss, per_variable = self.compute_mae_loss(prediction, target_batch)
+
+        # Lightning cannot infer the batch size of Aurora Batches; it weights epoch means.
+        # sync_dist averages logged losses over data-parallel processes (no-op in one process)
+        batch_size = len(input_batch.metadata.time)
+        self.log(
+            "train_loss",
+            loss,
+            on_step=True,
+            on_epoch=True,
+            prog_bar=True,
+            batch_size=batch_size,
+            sync_dist=True,
+        )
+        self.log("train_n_vars", float(len(per_variable)), prog_bar=False, batch_size=batch_size)
+        self.log_dict(
+            {f"train_loss_{name}": value.detach() for name, value in per_variable.items()},
+            on_step=False,
+            on_epoch=True,
+            batch_size=batch_size,
+            sync_dist=True,
+        )
 
         # Log current learning rate
         current_lr = self.trainer.optimizers[0].param_groups[0]["lr"]
-        self.log("learning_rate", current_lr, on_step=True, on_epoch=False, prog_bar=False)
+        self.log(
+            "learning_rate",
+            current_lr,
+            on_step=True,
+            on_epoch=False,
+            prog_bar=False,
+            batch_size=batch_size,
+        )
 
         return loss
 
@@ -134,16 +262,119 @@ class LitAurora(L.LightningModule):
         Returns:
             Validation loss
         """
-        input_batch, target_batch = batch
+        val_loss, per_variable, batch_size = self.validation_losses(batch)
+
+        self.log(
+            "val_loss",
+            val_loss,
+            on_epoch=True,
+            prog_bar=True,
+            batch_size=batch_size,
+            sync_dist=True,
+        )
+        self.log("val_n_vars", float(len(per_variable)), prog_bar=False, batch_size=batch_size)
+        self.log_dict(
+            {f"val_loss_{name}": value for name, value in per_variable.items()},
+            on_epoch=True,
+            batch_size=batch_size,
+            sync_dist=True,
+        )
+
+        return val_loss
+
+    def validation_losses(self, batch) -> tuple[torch.Tensor, dict[str, torch.Tensor], int]:
+        """
+        Compute the MAE validation loss of a batch, with cached targets where available.
+
+        Args:
+            batch: (input_batch, target_batch), or (input_batch, target_batch, indices) from an
+                IndexedDataset, on the model's device
+
+        Returns:
+            Tuple of (loss, per_variable, batch_size)
+        """
+        input_batch, target_batch, *indices = batch
+        sample_ids = indices[0] if indices else None
         prediction = self.forward(input_batch)
 
-        # Compute MAE validation loss
-        val_loss, n_vars = self.compute_mae_loss(prediction, target_batch)
+        targets = self._val_targets(target_batch, sample_ids)
+        if targets is None:
+            loss, per_variable = self.compute_mae_loss(prediction, target_batch)
+        else:
+            loss, per_variable = stacked_mae_loss(
+                prediction, targets, self.target_vars, self.inv_std
+            )
+        return loss, per_variable, len(input_batch.metadata.time)
 
-        self.log("val_loss", val_loss, on_epoch=True, prog_bar=True)
-        self.log("val_n_vars", float(n_vars), prog_bar=False)
+    def on_before_batch_transfer(self, batch, dataloader_idx):
+        """
+        Leave out validation targets that are cached on the device from the batch transfer.
 
-        return val_loss
+        Args:
+            batch: (input_batch, target_batch[, indices]) from the dataloader
+            dataloader_idx: Dataloader index
+
+        Returns:
+            The batch, with empty target variables if all its targets are cached
+        """
+        if self.training or len(batch) < 3:
+            return batch
+        input_batch, target_batch, sample_ids = batch
+        if self._val_targets_cached(sample_ids):
+            target_batch = dataclasses.replace(target_batch, surf_vars={}, atmos_vars={})
+        return input_batch, target_batch, sample_ids
+
+    def _val_targets_cached(self, sample_ids: tuple[int, ...] | None) -> bool:
+        """Whether the targets of every sample in a validation batch are cached."""
+        return (
+            sample_ids is not None
+            and bool(self._val_target_cache)
+            and all(i in self._val_target_cache for i in sample_ids)
+        )
+
+    def _val_targets(
+        self, target_batch, sample_ids: tuple[int, ...] | None
+    ) -> torch.Tensor | None:
+        """
+        Stacked target tensors of a validation batch, from the cache or stacked now and cached
+        while there is room.
+
+        Args:
+            target_batch: Target batch
+            sample_ids: Dataset indices of the batch's samples (None if not known)
+
+        Returns:
+            Tensors of all target variables stacked along the first dimension, or None if the
+            cache is disabled, the samples are unknown or the batch lacks target variables
+            (the loss then averages over the variables present)
+        """
+        if self._val_targets_cached(sample_ids):
+            samples = [self._val_target_cache[i] for i in sample_ids]
+            return samples[0] if len(samples) == 1 else torch.cat(samples, dim=1)
+        if self.val_target_cache_bytes <= 0 or sample_ids is None:
+            return None
+        if any(
+            name not in target_batch.surf_vars or name not in self.model.surf_vars
+            for name in self.target_vars
+        ):
+            return None
+        targets = stack_targets(target_batch, self.target_vars)
+        batch_size = targets.shape[1]
+        for i, sample_id in enumerate(sample_ids):
+            sample = targets[:, i : i + 1]
+            if sample_id in self._val_target_cache:
+                continue
+            if self._val_target_cache_used + sample.nbytes > self.val_target_cache_bytes:
+                break
+            # Cloned so a sample does not keep the rest of its batch alive
+            self._val_target_cache[sample_id] = sample.clone() if batch_size > 1 else sample
+            self._val_target_cache_used += sample.nbytes
+        return targets
+
+    def on_fit_end(self):
+        """Release the validation target cache."""
+        self._val_target_cache.clear()
+        self._val_target_cache_used = 0
 
     def configure_optimizers(self):
         """
@@ -152,14 +383,16 @@ class LitAurora(L.LightningModule):
         Returns:
             Optimizer or dictionary with optimizer and scheduler
         """
-        optimizer = torch.optim.Adam(self.parameters(), lr=self.learning_rate)
+        # Frozen parameters get no gradients and no optimizer state
+        trainable_params = [p for p in self.parameters() if p.requires_grad]
+        optimizer = torch.optim.Adam(trainable_params, lr=self.learning_rate)
 
         if self.lr_scheduler is None:
             return optimizer
         elif self.lr_scheduler == "cosine_annealing":
             # Calculate total steps and T_max for step-based scheduling
             # Update every 10 steps, so T_max is total steps divided by 10
-            total_steps = self.num_training_samples * self.max_epochs
+            total_steps = self.steps_per_epoch * self.max_epochs
             step_frequency = 10
             T_max = total_steps // step_frequency
 
@@ -182,7 +415,7 @@ class LitAurora(L.LightningModule):
 
 def create_default_aurora_lightning_module(
     log_dir: Path,
-    num_training_samples: int,
+    steps_per_epoch: int,
 ) -> LitAurora:
     """Creates a new instance of the LitAuroraUV lightning module with sensible defaults."""
     target_vars = ("2t",)
@@ -203,7 +436,7 @@ def create_default_aurora_lightning_module(
         learning_rate=config.learning_rate,
         lr_scheduler=config.lr_scheduler,
         max_epochs=config.max_epochs,
-        num_training_samples=num_training_samples,
+        steps_per_epoch=steps_per_epoch,
         initializer_checkpoint_path=config.initializer_checkpoint_path,
     )
 
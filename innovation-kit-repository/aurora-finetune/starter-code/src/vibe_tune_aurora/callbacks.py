@@ -2,11 +2,35 @@
 
 from pathlib import Path
 
+import torch
 from lightning.pytorch.callbacks import Callback
 
+from vibe_tune_aurora.delta_checkpoint import save_delta_checkpoint
+
+
+def _checkpoint_dir(trainer) -> Path:
+    """
+    The logger's checkpoints directory, as seen by rank 0.
+
+    Must be called on every rank: under data-parallel training, the logger's version directory is
+    resolved per process and could differ, so rank 0's path is broadcast to the others.
+    """
+    ckpt_dir = Path(trainer.strategy.broadcast(str(trainer.logger.log_dir))) / "checkpoints"
+    if trainer.is_global_zero:
+        ckpt_dir.mkdir(parents=True, exist_ok=True)
+    return ckpt_dir
+
 
 class SaveInitCheckpoint(Callback):
-    """Callback to save initial model checkpoint before training starts."""
+    """Callback to save initial model checkpoint before training starts (written by rank 0)."""
+
+    def __init__(self, delta: bool = False):
+        """
+        Args:
+            delta: Save a delta checkpoint (see delta_checkpoint.py) instead of a full one
+        """
+        super().__init__()
+        self.delta = delta
 
     def on_fit_start(self, trainer, pl_module):
         """
@@ -16,8 +40,106 @@ class SaveInitCheckpoint(Callback):
             trainer: PyTorch Lightning trainer
             pl_module: Lightning module being trained
         """
-        ckpt_dir = Path(trainer.logger.log_dir) / "checkpoints"
-        ckpt_dir.mkdir(parents=True, exist_ok=True)
-        init_checkpoint_path = ckpt_dir / "init.ckpt"
-        trainer.save_checkpoint(init_checkpoint_path)
-        print(f"Saved initial checkpoint to: {init_checkpoint_path}")
+        init_checkpoint_path = _checkpoint_dir(trainer) / "init.ckpt"
+        if self.delta:
+            if trainer.is_global_zero:
+                save_delta_checkpoint(pl_module, init_checkpoint_path)
+        else:
+            # Called on every rank (it synchronizes them); only rank 0 writes the file
+            trainer.save_checkpoint(init_checkpoint_path)
+        if trainer.is_global_zero:
+            print(f"Saved initial checkpoint to: {init_checkpoint_path}")
+
+
+class SaveDeltaCheckpoint(Callback):
+    """
+    Callback to save a delta checkpoint (trained weights only, see delta_checkpoint.py) at the
+    end of every training epoch, in place of ModelCheckpoint's full last.ckpt.
+
+    Delta checkpoints hold no optimizer or trainer state, so training cannot be resumed from
+    them; they restore with LitAurora.restore_from_checkpoint for evaluation and as
+    initializer checkpoints.
+    """
+
+    def __init__(self, filename: str = "last.ckpt"):
+        """
+        Args:
+            filename: Checkpoint file name in the logger's checkpoints directory
+        """
+        super().__init__()
+        self.filename = filename
+
+    def on_train_epoch_end(self, trainer, pl_module):
+        """
+        Save the delta checkpoint (rank 0 only), overwriting the previous epoch's.
+
+        Args:
+            trainer: PyTorch Lightning trainer
+            pl_module: Lightning module being trained
+        """
+        checkpoint_path = _checkpoint_dir(trainer) / self.filename
+        if not trainer.is_global_zero:
+            return
+        save_delta_checkpoint(
+            pl_module,
+            checkpoint_path,
+            epoch=trainer.current_epoch,
+            global_step=trainer.global_step,
+        )
+
+
+class FullValidationAtEpochEnd(Callback):
+    """
+    Callback that validates on every validation sample at the end of each training epoch.
+
+    Lightning's periodic validation checks (every val_check_interval) use the subset draws of
+    the loader's ValidationSubsetSampler. At the end of every epoch, this callback switches the
+    sampler to a full pass and runs its own loop over the loader. The losses, averaged over
+    all samples of all data-parallel processes, are logged as val_full_loss and
+    val_full_loss_<var>.
+    """
+
+    def __init__(self, val_loader):
+        """
+        Args:
+            val_loader: Validation DataLoader whose sampler is a ValidationSubsetSampler
+        """
+        super().__init__()
+        self.val_loader = val_loader
+        self.sampler = val_loader.sampler
+
+    def on_train_epoch_end(self, trainer, pl_module):
+        """
+        Run the full validation pass and log its losses.
+
+        Args:
+            trainer: PyTorch Lightning trainer
+            pl_module: Lightning module being trained
+        """
+        # Every process reduces the same names in the same order, even with an empty shard
+        names = ["val_full_loss"] + [f"val_full_loss_{name}" for name in pl_module.target_vars]
+        totals = {name: torch.zeros(2, device=pl_module.device) for name in names}
+        self.sampler.full_pass = True
+        pl_module.eval()
+        try:
+            with torch.no_grad(), trainer.precision_plugin.val_step_context():
+                for batch in self.val_loader:
+                    batch = trainer.strategy.batch_to_device(batch)
+                    loss, per_variable, batch_size = pl_module.validation_losses(batch)
+                    losses = {"val_full_loss": loss}
+                    losses.update(
+                        (f"val_full_loss_{name}", value) for name, value in per_variable.items()
+                    )
+                    for name, value in losses.items():
+                        # (sum of batch losses weighted by batch size, number of samples)
+                        weighted = value.float() * batch_size
+                        total = torch.stack([weighted, torch.full_like(weighted, batch_size)])
+                        totals[name] = totals[name] + total if name in totals else total
+        finally:
+            self.sampler.full_pass = False
+            pl_module.train()
+
+        for name, total in totals.items():
+            total = trainer.strategy.reduce(total, reduce_op="sum")
+            if total[1] > 0:  # Variables missing from the targets have no samples
+                pl_module.log(name, total[0] / total[1], on_step=False, on_epoch=True)
@@ -0,0 +1,115 @@
+"""Measure DataLoader throughput (samples/sec) on a synthetic small grid."""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import torch
+
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.data_processing.data_utils import LazyERA5Dataset, create_dataloader
+from vibe_tune_aurora.data_processing.extract_data_from_grib import (
+    ATMOS_VAR_NAMES,
+    STATIC_VAR_NAMES,
+    SURF_VAR_NAMES,
+)
+from vibe_tune_aurora.types import GribCubes
+
+
+def synthetic_cubes(
+    n_times: int, height: int, width: int, pressure_levels: tuple[int, ...]
+) -> GribCubes:
+    """Random variable cubes shaped like extracted ERA5 data."""
+    times = [datetime(2025, 1, 1) + timedelta(hours=6 * i) for i in range(n_times)]
+    n_levels = len(pressure_levels)
+    return GribCubes(
+        surf_vars={name: torch.randn(n_times, height, width) for name in SURF_VAR_NAMES},
+        static_vars={
+            name: torch.randn(height, width, dtype=torch.float64) for name in STATIC_VAR_NAMES
+        },
+        atmos_vars={
+            name: torch.randn(n_times, n_levels, height, width) for name in ATMOS_VAR_NAMES
+        },
+        times=times,
+        lat=torch.linspace(50.0, 30.0, height),
+        lon=torch.linspace(230.0, 250.0, width),
+        pressure_levels=list(pressure_levels),
+    )
+
+
+def measure_throughput(
+    dataset: LazyERA5Dataset,
+    batch_size: int,
+    num_workers: int,
+    prefetch_factor: int,
+    epochs: int,
+    step_ms: float,
+) -> float:
+    """
+    Iterate the DataLoader for several epochs and return samples/sec.
+
+    The first epoch is a warm-up (worker start-up, page faults) and is not timed. step_ms
+    emulates a training step so that overlap between loading and compute is visible.
+    """
+    loader = create_dataloader(
+        dataset,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        prefetch_factor=prefetch_factor,
+        persistent_workers=True,
+    )
+    n_samples = 0
+    start = None
+    for epoch in range(epochs + 1):
+        if epoch == 1:
+            start = time.perf_counter()
+        for input_batch, target_batch in loader:
+            if step_ms > 0:
+                time.sleep(step_ms / 1000)
+            if epoch > 0:
+                n_samples += len(input_batch.metadata.time)
+    return n_samples / (time.perf_counter() - start)
+
+
+def main():
+    """Command-line interface for the DataLoader throughput benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark DataLoader throughput")
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--prefetch-factor", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--n-times", type=int, default=64, help="Synthetic timesteps")
+    parser.add_argument("--height", type=int, default=64)
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1000, 850, 700, 500, 250])
+    parser.add_argument("--epochs", type=int, default=3, help="Timed epochs (after one warm-up)")
+    parser.add_argument(
+        "--step-ms",
+        type=float,
+        default=0.0,
+        help="Simulated training step per batch in milliseconds (default: 0)",
+    )
+    args = parser.parse_args()
+
+    cubes = synthetic_cubes(args.n_times, args.height, args.width, tuple(args.levels))
+    with tempfile.TemporaryDirectory() as tmp:
+        entry_dir = Path(tmp) / "entry"
+        grib_cache.save_cubes(cubes, entry_dir)
+        dataset = LazyERA5Dataset(entry_dir)
+
+        print(f"Grid {args.height}x{args.width}, {len(args.levels)} levels, {len(dataset)} samples")
+        for num_workers in args.num_workers:
+            throughput = measure_throughput(
+                dataset,
+                args.batch_size,
+                num_workers,
+                args.prefetch_factor,
+                args.epochs,
+                args.step_ms,
+            )
+            print(f"num_workers={num_workers}: {throughput:.1f} samples/sec")
+
+
+if __name__ == "__main__":
+    main()
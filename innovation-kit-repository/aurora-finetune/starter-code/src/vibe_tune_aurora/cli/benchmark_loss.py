@@ -0,0 +1,97 @@
+"""Compare the fused MAE loss with a per-variable loop on realistic grid sizes."""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import torch
+
+from vibe_tune_aurora.losses import fused_mae_loss
+
+
+def looped_mae_loss(prediction_batch, target_batch, target_vars, norm_stats):
+    """Reference implementation: normalize each variable separately and average the MAEs."""
+    total_loss = 0.0
+    for var_name in target_vars:
+        mean, std = norm_stats[var_name]
+        pred_norm = (prediction_batch.surf_vars[var_name] - mean) / std
+        target_norm = (target_batch.surf_vars[var_name] - mean) / std
+        total_loss = total_loss + torch.mean(torch.abs(pred_norm - target_norm))
+    return total_loss / len(target_vars)
+
+
+def saved_tensor_bytes(loss_fn) -> int:
+    """Bytes of tensors autograd keeps alive for the backward pass of loss_fn()."""
+    saved = []
+
+    def pack(tensor):
+        saved.append(tensor.untyped_storage().nbytes())
+        return tensor
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda tensor: tensor):
+        loss_fn()
+    return sum(saved)
+
+
+def time_forward_backward(loss_fn, params, repeats: int, device: torch.device) -> float:
+    """Mean seconds per forward + backward pass, after one warm-up pass."""
+    for repeat in range(repeats + 1):
+        if repeat == 1:
+            if device.type == "cuda":
+                torch.cuda.synchronize()
+            start = time.perf_counter()
+        for param in params:
+            param.grad = None
+        loss_fn().backward()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    """Command-line interface for the loss benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark fused vs looped MAE loss")
+    parser.add_argument(
+        "--grids",
+        nargs="+",
+        default=["180x360", "721x1440"],
+        help="Grid sizes as HEIGHTxWIDTH (default: 180x360 721x1440)",
+    )
+    parser.add_argument("--n-vars", type=int, default=4, help="Target variables (default: 4)")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    args = parser.parse_args()
+
+    device = torch.device(args.device)
+    target_vars = tuple(f"var{i}" for i in range(args.n_vars))
+    norm_stats = {name: (float(i), 1.0 + i) for i, name in enumerate(target_vars)}
+    inv_std = torch.tensor([1.0 / std for _, std in norm_stats.values()], device=device)
+
+    for grid in args.grids:
+        height, width = (int(size) for size in grid.lower().split("x"))
+        shape = (args.batch_size, 1, height, width)
+        params = [torch.randn(shape, device=device, requires_grad=True) for _ in target_vars]
+        prediction = SimpleNamespace(surf_vars=dict(zip(target_vars, params)))
+        target = SimpleNamespace(
+            surf_vars={name: torch.randn(shape, device=device) for name in target_vars}
+        )
+        loss_fns = {
+            "looped": lambda: looped_mae_loss(prediction, target, target_vars, norm_stats),
+            "fused": lambda: fused_mae_loss(prediction, target, target_vars, inv_std)[0],
+        }
+
+        print(f"Grid {height}x{width}, {args.n_vars} variables, batch size {args.batch_size}")
+        for name, loss_fn in loss_fns.items():
+            if device.type == "cuda":
+                torch.cuda.reset_peak_memory_stats(device)
+            seconds = time_forward_backward(loss_fn, params, args.repeats, device)
+            saved_mb = saved_tensor_bytes(loss_fn) / 2**20
+            line = f"  {name:>6}: {seconds * 1000:8.2f} ms/step, {saved_mb:8.1f} MB saved"
+            if device.type == "cuda":
+                line += f", {torch.cuda.max_memory_allocated(device) / 2**20:8.1f} MB peak"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
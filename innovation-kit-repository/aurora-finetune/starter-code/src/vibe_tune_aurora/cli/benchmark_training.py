@@ -0,0 +1,161 @@
+"""Measure training step time and peak memory per precision/compile/checkpointing setting.
+
+Each configuration trains a randomly initialized AuroraSmall (nothing is downloaded) for a few
+steps on a synthetic small grid, in its own process so that peak RSS is per configuration.
+Runs on CPU-only machines.
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import lightning as L
+from lightning.pytorch.callbacks import Callback
+
+from vibe_tune_aurora.aurora_module import LitAurora
+from vibe_tune_aurora.cli.benchmark_dataloader import synthetic_cubes
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS
+from vibe_tune_aurora.data_processing.data_utils import (
+    create_dataloader,
+    load_normalization_stats,
+    load_surface_stats,
+)
+from vibe_tune_aurora.data_processing.extract_data_from_grib import (
+    pair_from_cubes,
+    pair_time_indices,
+)
+from vibe_tune_aurora.training import apply_execution_options, peak_memory_mb
+
+
+class StepTimer(Callback):
+    """Records the wall time of every training step after the warm-up steps."""
+
+    def __init__(self, warmup_steps: int):
+        super().__init__()
+        self.warmup_steps = warmup_steps
+        self.step_times: list[float] = []
+        self._start = 0.0
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx):
+        self._start = time.perf_counter()
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        if batch_idx >= self.warmup_steps:
+            self.step_times.append(time.perf_counter() - self._start)
+
+
+def run_configuration(
+    precision: str,
+    compile_model: bool,
+    activation_checkpointing: bool,
+    steps: int,
+    warmup_steps: int,
+    height: int,
+    width: int,
+    trainable: str,
+    accelerator: str,
+) -> tuple[float, float]:
+    """
+    Train for warmup_steps + steps steps and return (mean step time in ms, peak memory in MB).
+
+    Runs in a fresh worker process per configuration.
+    """
+    n_steps = warmup_steps + steps
+    # One training pair per step: timesteps [t-1, t] -> t+1
+    cubes = synthetic_cubes(n_steps + 2, height, width, (1000, 850, 700, 500, 250))
+    pairs = [pair_from_cubes(cubes, i) for i in pair_time_indices(len(cubes.times), 0)]
+
+    target_vars = ("2t",)
+    lit_model = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=target_vars,
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(target_vars),
+        trainable=trainable,
+    )
+    apply_execution_options(lit_model, activation_checkpointing, compile_model)
+
+    timer = StepTimer(warmup_steps)
+    trainer = L.Trainer(
+        max_steps=n_steps,
+        accelerator=accelerator,
+        devices=1,
+        precision=precision,
+        logger=False,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        limit_val_batches=0,
+        num_sanity_val_steps=0,
+        callbacks=[timer],
+    )
+    trainer.fit(lit_model, create_dataloader(pairs))
+    return 1000 * sum(timer.step_times) / len(timer.step_times), peak_memory_mb()
+
+
+def main():
+    """Command-line interface for the training benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark training step time and peak memory per training configuration"
+    )
+    parser.add_argument(
+        "--precision",
+        nargs="+",
+        default=["32-true", "bf16-mixed"],
+        help="Lightning precisions to compare (default: 32-true bf16-mixed)",
+    )
+    parser.add_argument(
+        "--compile",
+        nargs="+",
+        choices=["off", "on"],
+        default=["off"],
+        help="torch.compile settings to compare (default: off)",
+    )
+    parser.add_argument(
+        "--activation-checkpointing",
+        nargs="+",
+        choices=["off", "on"],
+        default=["off", "on"],
+        help="Activation checkpointing settings to compare (default: off on)",
+    )
+    parser.add_argument("--trainable", default="full", help="Trainable mode (default: full)")
+    parser.add_argument("--steps", type=int, default=5, help="Timed steps (default: 5)")
+    parser.add_argument("--warmup-steps", type=int, default=2, help="Untimed steps (default: 2)")
+    parser.add_argument("--height", type=int, default=32)
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--accelerator", default="cpu", help="Lightning accelerator (default: cpu)")
+    args = parser.parse_args()
+
+    print(f"Grid {args.height}x{args.width}, {args.steps} timed steps, trainable={args.trainable}")
+    print(f"{'precision':>12} {'compile':>8} {'act-ckpt':>9} {'ms/step':>10} {'peak MB':>10}")
+    configurations = itertools.product(
+        args.precision, args.compile, args.activation_checkpointing
+    )
+    for precision, compile_setting, checkpointing_setting in configurations:
+        # A fresh process per configuration, so the peak RSS is not carried over
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            step_ms, peak_mb = pool.submit(
+                run_configuration,
+                precision,
+                compile_setting == "on",
+                checkpointing_setting == "on",
+                args.steps,
+                args.warmup_steps,
+                args.height,
+                args.width,
+                args.trainable,
+                args.accelerator,
+            ).result()
+        print(
+            f"{precision:>12} {compile_setting:>8} {checkpointing_setting:>9} "
+            f"{step_ms:>10.1f} {peak_mb:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
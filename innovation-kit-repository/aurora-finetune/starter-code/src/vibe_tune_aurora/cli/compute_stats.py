@@ -0,0 +1,47 @@
+"""Compute normalization statistics from ERA5 GRIB/NetCDF files."""
+
+import argparse
+from pathlib import Path
+
+from vibe_tune_aurora.data_processing.stats import compute_stats, write_stats_file
+
+
+def main():
+    """Command-line interface for computing normalization statistics."""
+    parser = argparse.ArgumentParser(
+        description="Stream ERA5 GRIB/NetCDF files and write per-variable mean/std statistics"
+    )
+    parser.add_argument(
+        "files",
+        type=Path,
+        nargs="+",
+        help="GRIB (.grib/.grb) and/or NetCDF (.nc) files to compute statistics over",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="Path to write the statistics JSON (use with train --stats-file)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes, one file at a time each (default: 1)",
+    )
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    print(f"Computing statistics over {len(args.files)} files...")
+    accumulators = compute_stats(args.files, workers=args.workers)
+    write_stats_file(accumulators, args.output)
+
+    for key, accumulator in sorted(accumulators.items()):
+        print(f"{key}: mean={accumulator.mean:.6g} std={accumulator.std:.6g} n={accumulator.count}")
+    print(f"Wrote statistics for {len(accumulators)} variables to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,18 @@
 import argparse
 from pathlib import Path
 
-from vibe_tune_aurora.config import TARGET_VAR_PRESETS
+from vibe_tune_aurora.config import DEFAULT_GRIB_CACHE_DIR, TARGET_VAR_PRESETS
+from vibe_tune_aurora.data_processing.data_utils import create_lazy_dataset
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
     extract_training_data_from_grib,
+    extract_variable_cubes,
+)
+from vibe_tune_aurora.evaluation import (
+    evaluate_checkpoints,
+    evaluate_model,
+    evaluate_rollout,
+    load_model,
 )
-from vibe_tune_aurora.evaluation import evaluate_model, load_model
 
 
 def main():
@@ -20,8 +27,10 @@ def main():
     parser.add_argument(
         "--checkpoint",
         type=Path,
+        nargs="+",
         required=True,
-        help="Path to model checkpoint file",
+        help="Path to model checkpoint file. Several checkpoints are evaluated on the same "
+        "extracted data and compared in one table",
     )
     parser.add_argument(
         "--single_level_file",
@@ -53,6 +62,37 @@ def main():
         default="evaluation_results.json",
         help="Path to save evaluation results as JSON (default: evaluation_results.json)",
     )
+    parser.add_argument(
+        "--output-npz",
+        type=Path,
+        default=None,
+        help="Path to save per-grid-cell error maps (bias, error std, MAE) as NPZ",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Samples per forward pass (default: 1)",
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=0,
+        help="DataLoader worker processes building samples (default: 0, main process)",
+    )
+    parser.add_argument(
+        "--parallel-models",
+        type=int,
+        default=1,
+        help="Checkpoints evaluated at the same time in worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--rollout-steps",
+        type=int,
+        default=0,
+        help="Evaluate autoregressive rollouts of this many steps with metrics per lead time "
+        "instead of single-step inference (default: 0, single-step)",
+    )
     parser.add_argument(
         "--patch_size",
         type=int,
@@ -65,32 +105,94 @@ def main():
         default=0,
         help="Number of initial timesteps to skip before creating training pairs (default: 0)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_GRIB_CACHE_DIR,
+        help=f"Directory for cached decoded GRIB data (default: {DEFAULT_GRIB_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always decode GRIB files with pygrib instead of using/writing the cache",
+    )
 
     args = parser.parse_args()
+    if len(args.checkpoint) > 1 and args.output_npz is not None:
+        parser.error("--output-npz can only be used with a single --checkpoint")
+    if args.rollout_steps > 0 and (len(args.checkpoint) > 1 or args.output_npz is not None):
+        parser.error("--rollout-steps takes a single --checkpoint and no --output-npz")
 
     # Get target variables from preset
     target_vars = TARGET_VAR_PRESETS[args.loss_type]
 
-    # Extract training data from GRIB files
-    print(f"Extracting training data from GRIB files...")
-    training_data_pairs = extract_training_data_from_grib(
-        single_level_file=args.single_level_file,
-        pressure_level_file=args.pressure_level_file,
-        patch_size=args.patch_size,
-        skip_first_n_timesteps=args.skip_first_n_timesteps,
-    )
+    cache_dir = None if args.no_cache else args.cache_dir
+    if args.rollout_steps > 0:
+        # Rollouts gather inputs and targets of every lead time from the shared cubes
+        cubes = extract_variable_cubes(
+            args.single_level_file,
+            args.pressure_level_file,
+            patch_size=args.patch_size,
+            cache_dir=cache_dir,
+        )
+        evaluate_rollout(
+            aurora_lightning_module=load_model(args.checkpoint[0]),
+            cubes=cubes,
+            target_vars=target_vars,
+            steps=args.rollout_steps,
+            skip_first_n_timesteps=args.skip_first_n_timesteps,
+            batch_size=args.batch_size,
+            output_json=args.output_json,
+        )
+        print("\nEvaluation completed!")
+        return
+
+    # Extract training data from GRIB files (once, shared by all checkpoints)
+    if len(args.checkpoint) > 1 and cache_dir is not None:
+        # Index the memory-mapped cache entry; parallel workers receive only the index
+        print(f"Caching training data from GRIB files...")
+        evaluation_data = create_lazy_dataset(
+            args.single_level_file,
+            args.pressure_level_file,
+            patch_size=args.patch_size,
+            skip_first_n_timesteps=args.skip_first_n_timesteps,
+            cache_dir=cache_dir,
+        )
+    else:
+        print(f"Extracting training data from GRIB files...")
+        evaluation_data = extract_training_data_from_grib(
+            single_level_file=args.single_level_file,
+            pressure_level_file=args.pressure_level_file,
+            patch_size=args.patch_size,
+            skip_first_n_timesteps=args.skip_first_n_timesteps,
+            cache_dir=cache_dir,
+        )
 
     # Print configuration
     print(f"Model evaluation with loss type: {args.loss_type}")
     print(f"Target variables: {target_vars}")
 
     # Run evaluation
-    _ = evaluate_model(
-        aurora_lightning_module=load_model(args.checkpoint),
-        evaluation_data_pairs=training_data_pairs,
-        target_vars=target_vars,
-        output_json=args.output_json,
-    )
+    if len(args.checkpoint) > 1:
+        _ = evaluate_checkpoints(
+            checkpoint_paths=args.checkpoint,
+            evaluation_data_pairs=evaluation_data,
+            target_vars=target_vars,
+            output_json=args.output_json,
+            batch_size=args.batch_size,
+            num_workers=args.num_workers,
+            parallel_models=args.parallel_models,
+        )
+    else:
+        _ = evaluate_model(
+            aurora_lightning_module=load_model(args.checkpoint[0]),
+            evaluation_data_pairs=evaluation_data,
+            target_vars=target_vars,
+            output_json=args.output_json,
+            output_npz=args.output_npz,
+            batch_size=args.batch_size,
+            num_workers=args.num_workers,
+        )
 
     print("\nEvaluation completed!")
 
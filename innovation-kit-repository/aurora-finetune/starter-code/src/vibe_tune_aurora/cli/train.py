@@ -3,10 +3,18 @@
 import argparse
 from pathlib import Path
 
-from vibe_tune_aurora.config import TARGET_VAR_PRESETS, TrainingConfig
+from vibe_tune_aurora.config import (
+    DEFAULT_GRIB_CACHE_DIR,
+    DEFAULT_STATS_FILE,
+    TARGET_VAR_PRESETS,
+    TrainingConfig,
+)
+from vibe_tune_aurora.data_processing.data_utils import create_lazy_dataset
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
+    cache_variable_cubes_many,
     extract_training_data_from_grib,
 )
+from vibe_tune_aurora.trainable import parse_trainable
 from vibe_tune_aurora.training import train_era5_model
 
 
@@ -87,6 +95,74 @@ def main():
         default=None,
         help="Path to initializer checkpoint file (required when --init-mode is 'initializer_checkpoint')",
     )
+    parser.add_argument(
+        "--trainable",
+        type=str,
+        default="full",
+        help="Parameters to fine-tune, the rest are frozen: 'full' (default), 'heads-only' "
+        "(surface embeddings and decoder heads), 'heads+last-N-blocks' (e.g. "
+        "'heads+last-2-blocks') or 'lora' (heads plus LoRA adapters on the backbone)",
+    )
+    parser.add_argument(
+        "--checkpoint-format",
+        type=str,
+        default="full",
+        choices=["full", "delta"],
+        help="'full' Lightning checkpoints (default, resumable) or 'delta' checkpoints holding "
+        "only trained weights plus a reference to the base checkpoint",
+    )
+    parser.add_argument(
+        "--precision",
+        type=str,
+        default="32-true",
+        help="Lightning training precision, e.g. '32-true' (default), 'bf16-mixed' (CPU or GPU) "
+        "or '16-mixed' (GPU)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the Aurora model with torch.compile (slower first step)",
+    )
+    parser.add_argument(
+        "--activation-checkpointing",
+        action="store_true",
+        help="Recompute activations during backward to reduce memory use",
+    )
+    parser.add_argument(
+        "--cpu-processes",
+        type=int,
+        default=0,
+        help="Train data-parallel in this many CPU processes (DDP with the gloo backend); "
+        "cores are split evenly between them (default: 0, Lightning's device selection)",
+    )
+    parser.add_argument(
+        "--val-check-interval",
+        type=float,
+        default=0.10,
+        help="Fraction of an epoch between validation checks (default: 0.10)",
+    )
+    parser.add_argument(
+        "--val-subset-size",
+        type=int,
+        default=None,
+        help="Validate on this many samples per check, plus a full validation pass at the end "
+        "of every epoch (default: all samples at every check)",
+    )
+    parser.add_argument(
+        "--val-subset-strategy",
+        type=str,
+        default="random",
+        choices=["random", "stratified"],
+        help="How validation subsets are drawn: 'random', or 'stratified' for one sample from "
+        "each of --val-subset-size consecutive time periods (default: random)",
+    )
+    parser.add_argument(
+        "--val-target-cache-mb",
+        type=float,
+        default=0,
+        help="Device memory for keeping validation targets between checks "
+        "(default: 0, no cache)",
+    )
     parser.add_argument(
         "--lr_scheduler",
         type=str,
@@ -112,9 +188,94 @@ def main():
         default=0,
         help="Number of initial timesteps to skip before creating training pairs (default: 0)",
     )
+    parser.add_argument(
+        "--stats-file",
+        type=Path,
+        default=DEFAULT_STATS_FILE,
+        help="Normalization statistics JSON, e.g. written by vibe_tune_aurora.cli.compute_stats "
+        f"(default: {DEFAULT_STATS_FILE})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_GRIB_CACHE_DIR,
+        help=f"Directory for cached decoded GRIB data (default: {DEFAULT_GRIB_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always decode GRIB files with pygrib instead of using/writing the cache",
+    )
+    parser.add_argument(
+        "--lazy-dataset",
+        action="store_true",
+        help="Build training/validation samples on demand from the memory-mapped GRIB cache "
+        "instead of loading all of them into RAM up front",
+    )
+    parser.add_argument(
+        "--decode-workers",
+        type=int,
+        default=1,
+        help="Processes decoding GRIB files in parallel: training/validation and "
+        "single-/pressure-level files at once, split by message range when there are more "
+        "workers than files (default: 1, decode serially)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Samples stacked into each Aurora batch; all samples must share one grid (default: 1)",
+    )
+    parser.add_argument(
+        "--accumulate-grad-batches",
+        type=int,
+        default=1,
+        help="Accumulate gradients over this many batches per optimizer step (default: 1)",
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=0,
+        help="DataLoader worker processes building samples in parallel with training "
+        "(default: 0, build in the main process). Combine with --lazy-dataset so workers "
+        "receive only a sample index instead of a copy of all training pairs",
+    )
+    parser.add_argument(
+        "--prefetch-factor",
+        type=int,
+        default=2,
+        help="Samples prefetched by each DataLoader worker (default: 2)",
+    )
+    parser.add_argument(
+        "--no-persistent-workers",
+        action="store_true",
+        help="Restart DataLoader workers every epoch instead of keeping them alive",
+    )
 
     args = parser.parse_args()
 
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+    if args.accumulate_grad_batches < 1:
+        parser.error("--accumulate-grad-batches must be >= 1")
+    if args.decode_workers < 1:
+        parser.error("--decode-workers must be >= 1")
+    if args.num_workers < 0:
+        parser.error("--num-workers must be >= 0")
+    if args.prefetch_factor < 1:
+        parser.error("--prefetch-factor must be >= 1")
+    if not 0 < args.val_check_interval <= 1:
+        parser.error("--val-check-interval must be in (0, 1]")
+    if args.val_subset_size is not None and args.val_subset_size < 1:
+        parser.error("--val-subset-size must be >= 1")
+    if args.lazy_dataset and args.no_cache:
+        parser.error("--lazy-dataset reads from the GRIB cache and cannot be used with --no-cache")
+
+    try:
+        parse_trainable(args.trainable)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Validate initializer_checkpoint_path requirement
     if args.init_mode == "initializer_checkpoint" and args.initializer_checkpoint_path is None:
         parser.error(
@@ -131,23 +292,60 @@ def main():
         init_mode=args.init_mode,
         lr_scheduler=args.lr_scheduler,
         initializer_checkpoint_path=args.initializer_checkpoint_path,
+        trainable=args.trainable,
+        checkpoint_format=args.checkpoint_format,
+        precision=args.precision,
+        compile_model=args.compile,
+        activation_checkpointing=args.activation_checkpointing,
+        cpu_processes=args.cpu_processes,
+        val_check_interval=args.val_check_interval,
+        val_subset_size=args.val_subset_size,
+        val_subset_strategy=args.val_subset_strategy,
+        val_target_cache_mb=args.val_target_cache_mb,
         log_dir=args.log_dir,
+        batch_size=args.batch_size,
+        accumulate_grad_batches=args.accumulate_grad_batches,
+        num_workers=args.num_workers,
+        prefetch_factor=args.prefetch_factor,
+        persistent_workers=not args.no_persistent_workers,
+        stats_file=args.stats_file,
     )
 
     # Extract training/validation data from GRIB files
-    print(f"Extracting training/validation data from GRIB files...")
-    training_data_pairs = extract_training_data_from_grib(
+    cache_dir = None if args.no_cache else args.cache_dir
+    if cache_dir is not None and args.decode_workers > 1:
+        # Decode training and validation files together; the loads below then hit the cache
+        cache_variable_cubes_many(
+            [
+                (args.single_levels_training_file, args.pressure_levels_training_file),
+                (args.single_levels_validation_file, args.pressure_levels_validation_file),
+            ],
+            patch_size=args.patch_size,
+            cache_dir=cache_dir,
+            workers=args.decode_workers,
+        )
+    if args.lazy_dataset:
+        print(f"Indexing training/validation data in the GRIB cache...")
+        load_data = create_lazy_dataset
+    else:
+        print(f"Extracting training/validation data from GRIB files...")
+        load_data = extract_training_data_from_grib
+    training_data_pairs = load_data(
         single_level_file=args.single_levels_training_file,
         pressure_level_file=args.pressure_levels_training_file,
         patch_size=args.patch_size,
         skip_first_n_timesteps=args.skip_first_n_timesteps,
+        cache_dir=cache_dir,
+        workers=args.decode_workers,
     )
 
-    validation_data_pairs = extract_training_data_from_grib(
+    validation_data_pairs = load_data(
         single_level_file=args.single_levels_validation_file,
         pressure_level_file=args.pressure_levels_validation_file,
         patch_size=args.patch_size,
         skip_first_n_timesteps=args.skip_first_n_timesteps,
+        cache_dir=cache_dir,
+        workers=args.decode_workers,
     )
 
     # Train
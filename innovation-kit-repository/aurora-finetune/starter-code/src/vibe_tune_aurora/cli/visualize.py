@@ -9,6 +9,7 @@ import matplotlib.pyplot as plt  # type: ignore[import]
 import numpy as np  # type: ignore[import]
 import torch  # type: ignore[import]
 
+from vibe_tune_aurora.config import DEFAULT_GRIB_CACHE_DIR
 from vibe_tune_aurora.data_processing.data_utils import ERA5Dataset
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
     extract_training_data_from_grib,
@@ -188,6 +189,17 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Number of initial timesteps to skip before creating training pairs (default: 0)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_GRIB_CACHE_DIR,
+        help=f"Directory for cached decoded GRIB data (default: {DEFAULT_GRIB_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always decode GRIB files with pygrib instead of using/writing the cache",
+    )
     parser.add_argument(
         "--dark_mode",
         action="store_true",
@@ -206,6 +218,7 @@ def main() -> None:
         pressure_level_file=args.pressure_level_file,
         patch_size=args.patch_size,
         skip_first_n_timesteps=args.skip_first_n_timesteps,
+        cache_dir=None if args.no_cache else args.cache_dir,
     )
 
     visualize_prediction(
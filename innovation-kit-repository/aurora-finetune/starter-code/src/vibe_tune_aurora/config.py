@@ -7,6 +7,8 @@ from dataclasses import dataclass
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_STATS_FILE = PROJECT_ROOT / "tests/inputs/era5_surface_stats.json"
+# Decoded GRIB cubes (see data_processing/grib_cache.py)
+DEFAULT_GRIB_CACHE_DIR = Path.home() / ".cache" / "vibe_tune_aurora" / "grib"
 
 # Surface variables
 DEFAULT_SURF_VARS = ("2t", "10u", "10v", "msl", "tcc", "tclw", "uvb", "ssrdc")
@@ -27,7 +29,32 @@ class TrainingConfig:
     log_dir: Path | None = None
     max_epochs: int = 3
     learning_rate: float = 1e-6
-    batch_size: int = 1  # Aurora Batch objects only support batch_size=1
+    batch_size: int = 1  # Samples stacked along the Aurora Batch leading dimension
+    accumulate_grad_batches: int = 1  # Batches per optimizer step
     init_mode: str = "pretrained_and_custom"
     lr_scheduler: str | None = "cosine_annealing"
     initializer_checkpoint_path: str | None = None
+    # 'full', 'heads-only', 'heads+last-N-blocks' or 'lora' (see trainable.py)
+    trainable: str = "full"
+    # 'full' Lightning checkpoints, or 'delta' checkpoints of trained weights only
+    checkpoint_format: str = "full"
+    # Lightning precision: '32-true', 'bf16-mixed' (CPU or GPU), '16-mixed' (GPU), ...
+    precision: str = "32-true"
+    compile_model: bool = False  # torch.compile the Aurora model
+    activation_checkpointing: bool = False  # Recompute activations in backward to save memory
+    # CPU data-parallel processes (DDP over gloo); 0 or 1 lets Lightning pick the devices
+    cpu_processes: int = 0
+    # Validation checks per epoch: every val_check_interval of an epoch, on val_subset_size
+    # samples drawn 'random'ly or 'stratified' over time (None = all samples); with a subset,
+    # every epoch also ends with a full validation pass (logged as val_full_loss)
+    val_check_interval: float = 0.10
+    val_subset_size: int | None = None
+    val_subset_strategy: str = "random"
+    # Device memory for keeping validation targets between checks, per sample (0 = no cache)
+    val_target_cache_mb: float = 0
+    # DataLoader workers building samples in parallel with training (0 = main process)
+    num_workers: int = 0
+    prefetch_factor: int = 2
+    persistent_workers: bool = True
+    # Normalization statistics (see cli/compute_stats.py)
+    stats_file: Path = DEFAULT_STATS_FILE
@@ -1,13 +1,22 @@
 """Dataset and data loading utilities for Aurora fine-tuning."""
 
+import functools
 import json
+import math
 from pathlib import Path
 
 import torch
-from torch.utils.data import DataLoader, Dataset
+from aurora import Batch, Metadata
+from torch.utils.data import DataLoader, Dataset, DistributedSampler, Sampler, get_worker_info
 
-from vibe_tune_aurora.config import DEFAULT_STATS_FILE
-from vibe_tune_aurora.types import SupervisedTrainingDataPair
+from vibe_tune_aurora.config import DEFAULT_GRIB_CACHE_DIR, DEFAULT_STATS_FILE
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.data_processing.extract_data_from_grib import (
+    cache_variable_cubes,
+    pair_from_cubes,
+    pair_time_indices,
+)
+from vibe_tune_aurora.types import GribCubes, GribSelection, SupervisedTrainingDataPair
 
 
 class ERA5Dataset(Dataset):
@@ -43,12 +52,145 @@ class ERA5Dataset(Dataset):
         return input_batch, target_batch
 
 
+class LazyERA5Dataset(Dataset):
+    """
+    Dataset that builds training pairs on demand from a memory-mapped GRIB cache entry.
+
+    Only the timestep index is held in memory. The cube arrays are memory-mapped on first
+    access (separately in each DataLoader worker), and the Aurora Batches for a sample are
+    constructed inside __getitem__, so the training period is not limited by RAM. Combine
+    several GRIB files with torch.utils.data.ConcatDataset.
+    """
+
+    def __init__(self, entry_dir: Path, skip_first_n_timesteps: int = 0):
+        """
+        Initialize lazy ERA5 dataset from a GRIB cache entry.
+
+        Args:
+            entry_dir: Cache entry directory (see cache_variable_cubes)
+            skip_first_n_timesteps: Number of initial timesteps to skip
+
+        Raises:
+            FileNotFoundError: If entry_dir is not a valid cache entry
+            ValueError: If fewer than 3 timesteps remain after skipping
+        """
+        times = grib_cache.load_times(entry_dir)
+        if times is None:
+            raise FileNotFoundError(f"GRIB cache entry not found or outdated: {entry_dir}")
+        self.entry_dir = entry_dir
+        self.time_indices = pair_time_indices(len(times), skip_first_n_timesteps)
+        self._cubes: GribCubes | None = None
+        print(f"Indexed {len(self.time_indices)} training samples in {entry_dir}")
+
+    def __len__(self) -> int:
+        """Return number of samples in dataset."""
+        return len(self.time_indices)
+
+    def __getitem__(self, idx: int):
+        """
+        Build a single sample from the memory-mapped cubes.
+
+        Args:
+            idx: Index of sample to retrieve
+
+        Returns:
+            Tuple of (input_batch, target_batch)
+        """
+        if self._cubes is None:
+            self._cubes = grib_cache.load_cubes(self.entry_dir)
+            if self._cubes is None:
+                raise FileNotFoundError(f"GRIB cache entry disappeared: {self.entry_dir}")
+        sample = pair_from_cubes(self._cubes, self.time_indices[idx])
+        return sample.input_batch, sample.target_batch
+
+    def __getstate__(self) -> dict:
+        # Workers re-map the entry themselves instead of receiving pickled array copies
+        state = self.__dict__.copy()
+        state["_cubes"] = None
+        return state
+
+
+class IndexedDataset(Dataset):
+    """
+    Dataset that adds each sample's index to it: (input_batch, target_batch, index).
+
+    The collator passes the indices on as a tuple, so a batch identifies its samples even when
+    several datasets with the same timestamps (e.g. regions) are concatenated.
+    """
+
+    def __init__(self, dataset: Dataset):
+        """
+        Args:
+            dataset: Dataset yielding (input_batch, target_batch)
+        """
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        """Return number of samples in dataset."""
+        return len(self.dataset)
+
+    def __getitem__(self, idx: int):
+        """Return (input_batch, target_batch, idx)."""
+        input_batch, target_batch = self.dataset[idx]
+        return input_batch, target_batch, idx
+
+
+def create_lazy_dataset(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    patch_size: int = 4,
+    skip_first_n_timesteps: int = 0,
+    cache_dir: Path = DEFAULT_GRIB_CACHE_DIR,
+    selection: GribSelection | None = None,
+    workers: int = 1,
+) -> LazyERA5Dataset:
+    """
+    Create a LazyERA5Dataset for a pair of GRIB files, decoding them into the cache if needed.
+
+    Args:
+        single_level_file: Path to ERA5 single-level GRIB file
+        pressure_level_file: Path to ERA5 pressure-level GRIB file
+        patch_size: Patch size for cropping
+        skip_first_n_timesteps: Number of initial timesteps to skip
+        cache_dir: Cache root directory (required, the dataset reads from the cache entry)
+        selection: Pressure levels, time range and lat/lon sub-window to decode
+        workers: Processes decoding the GRIB files if they are not cached yet
+
+    Returns:
+        LazyERA5Dataset over the cached cubes
+    """
+    entry_dir = cache_variable_cubes(
+        single_level_file, pressure_level_file, patch_size, cache_dir, selection, workers
+    )
+    return LazyERA5Dataset(entry_dir, skip_first_n_timesteps)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_stats_json(stats_file: Path, mtime_ns: int) -> dict[str, dict]:
+    # Keyed on the file's mtime so a rewritten stats file (compute_stats) is picked up
+    with open(stats_file, "r") as f:
+        stats_json = json.load(f)
+    print(f"Loaded statistics for {len(stats_json)} variables from {stats_file}")
+    return stats_json
+
+
+def _load_stats_json(stats_file: Path, kind: str) -> dict[str, dict]:
+    """Return the parsed stats file, reading it at most once per process while unchanged."""
+    try:
+        mtime_ns = stats_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{kind} statistics file not found: {stats_file}") from None
+    return _read_stats_json(stats_file.resolve(), mtime_ns)
+
+
 def load_surface_stats(
     stats_file: Path = DEFAULT_STATS_FILE,
 ) -> dict[str, tuple[float, float]]:
     """
     Load surface statistics from JSON file.
 
+    The file is parsed once per process (until it changes on disk).
+
     Args:
         stats_file: Path to JSON file containing surface statistics.
                    Defaults to tests/data/era5_surface_stats.json
@@ -59,18 +201,13 @@ def load_surface_stats(
     Raises:
         FileNotFoundError: If statistics file doesn't exist
     """
-    if not stats_file.exists():
-        raise FileNotFoundError(f"Surface statistics file not found: {stats_file}")
-
-    with open(stats_file, "r") as f:
-        stats_json = json.load(f)
+    stats_json = _load_stats_json(stats_file, "Surface")
 
     # Convert from JSON format to tuple format
     surf_stats = {}
     for var_name, stats in stats_json.items():
         surf_stats[var_name] = (stats["mean"], stats["std"])
 
-    print(f"Loaded surface statistics for {len(surf_stats)} variables")
     return surf_stats
 
 
@@ -81,6 +218,8 @@ def load_normalization_stats(
     """
     Load normalization statistics for target variables from JSON file.
 
+    The file is parsed once per process (until it changes on disk).
+
     Args:
         target_vars: Tuple of target variable names to load statistics for
         stats_file: Path to JSON file containing statistics.
@@ -93,11 +232,7 @@ def load_normalization_stats(
         FileNotFoundError: If statistics file doesn't exist
         ValueError: If statistics not found for any target variable
     """
-    if not stats_file.exists():
-        raise FileNotFoundError(f"Normalization statistics file not found: {stats_file}")
-
-    with open(stats_file, "r") as f:
-        stats_json = json.load(f)
+    stats_json = _load_stats_json(stats_file, "Normalization")
 
     # Convert from JSON format to tuple format for target variables only
     norm_stats = {}
@@ -108,7 +243,6 @@ def load_normalization_stats(
         else:
             raise ValueError(f"Normalization statistics not found for variable: {var_name}")
 
-    print(f"Loaded normalization statistics for {len(norm_stats)} target variables")
     return norm_stats
 
 
@@ -138,29 +272,237 @@ def normalize_tensor(
     return (tensor - mean) / std
 
 
+def _compact_tensor(tensor: torch.Tensor) -> torch.Tensor:
+    # Views into a larger storage (cube slices) are copied; exactly sized tensors are kept
+    if tensor.untyped_storage().nbytes() == tensor.numel() * tensor.element_size():
+        return tensor
+    return tensor.clone()
+
+
+def _compact_batch(batch: Batch) -> Batch:
+    """Make every tensor of an Aurora batch own exactly sized storage."""
+
+    def compact(tensors: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        return {name: _compact_tensor(tensor) for name, tensor in tensors.items()}
+
+    metadata = batch.metadata
+    return Batch(
+        surf_vars=compact(batch.surf_vars),
+        static_vars=compact(batch.static_vars),
+        atmos_vars=compact(batch.atmos_vars),
+        metadata=Metadata(
+            lat=_compact_tensor(metadata.lat),
+            lon=_compact_tensor(metadata.lon),
+            time=metadata.time,
+            atmos_levels=metadata.atmos_levels,
+            rollout_step=metadata.rollout_step,
+        ),
+    )
+
+
+def _stack_batches(batches: list[Batch]) -> Batch:
+    """
+    Stack Aurora batches along the leading batch dimension.
+
+    Static variables and lat/lon are shared by all samples of one grid and are taken from the
+    first batch; metadata time becomes the concatenation of the batches' times.
+
+    Raises:
+        ValueError: If the batches do not share grid coordinates and pressure levels
+    """
+    first = batches[0]
+    metadata = first.metadata
+    for batch in batches[1:]:
+        other = batch.metadata
+        if (
+            other.atmos_levels != metadata.atmos_levels
+            or not torch.equal(other.lat, metadata.lat)
+            or not torch.equal(other.lon, metadata.lon)
+        ):
+            raise ValueError(
+                "Cannot stack Aurora batches with different lat/lon grids or pressure levels; "
+                "use batch_size=1 for mixed-region datasets."
+            )
+
+    def stack(group: str) -> dict[str, torch.Tensor]:
+        names = getattr(first, group)
+        return {name: torch.cat([getattr(b, group)[name] for b in batches]) for name in names}
+
+    return Batch(
+        surf_vars=stack("surf_vars"),
+        static_vars=dict(first.static_vars),
+        atmos_vars=stack("atmos_vars"),
+        metadata=Metadata(
+            lat=metadata.lat,
+            lon=metadata.lon,
+            time=tuple(time for batch in batches for time in batch.metadata.time),
+            atmos_levels=metadata.atmos_levels,
+            rollout_step=metadata.rollout_step,
+        ),
+    )
+
+
 def _collate_aurora_batch_objects(batch_list):
     """
     Custom collator  function for Pytorch DataLoader creation, specifically for collating Aurora
     batch data objects.
+
+    Samples are stacked along the leading batch dimension of the Aurora Batch tensors, so all
+    samples in a batch must come from the same grid. In a worker process, batches are compacted
+    before they are sent to the main process: samples are views into (possibly memory-mapped)
+    variable cubes, and a view is transferred through shared memory together with its whole
+    underlying storage.
+
+    Samples of an IndexedDataset yield (input_batch, target_batch, indices), with the sample
+    indices as a tuple.
     """
-    if len(batch_list) != 1:
-        raise ValueError(
-            f"Only batch_size=1 is supported for Aurora Batch objects, got "
-            f"{len(batch_list)} samples instead."
-        )
-    return batch_list[0]
+    if len(batch_list) == 1:
+        input_batch, target_batch = batch_list[0][:2]
+    else:
+        input_batch = _stack_batches([sample[0] for sample in batch_list])
+        target_batch = _stack_batches([sample[1] for sample in batch_list])
+    if get_worker_info() is not None:
+        input_batch, target_batch = _compact_batch(input_batch), _compact_batch(target_batch)
+    if len(batch_list[0]) == 3:
+        return input_batch, target_batch, tuple(sample[2] for sample in batch_list)
+    return input_batch, target_batch
+
+
+VALIDATION_SUBSET_STRATEGIES = ("random", "stratified")
 
 
-def create_dataloader(data_pairs: list[SupervisedTrainingDataPair]) -> DataLoader:
+class ValidationSubsetSampler(DistributedSampler):
     """
-    Create a DataLoader for the given given dataset (in the form of a list of training pairs)
+    Sampler that visits a fixed-size subset of the validation samples, or all of them.
+
+    While full_pass is False, every iteration draws a new subset of subset_size samples:
+    - "random": uniformly without replacement
+    - "stratified": one random sample from each of subset_size equal runs of consecutive
+      samples (consecutive time periods, since samples are in time order)
+    Draws are seeded from seed and the number of previous draws, so every data-parallel
+    process draws the same subset. With full_pass set, every sample is visited.
+
+    Samples are split between data-parallel processes by the sampler itself. It is a
+    DistributedSampler, so Lightning uses it as it is instead of wrapping it in one, which
+    would fix the samples of every iteration at construction.
+    """
+
+    def __init__(
+        self, dataset: Dataset, subset_size: int, strategy: str = "random", seed: int = 0
+    ):
+        """
+        Args:
+            dataset: Validation dataset
+            subset_size: Samples per subset draw (at least 1)
+            strategy: Subset strategy, one of VALIDATION_SUBSET_STRATEGIES
+            seed: Seed of the subset draws
+
+        Raises:
+            ValueError: If subset_size is below 1 or the strategy is unknown
+        """
+        if subset_size < 1:
+            raise ValueError(f"subset_size must be at least 1, got {subset_size}")
+        if strategy not in VALIDATION_SUBSET_STRATEGIES:
+            raise ValueError(
+                f"Invalid validation subset strategy: {strategy}. "
+                f"Must be one of: {', '.join(VALIDATION_SUBSET_STRATEGIES)}"
+            )
+        # The process group is looked up per iteration, since it is set up after construction
+        super().__init__(dataset, num_replicas=1, rank=0, shuffle=False)
+        self.subset_size = subset_size
+        self.strategy = strategy
+        self.subset_seed = seed
+        self.full_pass = False
+        self._draws = 0
+
+    @staticmethod
+    def _process_group() -> tuple[int, int]:
+        """Return (number of processes, rank) of the data-parallel run."""
+        if torch.distributed.is_available() and torch.distributed.is_initialized():
+            return torch.distributed.get_world_size(), torch.distributed.get_rank()
+        return 1, 0
+
+    def _n_samples(self) -> int:
+        """Samples visited by one iteration, over all processes."""
+        n_samples = len(self.dataset)
+        return n_samples if self.full_pass else min(self.subset_size, n_samples)
+
+    def _subset_indices(self) -> list[int]:
+        n_samples = len(self.dataset)
+        generator = torch.Generator().manual_seed(self.subset_seed + self._draws)
+        self._draws += 1
+        if self.strategy == "random":
+            subset = torch.randperm(n_samples, generator=generator)[: self.subset_size]
+            return sorted(subset.tolist())
+        bounds = [n_samples * i // self.subset_size for i in range(self.subset_size + 1)]
+        return [
+            start + int(torch.randint(end - start, (), generator=generator))
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def __iter__(self):
+        n_samples = len(self.dataset)
+        if self.full_pass or self.subset_size >= n_samples:
+            indices = list(range(n_samples))
+        else:
+            indices = self._subset_indices()
+        n_processes, rank = self._process_group()
+        # Pad by cycling the samples so every process gets the same number, as DistributedSampler
+        total = math.ceil(len(indices) / n_processes) * n_processes
+        if indices:
+            indices = (indices * math.ceil(total / len(indices)))[:total]
+        return iter(indices[rank:total:n_processes])
+
+    def __len__(self) -> int:
+        n_processes, _ = self._process_group()
+        return math.ceil(self._n_samples() / n_processes)
+
+
+def create_dataloader(
+    data: list[SupervisedTrainingDataPair] | Dataset,
+    batch_size: int = 1,
+    num_workers: int = 0,
+    prefetch_factor: int = 2,
+    persistent_workers: bool = True,
+    shuffle: bool = True,
+    pin_memory: bool = False,
+    sampler: Sampler | None = None,
+) -> DataLoader:
+    """
+    Create a DataLoader for the given dataset, either a list of training pairs (wrapped in an
+    ERA5Dataset) or a ready-made Dataset such as LazyERA5Dataset
+
+    Args:
+        data: Training pairs or Dataset yielding (input_batch, target_batch)
+        batch_size: Samples stacked into each Aurora Batch (all from the same grid)
+        num_workers: Worker processes building samples in parallel with the training step
+            (0 builds them in the main process)
+        prefetch_factor: Samples loaded in advance by each worker (ignored without workers)
+        persistent_workers: Keep workers alive between epochs (ignored without workers)
+        shuffle: Reshuffle samples every epoch (disable for evaluation)
+        pin_memory: Return batches in page-locked memory for faster copies to a CUDA device
+        sampler: Sampler choosing the samples of each epoch, e.g. ValidationSubsetSampler
+            (replaces shuffle)
+
+    Returns:
+        DataLoader yielding (input_batch, target_batch)
     """
-    dataset = ERA5Dataset(data_pairs)
+    dataset = data if isinstance(data, Dataset) else ERA5Dataset(data)
+    worker_kwargs = {}
+    if num_workers > 0:
+        # Workers receive the dataset by pickling: LazyERA5Dataset sends only its index
+        worker_kwargs = {
+            "prefetch_factor": prefetch_factor,
+            "persistent_workers": persistent_workers,
+        }
     dataloader = DataLoader(
         dataset,
-        batch_size=1,
-        shuffle=True,
-        num_workers=0,
+        batch_size=batch_size,
+        shuffle=shuffle and sampler is None,
+        sampler=sampler,
+        num_workers=num_workers,
+        pin_memory=pin_memory,
         collate_fn=_collate_aurora_batch_objects,
+        **worker_kwargs,
     )
     return dataloader
@@ -1,5 +1,8 @@
 """Extract training data from ERA5 GRIB files for Aurora fine-tuning."""
 
+import dataclasses
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -8,7 +11,8 @@ import pygrib
 import torch
 from aurora import Batch, Metadata
 
-from vibe_tune_aurora.types import SupervisedTrainingDataPair
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.types import GribCubes, GribSelection, SupervisedTrainingDataPair
 
 
 def _crop_to_patch_size(tensor: torch.Tensor, patch_size: int) -> torch.Tensor:
@@ -23,7 +27,7 @@ def _crop_to_patch_size(tensor: torch.Tensor, patch_size: int) -> torch.Tensor:
         patch_size: Patch size to make dimensions compatible with
 
     Returns:
-        Cropped tensor with spatial dimensions as multiples of patch_size
+        Cropped tensor (a view of the input) with spatial dimensions as multiples of patch_size
     """
     if len(tensor.shape) < 2:
         return tensor
@@ -35,91 +39,198 @@ def _crop_to_patch_size(tensor: torch.Tensor, patch_size: int) -> torch.Tensor:
     if new_height == height and new_width == width:
         return tensor
 
-    # Crop based on tensor dimensionality
-    if len(tensor.shape) == 2:  # (height, width)
-        return tensor[:new_height, :new_width]
-    elif len(tensor.shape) == 4:  # (batch, time, height, width)
-        return tensor[:, :, :new_height, :new_width]
-    elif len(tensor.shape) == 5:  # (batch, time, levels, height, width)
-        return tensor[:, :, :, :new_height, :new_width]
+    return tensor[..., :new_height, :new_width]
 
-    return tensor
 
+def _selects_message(grb, selection: GribSelection, pressure_level_file: bool) -> bool:
+    """Check a message's header keys against the selection, without decoding its values."""
+    if selection.short_names is not None and grb.shortName not in selection.short_names:
+        return False
+    if pressure_level_file and selection.levels is not None and grb.level not in selection.levels:
+        return False
+    if selection.start_time is not None or selection.end_time is not None:
+        valid_time = grb.validDate
+        if selection.start_time is not None and valid_time < selection.start_time:
+            return False
+        if selection.end_time is not None and valid_time > selection.end_time:
+            return False
+    return True
 
-def extract_raw_data_from_grib_files(
-    single_level_file: Path,
-    pressure_level_file: Path,
-) -> dict[str, dict | list | np.ndarray]:
+
+def _window_slices(
+    lats: np.ndarray, lons: np.ndarray, selection: GribSelection
+) -> tuple[slice, slice]:
     """
-    Load ERA5 GRIB files into structured dictionaries.
+    Return the (row, column) slices of a regular lat/lon grid covering the selection window.
+
+    Raises:
+        ValueError: If the window contains no grid points
+    """
+    rows = slice(None)
+    cols = slice(None)
+    if selection.lat_range is not None:
+        lat_min, lat_max = selection.lat_range
+        inside = np.flatnonzero((lats[:, 0] >= lat_min) & (lats[:, 0] <= lat_max))
+        if inside.size == 0:
+            raise ValueError(f"Latitude range {selection.lat_range} contains no grid points")
+        rows = slice(inside[0], inside[-1] + 1)
+    if selection.lon_range is not None:
+        grid_lons = lons[0, :] % 360
+        lon_min, lon_max = (lon % 360 for lon in selection.lon_range)
+        if lon_min <= lon_max:
+            mask = (grid_lons >= lon_min) & (grid_lons <= lon_max)
+        else:  # Window crosses the 0/360 meridian
+            mask = (grid_lons >= lon_min) | (grid_lons <= lon_max)
+        inside = np.flatnonzero(mask)
+        if inside.size == 0:
+            raise ValueError(f"Longitude range {selection.lon_range} contains no grid points")
+        cols = slice(inside[0], inside[-1] + 1)
+    return rows, cols
+
+
+# One unit of decoding work: (path, selection, is pressure-level file, first message, count)
+GribReadTask = tuple[Path, GribSelection, bool, int, int | None]
+
+
+def _read_grib_messages(
+    path: Path,
+    selection: GribSelection,
+    pressure_level_file: bool,
+    first_message: int = 0,
+    n_messages: int | None = None,
+) -> dict:
+    """
+    Decode the selected messages of one GRIB file, optionally only a message range.
+
+    Module-level so it can run in worker processes. Fields are keyed by valid time for
+    single-level files and by (valid time, level) for pressure-level files.
 
     Args:
-        single_level_file: Path to single-level GRIB file
-        pressure_level_file: Path to pressure-level GRIB file
+        path: GRIB file
+        selection: Messages and sub-window to decode
+        pressure_level_file: Whether the file holds pressure-level messages
+        first_message: Index of the first message to read
+        n_messages: Number of messages to read. Default: None (to the end of the file)
 
     Returns:
-        Dict with keys:
-        - surf_data: Dict mapping variable name -> time -> 2D array
-        - atmos_data: Dict mapping variable name -> (time, pressure) -> 2D array
-        - sorted_times: List of datetime objects in chronological order
-        - lats: 2D coordinate array for latitudes
-        - lons: 2D coordinate array for longitudes
-        - pressure_levels: List of pressure levels in descending order (high to low)
+        Dict with keys fields, times, pressure_levels, lats, lons (None if nothing was decoded)
+        and skipped (number of unselected messages)
     """
-    if not single_level_file.exists():
-        raise FileNotFoundError(f"Single-level file not found: {single_level_file}")
-    if not pressure_level_file.exists():
-        raise FileNotFoundError(f"Pressure-level file not found: {pressure_level_file}")
-
-    surf_data: dict[str, dict[datetime, np.ndarray]] = {}
-    atmos_data: dict[str, dict[tuple[datetime, int], np.ndarray]] = {}
+    fields: dict[str, dict] = {}
     times: set[datetime] = set()
     pressure_levels: set[int] = set()
     lats: np.ndarray | None = None
     lons: np.ndarray | None = None
+    window = (slice(None), slice(None))
+    skipped = 0
+
+    grbs = pygrib.open(str(path))
+    try:
+        if first_message:
+            grbs.seek(first_message)
+        messages = grbs if n_messages is None else grbs.read(n_messages)
+        for grb in messages:
+            if not _selects_message(grb, selection, pressure_level_file):
+                skipped += 1
+                continue
+            if lats is None:
+                lats, lons = grb.latlons()
+                window = _window_slices(lats, lons, selection)
+                lats, lons = lats[window], lons[window]
+
+            valid_time = grb.validDate
+            times.add(valid_time)
+            key = valid_time
+            if pressure_level_file:
+                pressure_levels.add(grb.level)
+                key = (valid_time, grb.level)
+            # Copy the window so the full decoded field can be freed
+            fields.setdefault(grb.shortName, {})[key] = np.array(grb.values[window])
+    finally:
+        grbs.close()
 
-    # Load single-level data
-    print(f"Loading single-level GRIB: {single_level_file}")
-    grbs_surf = pygrib.open(str(single_level_file))
-    for grb in grbs_surf:
-        param_name = grb.shortName
-        valid_time = grb.validDate
-        times.add(valid_time)
-
-        if lats is None:
-            lats, lons = grb.latlons()
-
-        if param_name not in surf_data:
-            surf_data[param_name] = {}
-        surf_data[param_name][valid_time] = grb.values
-
-    grbs_surf.close()
-
-    # Load pressure-level data
-    print(f"Loading pressure-level GRIB: {pressure_level_file}")
-    grbs_atmos = pygrib.open(str(pressure_level_file))
-    for grb in grbs_atmos:
-        param_name = grb.shortName
-        valid_time = grb.validDate
-        pressure_level = grb.level
-        times.add(valid_time)
-        pressure_levels.add(pressure_level)
-
-        if param_name not in atmos_data:
-            atmos_data[param_name] = {}
+    return {
+        "fields": fields,
+        "times": times,
+        "pressure_levels": pressure_levels,
+        "lats": lats,
+        "lons": lons,
+        "skipped": skipped,
+    }
 
-        atmos_data[param_name][(valid_time, pressure_level)] = grb.values
 
-    grbs_atmos.close()
+def _plan_grib_reads(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    selection: GribSelection,
+    shards_per_file: int = 1,
+) -> list[GribReadTask]:
+    """Split decoding of a file pair into tasks; single-level tasks come first."""
+    tasks: list[GribReadTask] = []
+    for path, is_pressure_level in ((single_level_file, False), (pressure_level_file, True)):
+        if shards_per_file <= 1:
+            tasks.append((path, selection, is_pressure_level, 0, None))
+            continue
+        grbs = pygrib.open(str(path))
+        n_total = grbs.messages
+        grbs.close()
+        shard_size = -(-n_total // shards_per_file)
+        for first in range(0, n_total, shard_size):
+            tasks.append(
+                (path, selection, is_pressure_level, first, min(shard_size, n_total - first))
+            )
+    return tasks
+
+
+def _run_grib_reads(tasks: list[GribReadTask], workers: int) -> list[dict]:
+    """Run read tasks serially or on a process pool, returning results in task order."""
+    if workers <= 1 or len(tasks) <= 1:
+        return [_read_grib_messages(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(_read_grib_messages, *zip(*tasks)))
+
+
+def _merge_grib_reads(reads: list[dict]) -> dict:
+    """Combine the results of the read tasks of one file pair."""
+    merged = {"fields": {}, "times": set(), "pressure_levels": set(), "skipped": 0}
+    merged["lats"] = merged["lons"] = None
+    for read in reads:
+        for name, values in read["fields"].items():
+            merged["fields"].setdefault(name, {}).update(values)
+        merged["times"] |= read["times"]
+        merged["pressure_levels"] |= read["pressure_levels"]
+        merged["skipped"] += read["skipped"]
+        if merged["lats"] is None:
+            merged["lats"], merged["lons"] = read["lats"], read["lons"]
+    return merged
+
+
+def _assemble_raw_grib_data(
+    single_level_reads: list[dict], pressure_level_reads: list[dict], selection: GribSelection
+) -> dict[str, dict | list | np.ndarray]:
+    """Build the extract_raw_data_from_grib_files result from per-task reads."""
+    surf = _merge_grib_reads(single_level_reads)
+    atmos = _merge_grib_reads(pressure_level_reads)
+    surf_data = surf["fields"]
+    atmos_data = atmos["fields"]
+    times = surf["times"] | atmos["times"]
+
+    if not times:
+        raise ValueError(f"No GRIB messages match the selection {selection}")
+    skipped = surf["skipped"] + atmos["skipped"]
+    if skipped:
+        print(f"Skipped {skipped} GRIB messages outside the selection")
 
     sorted_times = sorted(times)
-    sorted_pressure_levels = sorted(pressure_levels, reverse=True)
+    sorted_pressure_levels = sorted(atmos["pressure_levels"], reverse=True)
 
     print(f"Loaded {len(sorted_times)} timesteps from {sorted_times[0]} to {sorted_times[-1]}")
     print(f"Surface variables: {sorted(surf_data.keys())}")
     print(f"Atmospheric variables: {sorted(atmos_data.keys())}")
     print(f"Pressure levels: {sorted_pressure_levels}")
 
+    lats = surf["lats"] if surf["lats"] is not None else atmos["lats"]
+    lons = surf["lons"] if surf["lons"] is not None else atmos["lons"]
     if lats is None or lons is None:
         raise ValueError("Failed to extract lat/lon coordinates from GRIB files")
 
@@ -133,145 +244,319 @@ def extract_raw_data_from_grib_files(
     }
 
 
-def _create_batch(
+def _shards_per_file(workers: int, n_files: int) -> int:
+    # Shard files by message range only once there are more workers than files
+    return max(1, -(-workers // n_files))
+
+
+def extract_raw_data_from_grib_files(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    selection: GribSelection | None = None,
+    workers: int = 1,
+) -> dict[str, dict | list | np.ndarray]:
+    """
+    Load ERA5 GRIB files into structured dictionaries.
+
+    Messages are filtered on their header keys (shortName, level, validDate) before any field is
+    decoded, so unselected messages cost only a header read. Selected fields are cut down to the
+    lat/lon sub-window right after decoding, so only the window is kept in memory.
+
+    With workers > 1 the single-level and pressure-level files are decoded in parallel worker
+    processes. With more workers than files, each file is also split into message ranges.
+
+    Args:
+        single_level_file: Path to single-level GRIB file
+        pressure_level_file: Path to pressure-level GRIB file
+        selection: Messages and sub-window to decode. Default: None (decode everything)
+        workers: Decoding processes. Default: 1 (decode serially in this process)
+
+    Returns:
+        Dict with keys:
+        - surf_data: Dict mapping variable name -> time -> 2D array
+        - atmos_data: Dict mapping variable name -> (time, pressure) -> 2D array
+        - sorted_times: List of datetime objects in chronological order
+        - lats: 2D coordinate array for latitudes
+        - lons: 2D coordinate array for longitudes
+        - pressure_levels: List of pressure levels in descending order (high to low)
+    """
+    if not single_level_file.exists():
+        raise FileNotFoundError(f"Single-level file not found: {single_level_file}")
+    if not pressure_level_file.exists():
+        raise FileNotFoundError(f"Pressure-level file not found: {pressure_level_file}")
+    if selection is None:
+        selection = GribSelection()
+
+    print(f"Loading single-level GRIB: {single_level_file}")
+    print(f"Loading pressure-level GRIB: {pressure_level_file}")
+    tasks = _plan_grib_reads(
+        single_level_file, pressure_level_file, selection, _shards_per_file(workers, 2)
+    )
+    reads = _run_grib_reads(tasks, workers)
+    n_single = sum(1 for task in tasks if not task[2])
+    return _assemble_raw_grib_data(reads[:n_single], reads[n_single:], selection)
+
+
+# Aurora variable name -> GRIB shortName
+SURF_VAR_NAMES = {
+    "2t": "2t",  # 2-meter temperature
+    "10u": "10u",  # 10-meter u-wind
+    "10v": "10v",  # 10-meter v-wind
+    "msl": "msl",  # Mean sea level pressure
+}
+STATIC_VAR_NAMES = {"lsm": "lsm", "z": "z", "slt": "slt"}  # land-sea mask, geopotential, soil
+ATMOS_VAR_NAMES = {
+    "t": "t",  # Temperature
+    "u": "u",  # Eastward wind
+    "v": "v",  # Northward wind
+    "q": "q",  # Specific humidity
+    "z": "z",  # Geopotential
+}
+# Every GRIB shortName that ends up in the cubes
+MODEL_SHORT_NAMES = tuple(
+    dict.fromkeys(
+        [*SURF_VAR_NAMES.values(), *STATIC_VAR_NAMES.values(), *ATMOS_VAR_NAMES.values()]
+    )
+)
+
+
+def model_selection(selection: GribSelection | None = None) -> GribSelection:
+    """
+    Restrict a selection to the GRIB variables the model uses.
+
+    Variables outside MODEL_SHORT_NAMES (e.g. tcc, tclw) are never decoded when building cubes.
+    Levels, time range and sub-window are kept from the given selection.
+    """
+    if selection is None:
+        selection = GribSelection()
+    return dataclasses.replace(selection, short_names=MODEL_SHORT_NAMES)
+
+
+def _stack_surface_variable(
+    fields: dict[datetime, np.ndarray], timesteps: list[datetime], grib_name: str
+) -> np.ndarray:
+    """Stack one surface variable's 2D fields into a (T, H, W) float32 array."""
+    missing = [time for time in timesteps if time not in fields]
+    if missing:
+        raise ValueError(f"Missing timestep {missing[0]} for variable '{grib_name}'")
+    return np.stack([np.asarray(fields[time]) for time in timesteps]).astype(
+        np.float32, copy=False
+    )
+
+
+def _stack_atmospheric_variable(
+    fields: dict[tuple[datetime, int], np.ndarray],
+    timesteps: list[datetime],
+    pressure_levels: list[int],
+    grib_name: str,
+) -> np.ndarray:
+    """Stack one atmospheric variable's 2D fields into a (T, L, H, W) float32 array."""
+    keys = [(time, pressure) for time in timesteps for pressure in pressure_levels]
+    for time, pressure in keys:
+        if (time, pressure) not in fields:
+            raise ValueError(
+                f"Missing timestep {time} at pressure {pressure} for variable '{grib_name}'"
+            )
+    stacked = np.stack([np.asarray(fields[key]) for key in keys]).astype(np.float32, copy=False)
+    return stacked.reshape(len(timesteps), len(pressure_levels), *stacked.shape[1:])
+
+
+def _build_variable_cubes(
     surf_data: dict[str, dict[datetime, np.ndarray]],
     atmos_data: dict[str, dict[tuple[datetime, int], np.ndarray]],
     timesteps: list[datetime],
     lats: np.ndarray,
     lons: np.ndarray,
     pressure_levels: list[int],
-    current_time: datetime,
     patch_size: int,
-) -> Batch:
+) -> GribCubes:
     """
-    Create Aurora Batch from specified timesteps.
+    Stack every variable across time (and pressure) once, then crop and flip once.
+
+    Entries of surf_data and atmos_data are popped as each variable is stacked, so the raw
+    per-field arrays can be freed while the cubes are being built (keeping peak memory close
+    to one copy of the data).
 
     Args:
         surf_data: Surface variable data dict: Dict mapping variable name -> time -> 2D array
         atmos_data: Atmospheric variable data dict: Dict mapping variable name ->
             (time, pressure) -> 2D array
-        timesteps: List of timesteps to include in batch
+        timesteps: Timesteps to include, in chronological order
         lats: Latitude coordinates (2D array)
         lons: Longitude coordinates (2D array)
         pressure_levels: List of pressure levels
-        current_time: Current timestep for metadata
         patch_size: Patch size for cropping
 
     Returns:
-        Aurora Batch object with cropped dimensions
+        GribCubes holding cropped, correctly oriented tensors
     """
-    height, width = lats.shape
-    surf_vars: dict[str, torch.Tensor] = {}
-    static_vars: dict[str, torch.Tensor] = {}
-    atmos_vars: dict[str, torch.Tensor] = {}
-
-    # Surface variables to extract
-    surf_var_names = {
-        "2t": "2t",  # 2-meter temperature
-        "10u": "10u",  # 10-meter u-wind
-        "10v": "10v",  # 10-meter v-wind
-        "msl": "msl",  # Mean sea level pressure
-    }
-
-    # Extract surface variables
-    for aurora_name, grib_name in surf_var_names.items():
+    for grib_name in SURF_VAR_NAMES.values():
         if grib_name not in surf_data:
             raise ValueError(f"Required surface variable '{grib_name}' not found in GRIB data")
-
-        data_tensor = torch.zeros(1, len(timesteps), height, width)
-        for t_idx, time in enumerate(timesteps):
-            if time not in surf_data[grib_name]:
-                raise ValueError(f"Missing timestep {time} for variable '{grib_name}'")
-            data_tensor[0, t_idx, :, :] = torch.from_numpy(surf_data[grib_name][time])
-
-        surf_vars[aurora_name] = data_tensor
-
-    # Static variables (land-sea mask, geopotential, soil type)
-    static_var_names = {"lsm": "lsm", "z": "z", "slt": "slt"}
-
-    for aurora_name, grib_name in static_var_names.items():
-        if grib_name in surf_data:
-            # Use first available timestep
-            for time in timesteps:
-                if time in surf_data[grib_name]:
-                    static_vars[aurora_name] = torch.from_numpy(surf_data[grib_name][time])
-                    break
-
-    # Atmospheric variables
-    atmos_var_names = {
-        "t": "t",  # Temperature
-        "u": "u",  # Eastward wind
-        "v": "v",  # Northward wind
-        "q": "q",  # Specific humidity
-        "z": "z",  # Geopotential
-    }
-
-    for aurora_name, grib_name in atmos_var_names.items():
+    for grib_name in ATMOS_VAR_NAMES.values():
         if grib_name not in atmos_data:
             raise ValueError(f"Required atmospheric variable '{grib_name}' not found in GRIB data")
 
-        data_tensor = torch.zeros(1, len(timesteps), len(pressure_levels), height, width)
-        for t_idx, time in enumerate(timesteps):
-            for p_idx, pressure in enumerate(pressure_levels):
-                key = (time, pressure)
-                if key not in atmos_data[grib_name]:
-                    raise ValueError(
-                        f"Missing timestep {time} at pressure {pressure} for variable '{grib_name}'"
-                    )
-                data_tensor[0, t_idx, p_idx, :, :] = torch.from_numpy(atmos_data[grib_name][key])
-
-        atmos_vars[aurora_name] = data_tensor
+    surf_vars: dict[str, torch.Tensor] = {}
+    static_vars: dict[str, torch.Tensor] = {}
+    atmos_vars: dict[str, torch.Tensor] = {}
 
-    # Crop all variables to patch-compatible size
-    for var_name in surf_vars:
-        surf_vars[var_name] = _crop_to_patch_size(surf_vars[var_name], patch_size)
+    # Static variables: use the first available timestep
+    for aurora_name, grib_name in STATIC_VAR_NAMES.items():
+        fields = surf_data.get(grib_name, {})
+        for time in timesteps:
+            if time in fields:
+                static_vars[aurora_name] = torch.from_numpy(np.asarray(fields[time]))
+                break
+
+    for aurora_name, grib_name in SURF_VAR_NAMES.items():
+        fields = surf_data.pop(grib_name)
+        surf_vars[aurora_name] = torch.from_numpy(
+            _stack_surface_variable(fields, timesteps, grib_name)
+        )
+        del fields
 
-    for var_name in static_vars:
-        static_vars[var_name] = _crop_to_patch_size(static_vars[var_name], patch_size)
+    for aurora_name, grib_name in ATMOS_VAR_NAMES.items():
+        fields = atmos_data.pop(grib_name)
+        atmos_vars[aurora_name] = torch.from_numpy(
+            _stack_atmospheric_variable(fields, timesteps, pressure_levels, grib_name)
+        )
+        del fields
 
-    for var_name in atmos_vars:
-        atmos_vars[var_name] = _crop_to_patch_size(atmos_vars[var_name], patch_size)
+    # Crop all variables to patch-compatible size (views, no copy)
+    for var_dict in (surf_vars, static_vars, atmos_vars):
+        for var_name in var_dict:
+            var_dict[var_name] = _crop_to_patch_size(var_dict[var_name], patch_size)
 
     # Crop coordinates to match data
-    if len(surf_vars) > 0:
-        sample_var = next(iter(surf_vars.values()))
-        new_height, new_width = sample_var.shape[-2:]
-        lats = lats[:new_height, :new_width]
-        lons = lons[:new_height, :new_width]
+    new_height, new_width = next(iter(surf_vars.values())).shape[-2:]
+    lats = lats[:new_height, :new_width]
+    lons = lons[:new_height, :new_width]
 
-    # Create metadata with proper coordinate ordering
     lat_1d = torch.from_numpy(lats[:, 0])  # First column
     # If data shows increasing latitudes, reverse it because a larger latitude index in the matrix
-    # (tensor) should correspond to lower latitude value
+    # (tensor) should correspond to lower latitude value. The flip copies each cube exactly once.
     if lat_1d[0] < lat_1d[-1]:
         lat_1d = torch.flip(lat_1d, [0])
-        # Flip all data arrays
-        for key in surf_vars:
-            surf_vars[key] = torch.flip(surf_vars[key], [2])
-        for key in static_vars:
-            static_vars[key] = torch.flip(static_vars[key], [0])
-        for key in atmos_vars:
-            atmos_vars[key] = torch.flip(atmos_vars[key], [3])
+        for var_dict in (surf_vars, static_vars, atmos_vars):
+            for var_name in var_dict:
+                var_dict[var_name] = torch.flip(var_dict[var_name], [-2])
+    else:
+        # Materialize cropped views so pairs do not keep the uncropped storage alive
+        for var_dict in (surf_vars, static_vars, atmos_vars):
+            for var_name in var_dict:
+                var_dict[var_name] = var_dict[var_name].contiguous()
 
     lon_1d = torch.from_numpy(lons[0, :])  # First row
     if lon_1d.min() < 0:  # Convert [-180, 180] to [0, 360)
         lon_1d = torch.where(lon_1d < 0, lon_1d + 360, lon_1d)
 
-    metadata = Metadata(
+    return GribCubes(
+        surf_vars=surf_vars,
+        static_vars=static_vars,
+        atmos_vars=atmos_vars,
+        times=list(timesteps),
         lat=lat_1d,
         lon=lon_1d,
-        time=(current_time,),
-        atmos_levels=tuple(pressure_levels),
+        pressure_levels=list(pressure_levels),
     )
 
+
+def _batch_from_cubes(cubes: GribCubes, start: int, stop: int, current_time: datetime) -> Batch:
+    """
+    Create an Aurora Batch covering cube time indices [start, stop).
+
+    Variable tensors are views into the cubes (with a leading batch dimension of 1) and static
+    variables and coordinates are shared, so no field data is copied.
+
+    Args:
+        cubes: Variable cubes built by _build_variable_cubes
+        start: First time index (inclusive)
+        stop: Last time index (exclusive)
+        current_time: Current timestep for metadata
+
+    Returns:
+        Aurora Batch object
+    """
     return Batch(
-        surf_vars=surf_vars,
-        static_vars=static_vars,
-        atmos_vars=atmos_vars,
-        metadata=metadata,
+        surf_vars={name: cube[None, start:stop] for name, cube in cubes.surf_vars.items()},
+        static_vars=cubes.static_vars,
+        atmos_vars={name: cube[None, start:stop] for name, cube in cubes.atmos_vars.items()},
+        metadata=Metadata(
+            lat=cubes.lat,
+            lon=cubes.lon,
+            time=(current_time,),
+            atmos_levels=tuple(cubes.pressure_levels),
+        ),
+    )
+
+
+def pair_time_indices(n_times: int, skip_first_n_timesteps: int) -> range:
+    """
+    Return the cube time index of the "current" timestep t for every training pair.
+
+    Pair k uses timesteps [t-1, t] as input and [t+1] as target, with t = result[k].
+
+    Args:
+        n_times: Number of timesteps in the cubes
+        skip_first_n_timesteps: Number of initial timesteps to skip
+
+    Raises:
+        ValueError: If the skip is too large or fewer than 3 timesteps remain
+    """
+    # Skip first N timesteps if requested
+    if skip_first_n_timesteps > 0:
+        if skip_first_n_timesteps >= n_times:
+            raise ValueError(
+                f"Cannot skip {skip_first_n_timesteps} timesteps from {n_times} total"
+            )
+        print(f"Skipping first {skip_first_n_timesteps} timesteps")
+
+    n_timesteps = n_times - skip_first_n_timesteps
+    n_pairs = n_timesteps - 2  # Need 3 consecutive timesteps per pair
+
+    if n_pairs <= 0:
+        raise ValueError(f"Need at least 3 timesteps to create training pairs, got {n_timesteps}")
+
+    print(f"Generating {n_pairs} training pairs from {n_timesteps} timesteps")
+    return range(skip_first_n_timesteps + 1, n_times - 1)
+
+
+def pair_from_cubes(cubes: GribCubes, time_index: int) -> SupervisedTrainingDataPair:
+    """Build the training pair centred on cube time index time_index (see pair_time_indices)."""
+    i = time_index
+    return SupervisedTrainingDataPair(
+        # Input batch: [previous, current]
+        input_batch=_batch_from_cubes(cubes, i - 1, i + 1, cubes.times[i]),
+        # Target batch: [next]
+        target_batch=_batch_from_cubes(cubes, i + 1, i + 2, cubes.times[i + 1]),
     )
 
 
+def _pairs_from_cubes(
+    cubes: GribCubes, skip_first_n_timesteps: int
+) -> list[SupervisedTrainingDataPair]:
+    """
+    Slice training pairs out of variable cubes.
+
+    Each training pair consists of:
+    - Input batch: 2 consecutive timesteps [t-1, t]
+    - Target batch: 1 next timestep [t+1]
+
+    Pairs hold views into the cubes and share static variables, so overlapping timesteps are
+    stored once. Do not modify pair tensors in place, as neighbouring pairs see the same memory.
+
+    Args:
+        cubes: Variable cubes covering all timesteps
+        skip_first_n_timesteps: Number of initial timesteps to skip
+
+    Returns:
+        List of SupervisedTrainingDataPair objects with input_batch and target_batch
+    """
+    indices = pair_time_indices(len(cubes.times), skip_first_n_timesteps)
+    return [pair_from_cubes(cubes, i) for i in indices]
+
+
 def _generate_training_pairs(
     surf_data: dict[str, dict[datetime, np.ndarray]],
     atmos_data: dict[str, dict[tuple[datetime, int], np.ndarray]],
@@ -285,13 +570,12 @@ def _generate_training_pairs(
     """
     Generate training pairs from timesteps.
 
-    Each training pair consists of:
-    - Input batch: 2 consecutive timesteps [t-1, t]
-    - Target batch: 1 next timestep [t+1]
+    The data is first stacked into one cube per variable (see _build_variable_cubes), then
+    pairs are sliced out of the cubes (see _pairs_from_cubes).
 
     Args:
-        surf_data: Surface variable data dict
-        atmos_data: Atmospheric variable data dict
+        surf_data: Surface variable data dict (consumed while building the cubes)
+        atmos_data: Atmospheric variable data dict (consumed while building the cubes)
         sorted_times: Sorted list of timesteps
         lats: Latitude coordinates
         lons: Longitude coordinates
@@ -302,62 +586,196 @@ def _generate_training_pairs(
     Returns:
         List of SupervisedTrainingDataPair objects with input_batch and target_batch
     """
-    # Skip first N timesteps if requested
-    if skip_first_n_timesteps > 0:
-        if skip_first_n_timesteps >= len(sorted_times):
-            raise ValueError(
-                f"Cannot skip {skip_first_n_timesteps} timesteps from {len(sorted_times)} total"
-            )
-        print(f"Skipping first {skip_first_n_timesteps} timesteps")
-        sorted_times = sorted_times[skip_first_n_timesteps:]
-
-    n_timesteps = len(sorted_times)
-    n_pairs = n_timesteps - 2  # Need 3 consecutive timesteps per pair
+    cubes = _build_variable_cubes(
+        surf_data, atmos_data, sorted_times, lats, lons, pressure_levels, patch_size
+    )
+    return _pairs_from_cubes(cubes, skip_first_n_timesteps)
 
-    if n_pairs <= 0:
-        raise ValueError(f"Need at least 3 timesteps to create training pairs, got {n_timesteps}")
 
-    print(f"Generating {n_pairs} training pairs from {n_timesteps} timesteps")
+def extract_variable_cubes(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    patch_size: int = 4,
+    cache_dir: Path | None = None,
+    selection: GribSelection | None = None,
+    workers: int = 1,
+) -> GribCubes:
+    """
+    Decode ERA5 GRIB files into cropped per-variable cubes, using the on-disk cache if given.
 
-    training_pairs = []
+    Args:
+        single_level_file: Path to ERA5 single-level GRIB file
+        pressure_level_file: Path to ERA5 pressure-level GRIB file
+        patch_size: Patch size for cropping
+        cache_dir: Cache root directory (see grib_cache). None disables caching.
+        selection: Pressure levels, time range and lat/lon sub-window to decode. Only the
+            variables the model uses are decoded regardless of selection.short_names.
+        workers: GRIB decoding processes (see extract_raw_data_from_grib_files)
 
-    for i in range(1, n_timesteps - 1):
-        prev_time = sorted_times[i - 1]
-        curr_time = sorted_times[i]
-        next_time = sorted_times[i + 1]
+    Returns:
+        GribCubes covering every timestep in the files
 
-        # Input batch: [previous, current]
-        input_batch = _create_batch(
-            surf_data,
-            atmos_data,
-            [prev_time, curr_time],
-            lats,
-            lons,
-            pressure_levels,
-            curr_time,
-            patch_size,
+    Raises:
+        FileNotFoundError: If GRIB files don't exist
+        ValueError: If required variables or timesteps are missing
+    """
+    if cache_dir is not None:
+        entry_dir = cache_variable_cubes(
+            single_level_file, pressure_level_file, patch_size, cache_dir, selection, workers
         )
+        cubes = grib_cache.load_cubes(entry_dir)
+        if cubes is None:
+            raise ValueError(f"Failed to load cached GRIB cubes from {entry_dir}")
+        return cubes
 
-        # Target batch: [next]
-        target_batch = _create_batch(
-            surf_data,
-            atmos_data,
-            [next_time],
-            lats,
-            lons,
-            pressure_levels,
-            next_time,
-            patch_size,
-        )
+    return _decode_variable_cubes(
+        single_level_file, pressure_level_file, patch_size, selection, workers
+    )
 
-        training_pairs.append(
-            SupervisedTrainingDataPair(
-                input_batch=input_batch,
-                target_batch=target_batch,
-            )
-        )
 
-    return training_pairs
+def _cubes_from_raw_data(grib_data: dict, patch_size: int) -> GribCubes:
+    return _build_variable_cubes(
+        grib_data["surf_data"],
+        grib_data["atmos_data"],
+        grib_data["sorted_times"],
+        grib_data["lats"],
+        grib_data["lons"],
+        grib_data["pressure_levels"],
+        patch_size,
+    )
+
+
+def _decode_variable_cubes(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    patch_size: int,
+    selection: GribSelection | None,
+    workers: int = 1,
+) -> GribCubes:
+    grib_data = extract_raw_data_from_grib_files(
+        single_level_file, pressure_level_file, model_selection(selection), workers
+    )
+    return _cubes_from_raw_data(grib_data, patch_size)
+
+
+def _decode_variable_cubes_many(
+    file_pairs: list[tuple[Path, Path]],
+    patch_size: int,
+    selection: GribSelection | None,
+    workers: int,
+) -> Iterator[GribCubes]:
+    """
+    Decode several GRIB file pairs with one process pool, yielding cubes in input order.
+
+    All files (and message ranges of each file, given enough workers) are decoded
+    concurrently; cubes are then assembled one pair at a time in this process.
+    """
+    selection = model_selection(selection)
+    shards = _shards_per_file(workers, 2 * len(file_pairs))
+    plans = []
+    for single_level_file, pressure_level_file in file_pairs:
+        print(f"Loading GRIB pair: {single_level_file}, {pressure_level_file}")
+        plans.append(_plan_grib_reads(single_level_file, pressure_level_file, selection, shards))
+    reads = _run_grib_reads([task for plan in plans for task in plan], workers)
+
+    for plan in plans:
+        # Drop each pair's raw fields from the list once its cubes are built
+        pair_reads = reads[: len(plan)]
+        del reads[: len(plan)]
+        n_single = sum(1 for task in plan if not task[2])
+        grib_data = _assemble_raw_grib_data(pair_reads[:n_single], pair_reads[n_single:], selection)
+        del pair_reads
+        yield _cubes_from_raw_data(grib_data, patch_size)
+
+
+def cache_variable_cubes(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    patch_size: int,
+    cache_dir: Path,
+    selection: GribSelection | None = None,
+    workers: int = 1,
+) -> Path:
+    """
+    Make sure the decoded cubes for these GRIB files are in the cache and return the entry.
+
+    The GRIB files are only decoded when no valid entry exists. Decoded cubes are written to
+    disk and released, so callers can memory-map the entry (grib_cache.load_cubes).
+
+    Args:
+        single_level_file: Path to ERA5 single-level GRIB file
+        pressure_level_file: Path to ERA5 pressure-level GRIB file
+        patch_size: Patch size for cropping
+        cache_dir: Cache root directory
+        selection: Levels, time range and sub-window to decode (see extract_variable_cubes)
+        workers: GRIB decoding processes (see extract_raw_data_from_grib_files)
+
+    Returns:
+        Cache entry directory
+
+    Raises:
+        FileNotFoundError: If GRIB files don't exist
+    """
+    return cache_variable_cubes_many(
+        [(single_level_file, pressure_level_file)], patch_size, cache_dir, selection, workers
+    )[0]
+
+
+def cache_variable_cubes_many(
+    file_pairs: list[tuple[Path, Path]],
+    patch_size: int,
+    cache_dir: Path,
+    selection: GribSelection | None = None,
+    workers: int = 1,
+) -> list[Path]:
+    """
+    Cache several (single-level, pressure-level) GRIB file pairs, e.g. training and validation.
+
+    With workers > 1, every uncached file is decoded concurrently on one process pool instead
+    of one pair after the other.
+
+    Args:
+        file_pairs: (single_level_file, pressure_level_file) pairs
+        patch_size: Patch size for cropping
+        cache_dir: Cache root directory
+        selection: Levels, time range and sub-window to decode (see extract_variable_cubes)
+        workers: GRIB decoding processes
+
+    Returns:
+        Cache entry directory of each pair, in input order
+
+    Raises:
+        FileNotFoundError: If GRIB files don't exist
+    """
+    entry_dirs = []
+    missing = []
+    for single_level_file, pressure_level_file in file_pairs:
+        for grib_file in (single_level_file, pressure_level_file):
+            if not grib_file.exists():
+                raise FileNotFoundError(f"GRIB file not found: {grib_file}")
+        key = grib_cache.cache_key(
+            single_level_file, pressure_level_file, patch_size, cache_dir, selection
+        )
+        entry_dir = cache_dir / key
+        entry_dirs.append(entry_dir)
+        if grib_cache.load_times(entry_dir) is not None:
+            print(f"Using cached GRIB cubes: {entry_dir}")
+        elif entry_dir not in {entry for _, entry in missing}:
+            missing.append(((single_level_file, pressure_level_file), entry_dir))
+
+    if len(missing) > 1 and workers > 1:
+        decoded = _decode_variable_cubes_many(
+            [pair for pair, _ in missing], patch_size, selection, workers
+        )
+    else:
+        decoded = (
+            _decode_variable_cubes(*pair, patch_size, selection, workers) for pair, _ in missing
+        )
+    for (_, entry_dir), cubes in zip(missing, decoded):
+        grib_cache.save_cubes(cubes, entry_dir)
+        print(f"Cached GRIB cubes: {entry_dir}")
+        del cubes
+    return entry_dirs
 
 
 def extract_training_data_from_grib(
@@ -365,14 +783,17 @@ def extract_training_data_from_grib(
     pressure_level_file: Path,
     patch_size: int = 4,
     skip_first_n_timesteps: int = 0,
+    cache_dir: Path | None = None,
+    selection: GribSelection | None = None,
+    workers: int = 1,
 ) -> list[SupervisedTrainingDataPair]:
     """
     Extract training data from ERA5 GRIB files.
 
     This function:
-    1. Loads ERA5 single-level and pressure-level GRIB files
-    2. Generates training pairs (input/target batches) from consecutive timesteps
-    3. Crops spatial dimensions to be compatible with specified patch size
+    1. Loads ERA5 single-level and pressure-level GRIB files (or their cached cubes)
+    2. Crops spatial dimensions to be compatible with specified patch size
+    3. Generates training pairs (input/target batches) from consecutive timesteps
 
     Args:
         single_level_file: Path to ERA5 single-level GRIB file
@@ -381,6 +802,13 @@ def extract_training_data_from_grib(
                    to multiples of this value). Default: 4
         skip_first_n_timesteps: Number of initial timesteps to skip before creating
                                training pairs. Default: 0
+        cache_dir: Directory for the decoded-cube cache. Entries are keyed on the GRIB file
+                   contents and patch size, so edited files are re-decoded. Default: None
+                   (no caching)
+        selection: Pressure levels, time range and lat/lon sub-window to decode. Only the
+                   variables the model uses are decoded. Default: None (all levels, times
+                   and the full grid)
+        workers: Processes decoding the GRIB files in parallel. Default: 1 (serial)
 
     Returns:
         List of SupervisedTrainingDataPair objects. Each pair contains input_batch
@@ -395,30 +823,14 @@ def extract_training_data_from_grib(
     print(f"Pressure-level file: {pressure_level_file}")
     print(f"Patch size: {patch_size}")
     print(f"Skip first N timesteps: {skip_first_n_timesteps}")
+    print(f"Cache dir: {cache_dir or 'disabled'}")
+    if selection is not None:
+        print(f"Selection: {selection}")
 
-    # Load GRIB files
-    grib_data = extract_raw_data_from_grib_files(
-        single_level_file,
-        pressure_level_file,
-    )
-    surf_data = grib_data["surf_data"]
-    atmos_data = grib_data["atmos_data"]
-    sorted_times = grib_data["sorted_times"]
-    lats = grib_data["lats"]
-    lons = grib_data["lons"]
-    pressure_levels = grib_data["pressure_levels"]
-
-    # Generate training pairs
-    data_pairs = _generate_training_pairs(
-        surf_data,
-        atmos_data,
-        sorted_times,
-        lats,
-        lons,
-        pressure_levels,
-        patch_size,
-        skip_first_n_timesteps,
+    cubes = extract_variable_cubes(
+        single_level_file, pressure_level_file, patch_size, cache_dir, selection, workers
     )
+    data_pairs = _pairs_from_cubes(cubes, skip_first_n_timesteps)
 
     print(f"\nGenerated {len(data_pairs)} training pairs")
 
@@ -0,0 +1,190 @@
+"""On-disk cache of variable cubes extracted from ERA5 GRIB files.
+
+Each cache entry is a directory holding one ``.npy`` file per variable, the 1D coordinates and
+a ``metadata.json`` with times, pressure levels and variable names. Entries are keyed on the
+SHA-256 of both GRIB files' contents and the patch size, and are loaded memory-mapped so that
+later runs skip pygrib decoding entirely and only touch the pages they use.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from vibe_tune_aurora.types import GribCubes, GribSelection
+
+# Bump when the cube layout or extraction semantics change to invalidate old entries
+CACHE_FORMAT_VERSION = 1
+METADATA_FILE = "metadata.json"
+HASH_INDEX_FILE = "file_hashes.json"
+
+
+def file_digest(path: Path, cache_dir: Path) -> str:
+    """
+    Return the SHA-256 of a file's contents.
+
+    Digests are remembered in ``cache_dir/file_hashes.json`` under the file's resolved path,
+    size and mtime, so unchanged files are only hashed once. A touched but otherwise identical
+    file is re-hashed and still maps to the same cache entry. Only the latest digest of each path
+    is kept, so the index does not grow as files are rewritten.
+
+    Args:
+        path: File to hash
+        cache_dir: Cache root directory holding the digest index
+
+    Returns:
+        Hex digest of the file contents
+    """
+    stat = path.stat()
+    resolved = str(path.resolve())
+    index_key = f"{resolved}:{stat.st_size}:{stat.st_mtime_ns}"
+    index_path = cache_dir / HASH_INDEX_FILE
+    try:
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        index = {}
+    if index_key in index:
+        return index[index_key]
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    digest = sha.hexdigest()
+
+    # Drop digests of earlier versions of this path
+    index = {key: value for key, value in index.items() if key.rsplit(":", 2)[0] != resolved}
+    index[index_key] = digest
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{HASH_INDEX_FILE}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=2))
+    os.replace(tmp_path, index_path)
+    return digest
+
+
+def cache_key(
+    single_level_file: Path,
+    pressure_level_file: Path,
+    patch_size: int,
+    cache_dir: Path,
+    selection: GribSelection | None = None,
+) -> str:
+    """
+    Build the cache key for a pair of GRIB files and extraction settings.
+
+    Timestep skipping is applied when slicing training pairs out of the cubes, so it is not
+    part of the key and runs with different skip settings share one entry. A GRIB selection
+    (variables, levels, time range, sub-window) changes the cubes and is part of the key. Only
+    its restricting fields are, so no selection and an empty GribSelection() share one entry.
+    """
+    restrictions = asdict(selection) if selection is not None else {}
+    restrictions = {name: value for name, value in restrictions.items() if value is not None}
+    parts = {
+        "version": CACHE_FORMAT_VERSION,
+        "single_level": file_digest(single_level_file, cache_dir),
+        "pressure_level": file_digest(pressure_level_file, cache_dir),
+        "patch_size": patch_size,
+        "selection": restrictions or None,
+    }
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def save_cubes(cubes: GribCubes, entry_dir: Path) -> None:
+    """
+    Write cubes to entry_dir atomically (via a temporary sibling directory).
+
+    Args:
+        cubes: Variable cubes to store
+        entry_dir: Cache entry directory to create or replace
+    """
+    tmp_dir = entry_dir.with_name(f"{entry_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    groups = {"surf": cubes.surf_vars, "static": cubes.static_vars, "atmos": cubes.atmos_vars}
+    for group, variables in groups.items():
+        for name, tensor in variables.items():
+            np.save(tmp_dir / f"{group}_{name}.npy", tensor.numpy())
+    np.save(tmp_dir / "lat.npy", cubes.lat.numpy())
+    np.save(tmp_dir / "lon.npy", cubes.lon.numpy())
+
+    metadata = {
+        "version": CACHE_FORMAT_VERSION,
+        "times": [time.isoformat() for time in cubes.times],
+        "pressure_levels": list(cubes.pressure_levels),
+        "variables": {group: list(variables) for group, variables in groups.items()},
+    }
+    (tmp_dir / METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    try:
+        os.replace(tmp_dir, entry_dir)
+    except OSError:
+        # Another process stored the same entry first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _load_array(path: Path) -> torch.Tensor:
+    # Copy-on-write mapping: pages are read lazily and the tensor stays writable
+    return torch.from_numpy(np.load(path, mmap_mode="c"))
+
+
+def _read_metadata(entry_dir: Path) -> dict | None:
+    try:
+        metadata = json.loads((entry_dir / METADATA_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if metadata.get("version") != CACHE_FORMAT_VERSION:
+        return None
+    return metadata
+
+
+def load_times(entry_dir: Path) -> list[datetime] | None:
+    """
+    Read only the timesteps of a cache entry, without mapping any arrays.
+
+    Returns:
+        Timesteps in chronological order, or None if the entry is missing or stale
+    """
+    metadata = _read_metadata(entry_dir)
+    if metadata is None:
+        return None
+    return [datetime.fromisoformat(time) for time in metadata["times"]]
+
+
+def load_cubes(entry_dir: Path) -> GribCubes | None:
+    """
+    Load cubes from a cache entry, memory-mapped.
+
+    Args:
+        entry_dir: Cache entry directory
+
+    Returns:
+        GribCubes, or None if the entry is missing, incomplete or from another cache version
+    """
+    metadata = _read_metadata(entry_dir)
+    if metadata is None:
+        return None
+    try:
+        variables = {
+            group: {name: _load_array(entry_dir / f"{group}_{name}.npy") for name in names}
+            for group, names in metadata["variables"].items()
+        }
+        return GribCubes(
+            surf_vars=variables["surf"],
+            static_vars=variables["static"],
+            atmos_vars=variables["atmos"],
+            times=[datetime.fromisoformat(time) for time in metadata["times"]],
+            lat=_load_array(entry_dir / "lat.npy"),
+            lon=_load_array(entry_dir / "lon.npy"),
+            pressure_levels=list(metadata["pressure_levels"]),
+        )
+    except (OSError, ValueError, KeyError):
+        return None
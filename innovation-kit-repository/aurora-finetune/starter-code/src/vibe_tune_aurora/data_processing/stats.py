@@ -0,0 +1,164 @@
+"""Streaming per-variable normalization statistics over ERA5 GRIB and NetCDF files.
+
+Statistics cover surface variables only (the model's surf_stats and the target variables). Aurora
+normalizes pressure-level variables with its own built-in statistics, so those fields are skipped.
+
+Every field is folded into a Welford accumulator as soon as it is decoded, so memory stays at
+one 2D field per worker regardless of how many files or timesteps are processed. Accumulators
+from different files (or worker processes) are merged exactly with Chan's parallel update.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pygrib
+
+GRIB_SUFFIXES = {".grib", ".grb", ".grib2", ".grb2"}
+NETCDF_SUFFIXES = {".nc", ".nc4", ".netcdf"}
+# NetCDF dimension names that hold pressure levels in ERA5 downloads
+NETCDF_LEVEL_DIMS = ("pressure_level", "level", "isobaricInhPa", "plev")
+NETCDF_TIME_DIMS = ("valid_time", "time")
+# CDS NetCDF variable name -> GRIB shortName, the name the loaders look statistics up by
+NETCDF_SHORT_NAMES = {
+    "t2m": "2t",  # 2-meter temperature
+    "d2m": "2d",  # 2-meter dewpoint temperature
+    "u10": "10u",  # 10-meter u-wind
+    "v10": "10v",  # 10-meter v-wind
+    "u100": "100u",  # 100-meter u-wind
+    "v100": "100v",  # 100-meter v-wind
+    "si10": "10si",  # 10-meter wind speed
+}
+
+
+@dataclass
+class WelfordAccumulator:
+    """Running count, mean and sum of squared deviations (M2) of a stream of values."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        """Fold an array of values (NaNs and masked points are ignored) into the running stats."""
+        if np.ma.isMaskedArray(values):
+            values = values.compressed()
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_m2 = float(np.square(values - batch_mean).sum())
+        self.merge(WelfordAccumulator(values.size, batch_mean, batch_m2))
+
+    def merge(self, other: "WelfordAccumulator") -> None:
+        """Combine another accumulator into this one (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else float("nan")
+
+
+def _update(accumulators: dict[str, WelfordAccumulator], key: str, values: np.ndarray) -> None:
+    accumulators.setdefault(key, WelfordAccumulator()).update(values)
+
+
+def accumulate_grib_file(path: Path) -> dict[str, WelfordAccumulator]:
+    """Stream every surface message of a GRIB file into per-variable accumulators."""
+    accumulators: dict[str, WelfordAccumulator] = {}
+    grbs = pygrib.open(str(path))
+    try:
+        for grb in grbs:
+            if grb.typeOfLevel == "isobaricInhPa":
+                continue
+            _update(accumulators, grb.shortName, grb.values)
+    finally:
+        grbs.close()
+    return accumulators
+
+
+def accumulate_netcdf_file(path: Path) -> dict[str, WelfordAccumulator]:
+    """
+    Stream the surface variables of a NetCDF file into accumulators, one time slice at a time.
+
+    Variables are keyed by their GRIB shortName (t2m -> 2t, see NETCDF_SHORT_NAMES), so stats from
+    NetCDF and GRIB downloads are interchangeable.
+    """
+    import xarray as xr  # Only needed for NetCDF inputs
+
+    accumulators: dict[str, WelfordAccumulator] = {}
+    with xr.open_dataset(path) as ds:
+        for name, variable in ds.data_vars.items():
+            if variable.ndim < 2 or any(dim in variable.dims for dim in NETCDF_LEVEL_DIMS):
+                continue
+            key = NETCDF_SHORT_NAMES.get(name, name)
+            time_dim = next((dim for dim in NETCDF_TIME_DIMS if dim in variable.dims), None)
+            if time_dim is None:
+                _update(accumulators, key, variable.values)
+                continue
+            for i in range(variable.sizes[time_dim]):
+                _update(accumulators, key, variable.isel({time_dim: i}).values)
+    return accumulators
+
+
+def accumulate_file(path: Path) -> dict[str, WelfordAccumulator]:
+    """Dispatch on the file suffix to the GRIB or NetCDF reader (runs in worker processes)."""
+    suffix = path.suffix.lower()
+    if suffix in GRIB_SUFFIXES:
+        return accumulate_grib_file(path)
+    if suffix in NETCDF_SUFFIXES:
+        return accumulate_netcdf_file(path)
+    raise ValueError(f"Unsupported file type '{suffix}' for {path}; expected GRIB or NetCDF")
+
+
+def compute_stats(files: list[Path], workers: int = 1) -> dict[str, WelfordAccumulator]:
+    """
+    Compute per-variable statistics over all files, one file per worker process.
+
+    Args:
+        files: GRIB and/or NetCDF files
+        workers: Worker processes. Default: 1 (process files serially)
+
+    Returns:
+        Accumulators keyed by GRIB shortName, merged across files
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist
+    """
+    for path in files:
+        if not path.exists():
+            raise FileNotFoundError(f"Input file not found: {path}")
+
+    if workers <= 1 or len(files) <= 1:
+        results = map(accumulate_file, files)
+        return _merge_all(results)
+    with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        return _merge_all(pool.map(accumulate_file, files))
+
+
+def _merge_all(results) -> dict[str, WelfordAccumulator]:
+    merged: dict[str, WelfordAccumulator] = {}
+    for accumulators in results:
+        for key, accumulator in accumulators.items():
+            merged.setdefault(key, WelfordAccumulator()).merge(accumulator)
+    return merged
+
+
+def write_stats_file(accumulators: dict[str, WelfordAccumulator], output: Path) -> None:
+    """Write statistics in the era5_surface_stats.json format read by data_utils."""
+    stats = {}
+    for key in sorted(accumulators):
+        accumulator = accumulators[key]
+        stats[key] = {"mean": accumulator.mean, "std": accumulator.std, "count": accumulator.count}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(stats, indent=4))
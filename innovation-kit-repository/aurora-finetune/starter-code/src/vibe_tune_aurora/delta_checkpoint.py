@@ -0,0 +1,144 @@
+"""Compact checkpoints that store only the weights a run can have changed.
+
+A full Lightning checkpoint holds every Aurora weight plus Adam state. A delta checkpoint holds
+only the trainable parameters and the buffers, together with a reference to the base
+checkpoint the frozen weights come from (the pretrained Hugging Face checkpoint, or the
+initializer checkpoint) and the SHA-256 of that file. Frozen parameters are identical to the
+base because they are never updated, so the full model is reconstructed by initializing from
+the base and loading the delta on top (see LitAurora.restore_from_checkpoint).
+
+Runs initialized with random weights ('initialized_and_custom') have no base to rebuild from,
+so their delta checkpoints store every weight (still without optimizer state).
+"""
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+
+import torch
+from aurora import AuroraSmall
+
+from vibe_tune_aurora.model_init import (
+    PRETRAINED_CHECKPOINT,
+    PRETRAINED_REPO,
+    pretrained_checkpoint_file,
+)
+
+DELTA_FORMAT = "vibe_tune_aurora.delta"
+DELTA_FORMAT_VERSION = 1
+# Name of the wrapped module inside torch's activation checkpointing wrapper
+CHECKPOINT_WRAPPER_PREFIX = "_checkpoint_wrapped_module."
+
+
+@functools.lru_cache(maxsize=None)
+def _sha256(resolved_path: str, size: int, mtime_ns: int) -> str:
+    sha = hashlib.sha256()
+    with open(resolved_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, hashed once per process while its size and mtime are unchanged."""
+    stat = path.stat()
+    return _sha256(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def base_checkpoint_reference(
+    init_mode: str, initializer_checkpoint_path: str | None = None
+) -> dict | None:
+    """
+    Describe the checkpoint an init mode loads its weights from.
+
+    Returns:
+        Dictionary with the Hugging Face repo/name/revision or the local path of the base
+        checkpoint and its sha256, or None for random initialization
+    """
+    match init_mode:
+        case "pretrained" | "pretrained_and_custom":
+            return {
+                "repo": PRETRAINED_REPO,
+                "name": PRETRAINED_CHECKPOINT,
+                "revision": AuroraSmall.default_checkpoint_revision,
+                "sha256": file_sha256(pretrained_checkpoint_file()),
+            }
+        case "initializer_checkpoint":
+            path = Path(initializer_checkpoint_path)
+            return {"path": str(path.resolve()), "sha256": file_sha256(path)}
+        case _:
+            return None
+
+
+def verify_base_checkpoint(reference: dict) -> None:
+    """
+    Check that the base checkpoint a delta was saved against is available and unchanged.
+
+    Raises:
+        FileNotFoundError: If a local base checkpoint no longer exists
+        ValueError: If the base checkpoint's contents differ from when the delta was saved
+    """
+    if "path" in reference:
+        path = Path(reference["path"])
+        if not path.exists():
+            raise FileNotFoundError(f"Base checkpoint of delta checkpoint not found: {path}")
+    else:
+        path = pretrained_checkpoint_file()
+    if file_sha256(path) != reference["sha256"]:
+        raise ValueError(
+            f"Base checkpoint {path} has changed since the delta checkpoint was saved "
+            f"(expected sha256 {reference['sha256']})"
+        )
+
+
+def is_delta_checkpoint(checkpoint: dict) -> bool:
+    """Whether a loaded checkpoint dictionary is a delta checkpoint."""
+    return checkpoint.get("format") == DELTA_FORMAT
+
+
+def delta_state_dict(module: torch.nn.Module, has_base: bool) -> dict[str, torch.Tensor]:
+    """State dict without the frozen parameters (which the base checkpoint provides)."""
+    frozen = set()
+    if has_base:
+        # Activation checkpointing wrappers appear in parameter names but not in state dict keys
+        frozen = {
+            name.replace(CHECKPOINT_WRAPPER_PREFIX, "")
+            for name, p in module.named_parameters()
+            if not p.requires_grad
+        }
+    return {name: tensor for name, tensor in module.state_dict().items() if name not in frozen}
+
+
+def save_delta_checkpoint(
+    module, checkpoint_path: Path, epoch: int = 0, global_step: int = 0
+) -> None:
+    """
+    Write a delta checkpoint of a LitAurora module atomically.
+
+    Args:
+        module: LitAurora to save
+        checkpoint_path: Output file (conventionally *.ckpt, like full checkpoints)
+        epoch: Current epoch, recorded for reference
+        global_step: Current optimizer step, recorded for reference
+    """
+    hparams = dict(module.hparams)
+    base = base_checkpoint_reference(
+        hparams["init_mode"], hparams.get("initializer_checkpoint_path")
+    )
+    checkpoint = {
+        "format": DELTA_FORMAT,
+        "version": DELTA_FORMAT_VERSION,
+        "epoch": epoch,
+        "global_step": global_step,
+        "hyper_parameters": hparams,
+        "base": base,
+        "state_dict": delta_state_dict(module, has_base=base is not None),
+    }
+    # Records the model architecture, as for full checkpoints
+    module.on_save_checkpoint(checkpoint)
+
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = checkpoint_path.with_name(f"{checkpoint_path.name}.{os.getpid()}.tmp")
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, checkpoint_path)
@@ -1,15 +1,25 @@
 """Model evaluation utilities for Aurora fine-tuning."""
 
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import torch
+from aurora import Batch, Metadata, rollout
+from torch.utils.data import Dataset
 
 from vibe_tune_aurora.aurora_module import LitAurora
-from vibe_tune_aurora.data_processing.data_utils import ERA5Dataset, load_normalization_stats
-from vibe_tune_aurora.losses import compute_mae_loss
-from vibe_tune_aurora.types import SupervisedTrainingDataPair
+from vibe_tune_aurora.data_processing.data_utils import (
+    create_dataloader,
+    load_normalization_stats,
+)
+from vibe_tune_aurora.data_processing.extract_data_from_grib import pair_time_indices
+from vibe_tune_aurora.losses import inverse_std_tensor
+from vibe_tune_aurora.metrics import StreamingErrorMetrics
+from vibe_tune_aurora.types import GribCubes, SupervisedTrainingDataPair
 
 
 def load_model(checkpoint_path: Path) -> LitAurora:
@@ -28,79 +38,87 @@ def load_model(checkpoint_path: Path) -> LitAurora:
     if not checkpoint_path.exists():
         raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
 
-    model = LitAurora.load_from_checkpoint(checkpoint_path)
+    # Builds the bare architecture and loads the weights once; no pretrained download
+    model = LitAurora.restore_from_checkpoint(checkpoint_path)
     model.eval()
     return model
 
 
 def evaluate_model(
     aurora_lightning_module: LitAurora,
-    evaluation_data_pairs: list[SupervisedTrainingDataPair],
+    evaluation_data_pairs: list[SupervisedTrainingDataPair] | Dataset,
     target_vars: tuple[str, ...],
     output_json: Path | None = None,
+    output_npz: Path | None = None,
+    batch_size: int = 1,
+    num_workers: int = 0,
 ) -> dict:
     """
     Evaluate finetuned model on entire dataset using single-step inference.
 
+    Samples are stacked into batches by an inference-mode DataLoader and all metrics are
+    accumulated on the model's device (see metrics.StreamingErrorMetrics). Results are read
+    back once at the end, and predictions are never kept.
+
     Args:
-        checkpoint_path: Path to model checkpoint file
-        evaluation_data_pairs: List of SupervisedTrainingDataPair objects for evaluation
+        aurora_lightning_module: Model to evaluate (see load_model)
+        evaluation_data_pairs: List of SupervisedTrainingDataPair objects for evaluation, or a
+            Dataset yielding (input_batch, target_batch) such as LazyERA5Dataset
         target_vars: Tuple of target variable names for evaluation
         output_json: Optional path to save results as JSON
+        output_npz: Optional path to save per-grid-cell error maps (bias, error_std and mae per
+            variable, plus lat/lon) as NPZ
+        batch_size: Samples per forward pass (all from the same grid)
+        num_workers: DataLoader worker processes building samples (0 builds them in the main
+            process)
 
     Returns:
         Dictionary containing evaluation metrics:
-        - mean_mae: Mean MAE loss across all samples
+        - mean_mae: Mean normalized MAE loss across all samples
         - std_mae: Standard deviation of MAE loss
         - min_mae: Minimum MAE loss
         - max_mae: Maximum MAE loss
         - num_samples: Number of samples evaluated
         - target_vars: Target variables used
-        - checkpoint_path: Path to checkpoint used
+        - per_variable: Variable name -> mae, rmse and bias in physical units
 
     Raises:
-        FileNotFoundError: If checkpoint doesn't exist
+        KeyError: If a target variable is missing from the predictions or targets
     """
-    dataset = ERA5Dataset(evaluation_data_pairs)
+    device = aurora_lightning_module.device
+    dataloader = create_dataloader(
+        evaluation_data_pairs,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        persistent_workers=False,
+        shuffle=False,
+        pin_memory=device.type == "cuda",
+    )
 
     # Load normalization statistics
     norm_stats = load_normalization_stats(target_vars)
-
-    # Evaluate model on all samples
-    losses = []
+    metrics = StreamingErrorMetrics(
+        target_vars, inverse_std_tensor(target_vars, norm_stats), device
+    )
+    lat = lon = None
 
     print("Computing model losses...")
-    for i in range(len(dataset)):
-        input_batch, target_batch = dataset[i]
-
-        # Run single-step inference
-        with torch.inference_mode():
-            prediction_batch = aurora_lightning_module.model.forward(input_batch)
-
-        # Compute loss using unified loss function
-        loss_tensor, n_vars = compute_mae_loss(
-            prediction_batch,
-            target_batch,
-            target_vars,
-            norm_stats,
-            aurora_lightning_module.device,
-        )
-        loss = loss_tensor.item()  # Convert tensor to float for statistics
-        losses.append(loss)
+    num_samples = len(dataloader.dataset)
+    model = aurora_lightning_module.model
+    with torch.inference_mode():
+        for i, (input_batch, target_batch) in enumerate(dataloader):
+            # Run single-step inference
+            prediction_batch = model.forward(input_batch)
+            metrics.update(prediction_batch, target_batch)
+            if lat is None:
+                lat, lon = prediction_batch.metadata.lat, prediction_batch.metadata.lon
 
-        if (i + 1) % 10 == 0:
-            print(f"  Processed {i + 1}/{len(dataset)} samples")
+            if (i + 1) % 10 == 0:
+                print(f"  Processed {metrics.num_samples}/{num_samples} samples")
 
-    # Compute statistics
-    losses_array = np.array(losses)
-    results = {
-        "mean_mae": float(np.mean(losses_array)),
-        "std_mae": float(np.std(losses_array)),
-        "min_mae": float(np.min(losses_array)),
-        "max_mae": float(np.max(losses_array)),
-        "num_samples": len(losses),
-        "target_vars": list(target_vars),
-    }
+    # Single device synchronization
+    results = metrics.compute()
+    results["target_vars"] = list(target_vars)
 
     print(f"\n=== Model Evaluation Results ===")
     print(f"Target variables: {target_vars}")
@@ -109,6 +127,11 @@ def evaluate_model(
     print(f"Std MAE loss: {results['std_mae']:.6f}")
     print(f"Min MAE loss: {results['min_mae']:.6f}")
     print(f"Max MAE loss: {results['max_mae']:.6f}")
+    for var_name, var_metrics in results["per_variable"].items():
+        print(
+            f"  {var_name}: MAE {var_metrics['mae']:.6f}, RMSE {var_metrics['rmse']:.6f}, "
+            f"bias {var_metrics['bias']:+.6f}"
+        )
     print(f"\nEvaluation method: Single-step inference")
 
     # Save to JSON if specified
@@ -118,4 +141,258 @@ def evaluate_model(
             json.dump(results, f, indent=2)
         print(f"\nResults saved to: {output_json}")
 
+    if output_npz is not None:
+        output_npz.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            output_npz, lat=lat.cpu().numpy(), lon=lon.cpu().numpy(), **metrics.maps()
+        )
+        print(f"Error maps saved to: {output_npz}")
+
+    return results
+
+
+def _rollout_inputs(cubes: GribCubes, init_indices: torch.Tensor) -> Batch:
+    """Aurora input batch [t-1, t] for each initialization time index t, gathered from the cubes."""
+    history = torch.stack([init_indices - 1, init_indices], dim=1)
+    return Batch(
+        surf_vars={name: cube[history] for name, cube in cubes.surf_vars.items()},
+        static_vars=cubes.static_vars,
+        atmos_vars={name: cube[history] for name, cube in cubes.atmos_vars.items()},
+        metadata=Metadata(
+            lat=cubes.lat,
+            lon=cubes.lon,
+            time=tuple(cubes.times[i] for i in init_indices.tolist()),
+            atmos_levels=tuple(cubes.pressure_levels),
+        ),
+    )
+
+
+def evaluate_rollout(
+    aurora_lightning_module: LitAurora,
+    cubes: GribCubes,
+    target_vars: tuple[str, ...],
+    steps: int,
+    skip_first_n_timesteps: int = 0,
+    batch_size: int = 1,
+    output_json: Path | None = None,
+) -> dict:
+    """
+    Evaluate multi-step autoregressive rollouts (aurora.rollout) with metrics per lead time.
+
+    Every timestep with enough history and `steps` later timesteps in the cubes starts a
+    rollout. Inputs and targets are gathered directly from the shared variable cubes, and each
+    step's prediction is scored into that lead time's on-device accumulators and released
+    before the next step is predicted, so memory does not grow with the rollout length.
+
+    Args:
+        aurora_lightning_module: Model to evaluate (see load_model)
+        cubes: Variable cubes covering consecutive timesteps (see extract_variable_cubes)
+        target_vars: Tuple of target variable names for evaluation
+        steps: Rollout steps; step k is scored against the timestep k steps after initialization
+        skip_first_n_timesteps: Number of initial timesteps to skip
+        batch_size: Rollouts (initialization times) run together
+        output_json: Optional path to save results as JSON
+
+    Returns:
+        Dictionary with target_vars, steps, num_rollouts and lead_times, a list with one entry
+        per step holding lead_time_hours and the metrics of evaluate_model (without error maps)
+
+    Raises:
+        ValueError: If the cubes are too short for a single rollout of the requested length
+    """
+    n_times = len(cubes.times)
+    init_indices = [
+        i for i in pair_time_indices(n_times, skip_first_n_timesteps) if i + steps < n_times
+    ]
+    if steps < 1 or not init_indices:
+        raise ValueError(
+            f"Cannot run a {steps}-step rollout: {n_times} timesteps with "
+            f"{skip_first_n_timesteps} skipped leave no initialization time with "
+            f"{steps} later timesteps"
+        )
+
+    device = aurora_lightning_module.device
+    norm_stats = load_normalization_stats(target_vars)
+    inv_std = inverse_std_tensor(target_vars, norm_stats)
+    lead_metrics = [
+        StreamingErrorMetrics(target_vars, inv_std, device, error_maps=False)
+        for _ in range(steps)
+    ]
+
+    print(f"Rolling out {len(init_indices)} initialization times for {steps} steps...")
+    model = aurora_lightning_module.model
+    with torch.inference_mode():
+        for start in range(0, len(init_indices), batch_size):
+            chunk = torch.tensor(init_indices[start : start + batch_size])
+            predictions = rollout(model, _rollout_inputs(cubes, chunk), steps=steps)
+            for step, prediction in enumerate(predictions):
+                # Targets are views/gathers of the shared cubes at each rollout's valid time
+                valid = chunk + step + 1
+                targets = {name: cubes.surf_vars[name][valid][:, None] for name in target_vars}
+                lead_metrics[step].update_surf_vars(prediction.surf_vars, targets)
+                # Drop this step's prediction before the next one is computed
+                del prediction, targets
+            print(f"  Processed {min(start + batch_size, len(init_indices))}/{len(init_indices)}")
+
+    first = init_indices[0]
+    lead_times = []
+    for step, metrics in enumerate(lead_metrics):
+        step_results = metrics.compute()
+        lead_hours = (cubes.times[first + step + 1] - cubes.times[first]).total_seconds() / 3600
+        lead_times.append({"step": step + 1, "lead_time_hours": lead_hours, **step_results})
+
+    results = {
+        "target_vars": list(target_vars),
+        "steps": steps,
+        "num_rollouts": len(init_indices),
+        "lead_times": lead_times,
+    }
+
+    print(f"\n=== Rollout Evaluation Results ===")
+    print(f"Target variables: {target_vars}")
+    print(f"Number of rollouts: {results['num_rollouts']}")
+    for entry in lead_times:
+        per_variable = ", ".join(
+            f"{var_name} RMSE {var_metrics['rmse']:.6f}"
+            for var_name, var_metrics in entry["per_variable"].items()
+        )
+        print(
+            f"  +{entry['lead_time_hours']:g}h: mean MAE {entry['mean_mae']:.6f} ({per_variable})"
+        )
+    print(f"\nEvaluation method: {steps}-step autoregressive rollout")
+
+    if output_json is not None:
+        output_json.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {output_json}")
+
+    return results
+
+
+def _evaluate_checkpoint(
+    checkpoint_path: Path,
+    evaluation_data: list[SupervisedTrainingDataPair] | Dataset,
+    target_vars: tuple[str, ...],
+    batch_size: int,
+    num_workers: int,
+    torch_threads: int | None = None,
+) -> dict:
+    """Load one checkpoint and evaluate it (runs in worker processes for parallel comparison)."""
+    if torch_threads is not None:
+        # Share the cores between the models evaluated in parallel
+        torch.set_num_threads(torch_threads)
+    print(f"\n=== Evaluating {checkpoint_path} ===")
+    results = evaluate_model(
+        aurora_lightning_module=load_model(checkpoint_path),
+        evaluation_data_pairs=evaluation_data,
+        target_vars=target_vars,
+        batch_size=batch_size,
+        num_workers=num_workers,
+    )
+    results["checkpoint_path"] = str(checkpoint_path)
     return results
+
+
+def evaluate_checkpoints(
+    checkpoint_paths: list[Path],
+    evaluation_data_pairs: list[SupervisedTrainingDataPair] | Dataset,
+    target_vars: tuple[str, ...],
+    output_json: Path | None = None,
+    batch_size: int = 1,
+    num_workers: int = 0,
+    parallel_models: int = 1,
+) -> dict[str, dict]:
+    """
+    Evaluate several checkpoints (e.g. init.ckpt, intermediate epochs and last.ckpt) on one
+    shared dataset and print a comparison table.
+
+    The data is extracted once by the caller. With parallel_models=1 the checkpoints are
+    evaluated one after another and each model is released before the next is loaded. With
+    more, each checkpoint is evaluated in its own worker process; pass a LazyERA5Dataset so
+    workers receive only its index and memory-map the shared cache entry.
+
+    Args:
+        checkpoint_paths: Checkpoints to compare
+        evaluation_data_pairs: List of SupervisedTrainingDataPair objects, or a Dataset yielding
+            (input_batch, target_batch) such as LazyERA5Dataset
+        target_vars: Tuple of target variable names for evaluation
+        output_json: Optional path to save all results as JSON, keyed by checkpoint path
+        batch_size: Samples per forward pass
+        num_workers: DataLoader worker processes per evaluated model
+        parallel_models: Models evaluated at the same time in worker processes. Default: 1
+
+    Returns:
+        Checkpoint path -> evaluation results (see evaluate_model)
+
+    Raises:
+        FileNotFoundError: If a checkpoint doesn't exist
+    """
+    checkpoint_paths = list(dict.fromkeys(checkpoint_paths))
+    for checkpoint_path in checkpoint_paths:
+        if not checkpoint_path.exists():
+            raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
+
+    jobs = [
+        (path, evaluation_data_pairs, target_vars, batch_size, num_workers)
+        for path in checkpoint_paths
+    ]
+    if parallel_models <= 1 or len(checkpoint_paths) <= 1:
+        all_results = [_evaluate_checkpoint(*job) for job in jobs]
+    else:
+        n_processes = min(parallel_models, len(checkpoint_paths))
+        torch_threads = max(1, (os.cpu_count() or 1) // n_processes)
+        # Spawned (not forked) workers: forking a process with live torch threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=n_processes, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [pool.submit(_evaluate_checkpoint, *job, torch_threads) for job in jobs]
+            all_results = [future.result() for future in futures]
+
+    comparison = {str(path): results for path, results in zip(checkpoint_paths, all_results)}
+    print("\n=== Checkpoint Comparison ===")
+    print(format_comparison_table(comparison, target_vars))
+
+    if output_json is not None:
+        output_json.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_json, "w") as f:
+            json.dump(comparison, f, indent=2)
+        print(f"\nResults saved to: {output_json}")
+
+    return comparison
+
+
+def format_comparison_table(comparison: dict[str, dict], target_vars: tuple[str, ...]) -> str:
+    """
+    Format evaluation results of several checkpoints as a plain-text table.
+
+    Args:
+        comparison: Checkpoint name -> evaluation results (see evaluate_model)
+        target_vars: Variables to show per-variable MAE, RMSE and bias for
+
+    Returns:
+        One header row and one row per checkpoint, columns aligned
+    """
+    header = ["checkpoint", "samples", "mean_mae", "std_mae"]
+    for var_name in target_vars:
+        header += [f"{var_name}_mae", f"{var_name}_rmse", f"{var_name}_bias"]
+
+    rows = [header]
+    for name, results in comparison.items():
+        row = [name, str(results["num_samples"])]
+        row += [f"{results['mean_mae']:.6f}", f"{results['std_mae']:.6f}"]
+        for var_name in target_vars:
+            var_metrics = results["per_variable"][var_name]
+            row += [f"{var_metrics[key]:.6f}" for key in ("mae", "rmse", "bias")]
+        rows.append(row)
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
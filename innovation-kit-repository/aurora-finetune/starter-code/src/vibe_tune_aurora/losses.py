@@ -2,7 +2,93 @@
 
 import torch
 
-from vibe_tune_aurora.data_processing.data_utils import normalize_tensor
+
+def inverse_std_tensor(
+    target_vars: tuple[str, ...],
+    norm_stats: dict[str, tuple[float, float]],
+) -> torch.Tensor:
+    """
+    Per-variable 1/std for the target variables, in target_vars order.
+
+    Raises:
+        ValueError: If normalization statistics not available for a variable
+    """
+    inv_std = []
+    for var_name in target_vars:
+        if var_name not in norm_stats:
+            raise ValueError(f"No normalization statistics available for variable: {var_name}")
+        inv_std.append(1.0 / norm_stats[var_name][1])
+    return torch.tensor(inv_std, dtype=torch.float32)
+
+
+def fused_mae_loss(
+    prediction_batch,
+    target_batch,
+    target_vars: tuple[str, ...],
+    inv_std: torch.Tensor,
+) -> tuple[torch.Tensor, dict[str, torch.Tensor]]:
+    """
+    Normalized MAE over target variables, computed for all variables at once.
+
+    Normalizing (x - mean) / std both prediction and target leaves the mean out of the
+    difference, so the per-variable loss is mean(|pred - target|) * (1 / std). The errors of all
+    variables are stacked into one tensor and reduced together, and the constant 1/std is applied
+    to the per-variable means rather than to every grid point.
+
+    Args:
+        prediction_batch: Model predictions (Aurora Batch object with surf_vars dict)
+        target_batch: Target batch (Aurora Batch object with surf_vars dict)
+        target_vars: Tuple of target variable names to compute loss over
+        inv_std: 1/std per target variable, in target_vars order (see inverse_std_tensor), on
+            the device of the predictions
+
+    Returns:
+        Tuple of (loss, per_variable) where:
+        - loss: Mean of the per-variable losses (0 if no target variable is present)
+        - per_variable: Variable name -> loss, for variables present in both batches
+    """
+    present = [
+        i
+        for i, var_name in enumerate(target_vars)
+        if var_name in prediction_batch.surf_vars and var_name in target_batch.surf_vars
+    ]
+    if not present:
+        return torch.zeros((), device=inv_std.device), {}
+    names = [target_vars[i] for i in present]
+    if len(present) < len(target_vars):
+        inv_std = inv_std[present]
+
+    return stacked_mae_loss(prediction_batch, stack_targets(target_batch, names), names, inv_std)
+
+
+def stack_targets(target_batch, names: tuple[str, ...] | list[str]) -> torch.Tensor:
+    """Target fields of the named surface variables, stacked along a new leading dimension."""
+    return torch.stack([target_batch.surf_vars[name] for name in names])
+
+
+def stacked_mae_loss(
+    prediction_batch,
+    targets: torch.Tensor,
+    names: tuple[str, ...] | list[str],
+    inv_std: torch.Tensor,
+) -> tuple[torch.Tensor, dict[str, torch.Tensor]]:
+    """
+    Normalized MAE against targets that are already stacked (see stack_targets).
+
+    Used by fused_mae_loss, and by LitAurora with target tensors cached across validation checks.
+
+    Args:
+        prediction_batch: Model predictions (Aurora Batch object with surf_vars dict)
+        targets: Target fields of the variables in names, stacked along the first dimension
+        names: Variables to compute the loss over, all present in prediction_batch
+        inv_std: 1/std per variable, in names order
+
+    Returns:
+        Tuple of (loss, per_variable), as for fused_mae_loss
+    """
+    errors = torch.stack([prediction_batch.surf_vars[name] for name in names]) - targets
+    per_variable = errors.abs().flatten(1).mean(dim=1) * inv_std
+    return per_variable.mean(), dict(zip(names, per_variable.unbind()))
 
 
 def compute_mae_loss(
@@ -16,11 +102,12 @@ def compute_mae_loss(
     Compute Mean Absolute Error (MAE) loss over target variables with normalization.
 
     This is the single source of truth for MAE computation, used by both training
-    and evaluation. The loss is computed by:
-    1. Extracting predictions and targets for each variable in target_vars
-    2. Normalizing both using statistics from norm_stats
-    3. Computing MAE (L1 loss) between normalized values
-    4. Averaging across all target variables
+    and evaluation (LitAurora calls fused_mae_loss directly with a precomputed 1/std buffer).
+    The loss is computed by:
+    1. Stacking prediction - target errors of each variable in target_vars
+    2. Taking each variable's MAE scaled by 1/std from norm_stats (equal to the MAE between
+       normalized values, since the mean cancels in the difference)
+    3. Averaging across all target variables
 
     Args:
         prediction_batch: Model predictions (Aurora Batch object with surf_vars dict)
@@ -50,26 +137,12 @@ def compute_mae_loss(
         ...                                         norm_stats, model.device)
         >>> loss = loss_tensor.item()
     """
-    total_loss = torch.tensor(0.0, device=device)
-    n_vars = 0
-
-    # Surface variables loss for target variables only
-    for var_name in target_vars:
-        if var_name in prediction_batch.surf_vars and var_name in target_batch.surf_vars:
-            pred_var = prediction_batch.surf_vars[var_name]
-            target_var = target_batch.surf_vars[var_name]
-
-            # Normalize both prediction and target
-            pred_normalized = normalize_tensor(pred_var, var_name, norm_stats)
-            target_normalized = normalize_tensor(target_var, var_name, norm_stats)
-
-            # Compute MAE loss on normalized values
-            loss = torch.nn.functional.l1_loss(pred_normalized, target_normalized)
-            total_loss += loss
-            n_vars += 1
-
-    # Average loss across target variables
-    if n_vars > 0:
-        total_loss = total_loss / n_vars
-
-    return total_loss, n_vars
+    # Statistics are only required for variables present in both batches
+    present_vars = tuple(
+        var_name
+        for var_name in target_vars
+        if var_name in prediction_batch.surf_vars and var_name in target_batch.surf_vars
+    )
+    inv_std = inverse_std_tensor(present_vars, norm_stats).to(device)
+    total_loss, per_variable = fused_mae_loss(prediction_batch, target_batch, present_vars, inv_std)
+    return total_loss, len(per_variable)
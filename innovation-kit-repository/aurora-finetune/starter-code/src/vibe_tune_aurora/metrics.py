@@ -0,0 +1,182 @@
+"""Streaming error metrics for evaluating Aurora predictions on the model's device.
+
+Accumulators are updated batch by batch on the device of the predictions and read back to the
+host once, when the results are requested, so evaluation never synchronizes per sample and
+never keeps predictions around.
+"""
+
+import numpy as np
+import torch
+
+
+def _accumulator_dtype(device: torch.device) -> torch.dtype:
+    # Float64 keeps long sums exact enough; MPS has no float64 support
+    return torch.float32 if device.type == "mps" else torch.float64
+
+
+class ErrorMapAccumulator:
+    """
+    Per-grid-cell running mean and variance of the error (Welford), plus the mean absolute error.
+
+    Each update folds a whole batch of error fields into the running state with Chan's parallel
+    update, so memory stays at a few (H, W) maps however many samples are evaluated.
+    """
+
+    def __init__(self, shape: torch.Size, device: torch.device):
+        dtype = _accumulator_dtype(device)
+        self.count = 0
+        self.mean = torch.zeros(shape, dtype=dtype, device=device)
+        self.m2 = torch.zeros(shape, dtype=dtype, device=device)
+        self.abs_mean = torch.zeros(shape, dtype=dtype, device=device)
+
+    def update(self, errors: torch.Tensor) -> None:
+        """
+        Fold error fields of shape (..., H, W) into the running per-cell statistics.
+
+        Raises:
+            ValueError: If the fields are not on the accumulator's grid
+        """
+        if errors.shape[-2:] != self.mean.shape:
+            raise ValueError(
+                f"Error fields of shape {tuple(errors.shape[-2:])} do not match the "
+                f"{tuple(self.mean.shape)} grid of earlier batches"
+            )
+        errors = errors.reshape(-1, *self.mean.shape).to(self.mean.dtype)
+        n = errors.shape[0]
+        batch_mean = errors.mean(dim=0)
+        batch_m2 = (errors - batch_mean).square().sum(dim=0)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * (n / total)
+        self.m2 += batch_m2 + delta.square() * (self.count * n / total)
+        self.abs_mean += (errors.abs().mean(dim=0) - self.abs_mean) * (n / total)
+        self.count = total
+
+    def maps(self) -> dict[str, np.ndarray]:
+        """Bias (mean error), error standard deviation and MAE per grid cell."""
+        std = (self.m2 / max(self.count, 1)).sqrt()
+        return {
+            "bias": self.mean.cpu().numpy(),
+            "error_std": std.cpu().numpy(),
+            "mae": self.abs_mean.cpu().numpy(),
+        }
+
+
+class StreamingErrorMetrics:
+    """
+    Streaming evaluation metrics over target variables.
+
+    Tracks, in physical units, the MAE, RMSE and bias of each variable and its per-grid-cell
+    error maps, and the normalized MAE of every sample (the training loss, see
+    losses.fused_mae_loss) for the distribution of per-sample losses.
+    """
+
+    def __init__(
+        self,
+        target_vars: tuple[str, ...],
+        inv_std: torch.Tensor,
+        device: str | torch.device,
+        error_maps: bool = True,
+    ):
+        """
+        Args:
+            target_vars: Variables to evaluate
+            inv_std: 1/std per target variable, in target_vars order (see
+                losses.inverse_std_tensor)
+            device: Device of the predictions; all accumulators live there
+            error_maps: Also accumulate per-grid-cell error maps (three (H, W) maps per variable)
+        """
+        self.device = torch.device(device)
+        self.target_vars = target_vars
+        self.inv_std = inv_std.to(self.device)
+        dtype = _accumulator_dtype(self.device)
+        # Per variable: sum of errors, sum of absolute errors, sum of squared errors
+        self.sums = torch.zeros(len(target_vars), 3, dtype=dtype, device=self.device)
+        self.counts = [0] * len(target_vars)
+        self.track_error_maps = error_maps
+        self.error_maps: dict[str, ErrorMapAccumulator] = {}
+        self.sample_losses: list[torch.Tensor] = []
+
+    def update(self, prediction_batch, target_batch) -> None:
+        """
+        Fold a batch of predictions into the metrics.
+
+        Args:
+            prediction_batch: Model predictions (Aurora Batch), on the metrics device
+            target_batch: Targets (Aurora Batch); surface variables are moved to the device
+
+        Raises:
+            KeyError: If a target variable is missing from the predictions or targets
+        """
+        self.update_surf_vars(prediction_batch.surf_vars, target_batch.surf_vars)
+
+    def update_surf_vars(
+        self, predictions: dict[str, torch.Tensor], targets: dict[str, torch.Tensor]
+    ) -> None:
+        """
+        Fold predicted and target surface fields of shape (B, T, H, W) into the metrics.
+
+        Raises:
+            KeyError: If a target variable is missing from the predictions or targets
+        """
+        per_sample = []
+        for i, var_name in enumerate(self.target_vars):
+            prediction = predictions[var_name]
+            target = targets[var_name].to(self.device, non_blocking=True)
+            errors = prediction - target
+            abs_errors = errors.abs()
+            self.sums[i] += torch.stack(
+                [errors.sum(), abs_errors.sum(), errors.square().sum()]
+            ).to(self.sums.dtype)
+            self.counts[i] += errors.numel()
+            if self.track_error_maps:
+                if var_name not in self.error_maps:
+                    self.error_maps[var_name] = ErrorMapAccumulator(
+                        errors.shape[-2:], self.device
+                    )
+                self.error_maps[var_name].update(errors)
+            per_sample.append(abs_errors.flatten(1).mean(dim=1) * self.inv_std[i])
+        # Normalized MAE of each sample, averaged over variables; stays on the device
+        self.sample_losses.append(torch.stack(per_sample).mean(dim=0).detach())
+
+    @property
+    def num_samples(self) -> int:
+        """Samples folded in so far."""
+        return sum(len(losses) for losses in self.sample_losses)
+
+    def compute(self) -> dict:
+        """
+        Read the metrics back to the host (the only device synchronization).
+
+        Returns:
+            Dictionary with mean_mae, std_mae, min_mae and max_mae of the per-sample normalized
+            MAE, num_samples, and per_variable mapping each variable to its mae, rmse and bias
+            in physical units
+        """
+        losses = torch.cat(self.sample_losses).double().cpu().numpy()
+        sums = self.sums.double().cpu().numpy()
+        per_variable = {}
+        for var_name, count, (error_sum, abs_sum, square_sum) in zip(
+            self.target_vars, self.counts, sums
+        ):
+            per_variable[var_name] = {
+                "mae": float(abs_sum / count),
+                "rmse": float(np.sqrt(square_sum / count)),
+                "bias": float(error_sum / count),
+            }
+        return {
+            "mean_mae": float(np.mean(losses)),
+            "std_mae": float(np.std(losses)),
+            "min_mae": float(np.min(losses)),
+            "max_mae": float(np.max(losses)),
+            "num_samples": int(losses.size),
+            "per_variable": per_variable,
+        }
+
+    def maps(self) -> dict[str, np.ndarray]:
+        """Per-grid-cell error maps keyed "<var>_bias", "<var>_error_std" and "<var>_mae"."""
+        return {
+            f"{var_name}_{kind}": array
+            for var_name, accumulator in self.error_maps.items()
+            for kind, array in accumulator.maps().items()
+        }
@@ -1,11 +1,17 @@
 """Model initialization strategies for Aurora fine-tuning."""
 
 import math
+from pathlib import Path
 
 import torch
+from huggingface_hub import hf_hub_download
 from torch import nn
 from aurora import Aurora, AuroraSmall
 
+# Pretrained weights loaded by the 'pretrained' and 'pretrained_and_custom' init modes
+PRETRAINED_REPO = "microsoft/aurora"
+PRETRAINED_CHECKPOINT = "aurora-0.25-small-pretrained.ckpt"
+
 
 def _add_custom_variables_to_pretrained(
     model: Aurora,
@@ -63,7 +69,7 @@ def init_pretrained_and_custom(
         Initialized Aurora model with pretrained weights and custom variables
     """
     model = AuroraSmall()
-    model.load_checkpoint("microsoft/aurora", "aurora-0.25-small-pretrained.ckpt")
+    model.load_checkpoint(PRETRAINED_REPO, PRETRAINED_CHECKPOINT)
 
     _add_custom_variables_to_pretrained(model, surf_vars, surf_stats)
 
@@ -81,7 +87,7 @@ def init_pretrained() -> Aurora:
         Pretrained Aurora model with default configuration
     """
     model = AuroraSmall()
-    model.load_checkpoint("microsoft/aurora", "aurora-0.25-small-pretrained.ckpt")
+    model.load_checkpoint(PRETRAINED_REPO, PRETRAINED_CHECKPOINT)
     print("Initialized Aurora model with default parameters (for rollout comparison)")
     return model
 
@@ -109,6 +115,53 @@ def init_from_scratch(
     return model
 
 
+def pretrained_checkpoint_file() -> Path:
+    """Local path of the pretrained checkpoint (downloaded on first use, as load_checkpoint does)."""
+    return Path(
+        hf_hub_download(
+            repo_id=PRETRAINED_REPO,
+            filename=PRETRAINED_CHECKPOINT,
+            revision=AuroraSmall.default_checkpoint_revision,
+        )
+    )
+
+
+SURF_EMBED_PREFIX = "model.encoder.surf_token_embeds.weights."
+# Aurora's static variables, which its encoder embeds together with the surface variables
+STATIC_VARS = ("lsm", "z", "slt")
+
+
+def surf_vars_from_state_dict(state_dict: dict[str, torch.Tensor]) -> tuple[str, ...]:
+    """Recover a LitAurora checkpoint's surface variables from its embedding weight names."""
+    names = (
+        key[len(SURF_EMBED_PREFIX) :] for key in state_dict if key.startswith(SURF_EMBED_PREFIX)
+    )
+    return tuple(name for name in names if name not in STATIC_VARS)
+
+
+def build_aurora_architecture(
+    surf_vars: tuple[str, ...],
+    surf_stats: dict[str, tuple[float, float]] | None = None,
+) -> Aurora:
+    """
+    Build the bare AuroraSmall architecture for the given surface variables, without weights.
+
+    Every initialization mode yields this architecture (custom variables get their own
+    embedding weights and decoder heads), so a checkpoint's state dict loads into it directly.
+    Nothing is downloaded.
+
+    Args:
+        surf_vars: Surface variables, in model order
+        surf_stats: Surface statistics the model normalizes with (None for Aurora's defaults)
+
+    Returns:
+        Randomly initialized Aurora model
+    """
+    if surf_stats is None:
+        return AuroraSmall(surf_vars=surf_vars)
+    return AuroraSmall(surf_vars=surf_vars, surf_stats=surf_stats)
+
+
 def init_from_checkpoint(checkpoint_path: str) -> Aurora:
     """
     Load Aurora model from a custom checkpoint.
@@ -122,7 +175,7 @@ def init_from_checkpoint(checkpoint_path: str) -> Aurora:
     # Import here to avoid circular dependency
     from .aurora_module import LitAurora
 
-    lightning_model = LitAurora.load_from_checkpoint(checkpoint_path)
+    lightning_model = LitAurora.restore_from_checkpoint(checkpoint_path)
     model = lightning_model.model
     assert isinstance(model, Aurora)
 
@@ -0,0 +1,116 @@
+"""Select which Aurora parameters are fine-tuned; everything else is frozen.
+
+Modes:
+- "full": every parameter is trained (the default)
+- "heads-only": surface-variable patch embeddings and decoder heads, which include the ones
+  _add_custom_variables_to_pretrained adds for new variables
+- "heads+last-N-blocks": the heads plus the last N Swin3D transformer blocks of the backbone
+- "lora": the heads plus low-rank adapters on every backbone attention layer (Aurora's own
+  LoRA modules, so state dict keys match an Aurora built with use_lora=True)
+
+Frozen parameters get requires_grad=False, so autograd neither computes nor stores their
+gradients, and LitAurora leaves them out of the optimizer (no Adam state for them).
+"""
+
+import re
+
+from aurora import Aurora
+from aurora.model.lora import LoRARollout
+from aurora.model.swin3d import WindowAttention
+from torch import nn
+
+TRAINABLE_MODES = ("full", "heads-only", "heads+last-N-blocks", "lora")
+LORA_RANK = 8
+LORA_ALPHA = 8
+# Rollout steps the adapters apply to (Aurora's default lora_steps)
+LORA_STEPS = 40
+
+_LAST_BLOCKS_PATTERN = re.compile(r"heads\+last-(\d+)-blocks")
+
+
+def parse_trainable(trainable: str) -> tuple[str, int]:
+    """
+    Split a trainable spec into its mode and block count, e.g. "heads+last-2-blocks" -> (
+    "heads+last-N-blocks", 2).
+
+    Raises:
+        ValueError: If the spec is not one of TRAINABLE_MODES
+    """
+    match = _LAST_BLOCKS_PATTERN.fullmatch(trainable)
+    if match is not None:
+        return "heads+last-N-blocks", int(match.group(1))
+    if trainable in ("full", "heads-only", "lora"):
+        return trainable, 0
+    raise ValueError(
+        f"Invalid trainable: {trainable}. Must be one of: 'full', 'heads-only', "
+        "'heads+last-N-blocks' (e.g. 'heads+last-2-blocks'), 'lora'"
+    )
+
+
+def backbone_blocks(model: Aurora) -> list[nn.Module]:
+    """Swin3D transformer blocks of the backbone, in forward order."""
+    backbone = model.backbone
+    layers = list(backbone.encoder_layers) + list(backbone.decoder_layers)
+    return [block for layer in layers for block in layer.blocks]
+
+
+def add_lora_adapters(model: Aurora, rank: int = LORA_RANK, alpha: int = LORA_ALPHA) -> int:
+    """
+    Attach LoRA adapters to the qkv and output projections of every backbone attention layer.
+
+    WindowAttention adds lora_qkv/lora_proj to its projections (no-ops unless the model was
+    built with use_lora=True), so setting them to LoRA modules adapts an existing model
+    in place. Adapters start at zero (lora_B = 0) and leave the predictions unchanged.
+    Attention layers that already have adapters are left as they are.
+
+    Returns:
+        Number of attention layers that received adapters
+    """
+    added = 0
+    for module in model.backbone.modules():
+        if not isinstance(module, WindowAttention) or isinstance(module.lora_qkv, nn.Module):
+            continue
+        dim = module.dim
+        module.lora_qkv = LoRARollout(dim, dim * 3, rank, alpha, 0.0, LORA_STEPS, "single")
+        module.lora_proj = LoRARollout(dim, dim, rank, alpha, 0.0, LORA_STEPS, "single")
+        added += 1
+    return added
+
+
+def configure_trainable(model: Aurora, trainable: str = "full") -> None:
+    """
+    Freeze every parameter of the model that the trainable mode does not fine-tune.
+
+    Args:
+        model: Aurora model, modified in place (LoRA adapters are added for "lora")
+        trainable: Mode from TRAINABLE_MODES, with N filled in for "heads+last-N-blocks"
+
+    Raises:
+        ValueError: If the mode is invalid or asks for more blocks than the backbone has
+    """
+    mode, n_blocks = parse_trainable(trainable)
+    if mode == "full":
+        model.requires_grad_(True)
+        return
+
+    model.requires_grad_(False)
+    trained: list[nn.Module] = [model.encoder.surf_token_embeds, model.decoder.surf_heads]
+    if mode == "heads+last-N-blocks":
+        blocks = backbone_blocks(model)
+        if not 0 < n_blocks <= len(blocks):
+            raise ValueError(f"Cannot train the last {n_blocks} of {len(blocks)} backbone blocks")
+        trained += blocks[-n_blocks:]
+    elif mode == "lora":
+        add_lora_adapters(model)
+        trained += [
+            module for module in model.backbone.modules() if isinstance(module, LoRARollout)
+        ]
+    for module in trained:
+        module.requires_grad_(True)
+
+
+def count_parameters(module: nn.Module) -> tuple[int, int]:
+    """Return (trainable, total) parameter counts."""
+    trainable = sum(p.numel() for p in module.parameters() if p.requires_grad)
+    total = sum(p.numel() for p in module.parameters())
+    return trainable, total
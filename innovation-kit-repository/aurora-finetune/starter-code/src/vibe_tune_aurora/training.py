@@ -1,14 +1,28 @@
 """Training orchestration for Aurora fine-tuning."""
 
+import math
+import os
+import resource
+import sys
 from pathlib import Path
 
 import lightning as L
+import torch
+from torch.utils.data import Dataset
 from lightning.pytorch.callbacks import ModelCheckpoint
+from lightning.pytorch.strategies import DDPStrategy
 
 from vibe_tune_aurora.aurora_module import LitAurora
-from vibe_tune_aurora.callbacks import SaveInitCheckpoint
+from vibe_tune_aurora.callbacks import (
+    FullValidationAtEpochEnd,
+    SaveDeltaCheckpoint,
+    SaveInitCheckpoint,
+)
 from vibe_tune_aurora.config import DEFAULT_SURF_VARS, TrainingConfig
 from vibe_tune_aurora.data_processing.data_utils import (
+    ERA5Dataset,
+    IndexedDataset,
+    ValidationSubsetSampler,
     create_dataloader,
     load_normalization_stats,
     load_surface_stats,
@@ -17,8 +31,8 @@ from vibe_tune_aurora.types import SupervisedTrainingDataPair
 
 
 def train_era5_model(
-    training_data_pairs: list[SupervisedTrainingDataPair],
-    validation_data_pairs: list[SupervisedTrainingDataPair],
+    training_data_pairs: list[SupervisedTrainingDataPair] | Dataset,
+    validation_data_pairs: list[SupervisedTrainingDataPair] | Dataset,
     target_vars: tuple[str, ...],
     config: TrainingConfig | None = None,
 ) -> LitAurora:
@@ -29,7 +43,9 @@ def train_era5_model(
     sensible defaults defined in TrainingConfig.
 
     Args:
-        training_data_pairs: List of SupervisedTrainingDataPair objects for training
+        training_data_pairs: List of SupervisedTrainingDataPair objects for training, or a
+            Dataset such as LazyERA5Dataset that builds pairs on demand
+        validation_data_pairs: Validation data, in the same forms as training_data_pairs
         target_vars: Target variables for loss computation
         config: Training configuration (uses defaults if None)
 
@@ -40,12 +56,45 @@ def train_era5_model(
         config = TrainingConfig()
 
     # Load statistics
-    surf_stats = load_surface_stats()
-    norm_stats = load_normalization_stats(target_vars)
+    surf_stats = load_surface_stats(config.stats_file)
+    norm_stats = load_normalization_stats(target_vars, config.stats_file)
 
     # Create dataloaders
-    train_loader = create_dataloader(training_data_pairs)
-    val_loader = create_dataloader(validation_data_pairs)
+    loader_kwargs = {
+        "batch_size": config.batch_size,
+        "num_workers": config.num_workers,
+        "prefetch_factor": config.prefetch_factor,
+        "persistent_workers": config.persistent_workers,
+    }
+    # With several processes Lightning swaps in a DistributedSampler, so each rank loads (and,
+    # for lazy datasets, memory-maps) only its own shard of the samples
+    train_loader = create_dataloader(training_data_pairs, **loader_kwargs)
+    if not isinstance(validation_data_pairs, Dataset):
+        validation_data_pairs = ERA5Dataset(validation_data_pairs)
+    if config.val_target_cache_mb > 0:
+        # Validation batches carry their sample indices, which key the target cache
+        validation_data_pairs = IndexedDataset(validation_data_pairs)
+    validation_sampler = None
+    if config.val_subset_size is not None:
+        validation_sampler = ValidationSubsetSampler(
+            validation_data_pairs, config.val_subset_size, config.val_subset_strategy
+        )
+    val_loader = create_dataloader(
+        validation_data_pairs, shuffle=False, sampler=validation_sampler, **loader_kwargs
+    )
+
+    device_kwargs = {"accelerator": "auto", "devices": "auto"}
+    n_processes = 1
+    if config.cpu_processes > 1:
+        n_processes = config.cpu_processes
+        # Split the cores between the processes instead of oversubscribing them
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // n_processes))
+        device_kwargs = {
+            "accelerator": "cpu",
+            "devices": n_processes,
+            # Surface variables missing from the data leave their embeddings without gradients
+            "strategy": DDPStrategy(process_group_backend="gloo", find_unused_parameters=True),
+        }
 
     # Create Lightning module (model created internally)
     lit_model = LitAurora(
@@ -57,34 +106,86 @@ def train_era5_model(
         learning_rate=config.learning_rate,
         lr_scheduler=config.lr_scheduler,
         max_epochs=config.max_epochs,
-        num_training_samples=len(train_loader),
+        # Optimizer steps per epoch (per process), which drive the step-based LR schedule
+        steps_per_epoch=math.ceil(
+            len(train_loader) / (config.accumulate_grad_batches * n_processes)
+        ),
         initializer_checkpoint_path=config.initializer_checkpoint_path,
+        trainable=config.trainable,
+        val_target_cache_mb=config.val_target_cache_mb,
     )
+    apply_execution_options(lit_model, config.activation_checkpointing, config.compile_model)
 
     # Create logger
     logger = L.pytorch.loggers.TensorBoardLogger(config.log_dir, name="finetuning")
 
     # Create callbacks
-    save_init_callback = SaveInitCheckpoint()
-    checkpoint_last = ModelCheckpoint(
-        dirpath=None,  # Use logger's default path
-        filename="last",
-        save_last=True,
-        save_top_k=0,  # Only save the last checkpoint
-    )
+    if config.checkpoint_format not in ("full", "delta"):
+        raise ValueError(
+            f"Invalid checkpoint_format: {config.checkpoint_format}. Must be 'full' or 'delta'"
+        )
+    delta = config.checkpoint_format == "delta"
+    save_init_callback = SaveInitCheckpoint(delta=delta)
+    if delta:
+        checkpoint_last = SaveDeltaCheckpoint()
+    else:
+        checkpoint_last = ModelCheckpoint(
+            dirpath=None,  # Use logger's default path
+            filename="last",
+            save_last=True,
+            save_top_k=0,  # Only save the last checkpoint
+        )
+
+    callbacks = [save_init_callback, checkpoint_last]
+    if validation_sampler is not None:
+        callbacks.append(FullValidationAtEpochEnd(val_loader))
 
     # Create trainer
     trainer = L.Trainer(
         max_epochs=config.max_epochs,
         logger=logger,
-        callbacks=[save_init_callback, checkpoint_last],
-        accelerator="auto",
-        devices="auto",
+        callbacks=callbacks,
         log_every_n_steps=2,
-        val_check_interval=0.10,
+        accumulate_grad_batches=config.accumulate_grad_batches,
+        val_check_interval=config.val_check_interval,
+        precision=config.precision,
+        **device_kwargs,
     )
 
     # Train model
+    if torch.cuda.is_available():
+        torch.cuda.reset_peak_memory_stats()
     trainer.fit(lit_model, train_loader, val_loader)
+    print(f"Peak memory ({config.trainable}): {peak_memory_mb():.0f} MB")
 
     return lit_model
+
+
+def apply_execution_options(
+    lit_model: LitAurora, activation_checkpointing: bool = False, compile_model: bool = False
+) -> None:
+    """
+    Enable activation checkpointing and/or compilation of the Aurora model in place.
+
+    Both keep parameter names and state dict keys unchanged, so checkpoints are identical to
+    those of an uncompiled model. Compilation happens lazily on the first step.
+
+    Args:
+        lit_model: Lightning module whose model to configure
+        activation_checkpointing: Recompute the activations of Aurora's encoder, backbone
+            blocks and decoder during backward instead of storing them
+        compile_model: Compile the model with torch.compile (Module.compile)
+    """
+    if activation_checkpointing:
+        lit_model.model.configure_activation_checkpointing()
+    if compile_model:
+        lit_model.model.compile()
+
+
+def peak_memory_mb() -> float:
+    """Peak CUDA memory allocated, or without CUDA the peak resident memory of this process."""
+    if torch.cuda.is_available():
+        return torch.cuda.max_memory_allocated() / 2**20
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
@@ -3,10 +3,63 @@ Defines commonly used types/dataclasses used among the source code
 """
 
 from dataclasses import dataclass
+from datetime import datetime
+
 import aurora
+import torch
 
 
 @dataclass
 class SupervisedTrainingDataPair:
     input_batch: aurora.Batch
     target_batch: aurora.Batch
+
+
+@dataclass
+class GribCubes:
+    """
+    Per-variable time cubes assembled once from the raw GRIB fields.
+
+    All arrays are already cropped to the patch size and flipped so that latitude decreases
+    with the row index. Training pairs are slices of these tensors along the time axis.
+
+    Attributes:
+        surf_vars: Aurora name -> tensor of shape (T, H, W)
+        static_vars: Aurora name -> tensor of shape (H, W)
+        atmos_vars: Aurora name -> tensor of shape (T, L, H, W)
+        times: Timesteps along the T axis, in chronological order
+        lat: 1D latitudes (decreasing)
+        lon: 1D longitudes in [0, 360)
+        pressure_levels: Pressure levels along the L axis
+    """
+
+    surf_vars: dict[str, torch.Tensor]
+    static_vars: dict[str, torch.Tensor]
+    atmos_vars: dict[str, torch.Tensor]
+    times: list[datetime]
+    lat: torch.Tensor
+    lon: torch.Tensor
+    pressure_levels: list[int]
+
+
+@dataclass(frozen=True)
+class GribSelection:
+    """
+    Subset of GRIB messages and grid points to decode. None means "no restriction".
+
+    Attributes:
+        short_names: GRIB shortNames to decode (e.g. "2t", "t")
+        levels: Pressure levels (hPa) to decode; only applies to pressure-level files
+        start_time: First valid time to decode (inclusive)
+        end_time: Last valid time to decode (inclusive)
+        lat_range: (min, max) latitude of the sub-window in degrees (inclusive)
+        lon_range: (min, max) longitude of the sub-window in degrees (inclusive), either in
+            [-180, 180] or [0, 360)
+    """
+
+    short_names: tuple[str, ...] | None = None
+    levels: tuple[int, ...] | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    lat_range: tuple[float, float] | None = None
+    lon_range: tuple[float, float] | None = None
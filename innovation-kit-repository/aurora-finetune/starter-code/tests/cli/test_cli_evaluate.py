@@ -57,7 +57,7 @@ def create_and_save_pretrained_aurora_checkpoint(checkpoint_path: Path) -> None:
     """
     aurora_lightning_module: LitAurora = create_default_aurora_lightning_module(
         log_dir=TESTS_DIR / "outputs/tb_logs",
-        num_training_samples=100,  # arbitrary num samples for this test
+        steps_per_epoch=100,  # arbitrary number of steps for this test
     )
     # Perform a "no-op" training run; a trainer.fit is required to save checkpoints
     trainer = Trainer(
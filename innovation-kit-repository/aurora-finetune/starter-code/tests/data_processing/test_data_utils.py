@@ -0,0 +1,102 @@
+"""Tests for DataLoader creation over eager and lazy ERA5 datasets."""
+
+import pytest
+import torch
+
+from vibe_tune_aurora.cli.benchmark_dataloader import synthetic_cubes
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.data_processing.data_utils import (
+    LazyERA5Dataset,
+    ValidationSubsetSampler,
+    _collate_aurora_batch_objects,
+    create_dataloader,
+)
+
+
+def test_multi_worker_loader_yields_every_lazy_sample(tmp_path):
+    cubes = synthetic_cubes(n_times=8, height=8, width=8, pressure_levels=(850, 500))
+    entry_dir = tmp_path / "entry"
+    grib_cache.save_cubes(cubes, entry_dir)
+    dataset = LazyERA5Dataset(entry_dir)
+
+    loader = create_dataloader(dataset, num_workers=2, prefetch_factor=2)
+    seen = {}
+    for epoch in range(2):
+        for input_batch, target_batch in loader:
+            current_time = input_batch.metadata.time[0]
+            seen[current_time] = (input_batch, target_batch)
+    assert sorted(seen) == cubes.times[1:-1]
+
+    # Samples arrive compacted: each tensor owns exactly its own elements
+    input_batch, target_batch = seen[cubes.times[1]]
+    surf = input_batch.surf_vars["2t"]
+    assert surf.untyped_storage().nbytes() == surf.numel() * surf.element_size()
+    assert torch.equal(surf[0], cubes.surf_vars["2t"][0:2])
+    assert torch.equal(target_batch.surf_vars["2t"][0, 0], cubes.surf_vars["2t"][2])
+
+
+def test_collator_stacks_samples_along_batch_dimension(tmp_path):
+    cubes = synthetic_cubes(n_times=8, height=8, width=8, pressure_levels=(850, 500))
+    entry_dir = tmp_path / "entry"
+    grib_cache.save_cubes(cubes, entry_dir)
+    dataset = LazyERA5Dataset(entry_dir)
+
+    input_batch, target_batch = _collate_aurora_batch_objects([dataset[0], dataset[3]])
+    assert input_batch.surf_vars["2t"].shape == (2, 2, 8, 8)
+    assert input_batch.atmos_vars["t"].shape == (2, 2, 2, 8, 8)
+    assert target_batch.surf_vars["2t"].shape == (2, 1, 8, 8)
+    assert input_batch.static_vars["lsm"].shape == (8, 8)
+    assert input_batch.metadata.time == (cubes.times[1], cubes.times[4])
+    assert torch.equal(target_batch.surf_vars["2t"][1, 0], cubes.surf_vars["2t"][5])
+
+    loader = create_dataloader(dataset, batch_size=4)
+    assert [len(batch[0].metadata.time) for batch in loader] == [4, 2]
+
+
+def test_collator_rejects_mixed_grids(tmp_path):
+    samples = []
+    for name, height in (("a", 8), ("b", 12)):
+        cubes = synthetic_cubes(n_times=4, height=height, width=8, pressure_levels=(850,))
+        grib_cache.save_cubes(cubes, tmp_path / name)
+        samples.append(LazyERA5Dataset(tmp_path / name)[0])
+
+    with pytest.raises(ValueError, match="different lat/lon grids"):
+        _collate_aurora_batch_objects(samples)
+
+
+@pytest.mark.parametrize("strategy", ["random", "stratified"])
+def test_validation_sampler_draws_subsets_and_full_passes(strategy):
+    dataset = torch.utils.data.TensorDataset(torch.arange(20))
+    sampler = ValidationSubsetSampler(dataset, subset_size=4, strategy=strategy, seed=1)
+
+    assert len(sampler) == 4
+    first, second = list(sampler), list(sampler)
+    assert len(first) == len(set(first)) == 4
+    assert first != second
+    if strategy == "stratified":
+        # One sample from each block of 5 consecutive samples
+        assert [index // 5 for index in first] == [0, 1, 2, 3]
+
+    # Draws depend only on the seed and their position, so every process draws the same
+    assert list(ValidationSubsetSampler(dataset, 4, strategy, seed=1)) == first
+
+    sampler.full_pass = True
+    assert list(sampler) == list(range(20))
+    assert len(sampler) == 20
+
+
+def test_validation_sampler_pads_every_process_when_processes_outnumber_samples(monkeypatch):
+    dataset = torch.utils.data.TensorDataset(torch.arange(20))
+    shards = []
+    for rank in range(8):
+        process_group = staticmethod(lambda: (8, rank))
+        monkeypatch.setattr(ValidationSubsetSampler, "_process_group", process_group)
+        sampler = ValidationSubsetSampler(dataset, subset_size=2, strategy="stratified", seed=1)
+        shards.append(list(sampler))
+        assert len(shards[-1]) == len(sampler) == 1
+    assert len({index for shard in shards for index in shard}) == 2
+
+
+def test_validation_sampler_rejects_unknown_strategy():
+    with pytest.raises(ValueError, match="strategy"):
+        ValidationSubsetSampler(torch.utils.data.TensorDataset(torch.arange(4)), 2, "every-other")
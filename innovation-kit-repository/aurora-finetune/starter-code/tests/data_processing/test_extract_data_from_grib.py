@@ -1,10 +1,20 @@
+from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
+import pytest
+import torch
 from aurora import Batch
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
+    _generate_training_pairs,
+    _selects_message,
+    _window_slices,
+    extract_raw_data_from_grib_files,
     extract_training_data_from_grib,
+    model_selection,
 )
-from vibe_tune_aurora.types import SupervisedTrainingDataPair
+from vibe_tune_aurora.types import GribSelection, SupervisedTrainingDataPair
 
 TESTS_DIR = Path(__file__).parent.parent
 
@@ -97,3 +107,130 @@ def test_extract_training_data_from_grib_western_usa():
 
     print(f"Test passed! Generated {len(result)} training pairs")
     print(f"Spatial dimensions: {height}x{width}")
+
+
+def _synthetic_grib_data(n_times=5, height=10, width=9, levels=(850, 500)):
+    """Build raw GRIB-style dicts where every field encodes its (time, level) index."""
+    times = [datetime(2024, 1, 1) + timedelta(hours=6 * i) for i in range(n_times)]
+    lat_values = np.linspace(30.0, 48.0, height)  # increasing, so extraction must flip
+    lon_values = np.linspace(-125.0, -100.0, width)
+    lons, lats = np.meshgrid(lon_values, lat_values)
+    ramp = np.arange(height, dtype=np.float64)[:, None] * np.ones((1, width))
+    surf_data = {
+        name: {t: np.full((height, width), float(i)) + ramp for i, t in enumerate(times)}
+        for name in ("2t", "10u", "10v", "msl")
+    }
+    for name in ("lsm", "z", "slt"):
+        surf_data[name] = {times[0]: ramp.copy()}
+    atmos_data = {
+        name: {
+            (t, level): np.full((height, width), 100.0 * i + level)
+            for i, t in enumerate(times)
+            for level in levels
+        }
+        for name in ("t", "u", "v", "q", "z")
+    }
+    return surf_data, atmos_data, times, lats, lons, list(levels)
+
+
+def test_training_pairs_are_views_into_shared_cubes():
+    """Consecutive pairs share timestep storage and static variables instead of copying."""
+    surf_data, atmos_data, times, lats, lons, levels = _synthetic_grib_data()
+    pairs = _generate_training_pairs(
+        surf_data,
+        atmos_data,
+        times,
+        lats,
+        lons,
+        levels,
+        patch_size=4,
+        skip_first_n_timesteps=0,
+    )
+    assert len(pairs) == len(times) - 2
+
+    first, second = pairs[0], pairs[1]
+    surf_in = first.input_batch.surf_vars["2t"]
+    assert surf_in.shape == (1, 2, 8, 8)
+    assert first.input_batch.atmos_vars["t"].shape == (1, 2, 2, 8, 8)
+    assert first.target_batch.surf_vars["2t"].shape == (1, 1, 8, 8)
+
+    # Same underlying cube for every pair and every batch
+    storage = surf_in.untyped_storage().data_ptr()
+    assert second.input_batch.surf_vars["2t"].untyped_storage().data_ptr() == storage
+    assert first.target_batch.surf_vars["2t"].untyped_storage().data_ptr() == storage
+    assert first.input_batch.static_vars["lsm"] is second.target_batch.static_vars["lsm"]
+
+    # Values line up with the right timesteps and levels
+    assert torch.equal(
+        first.target_batch.surf_vars["2t"][0, 0], second.input_batch.surf_vars["2t"][0, 1]
+    )
+    assert first.input_batch.surf_vars["2t"].dtype == torch.float32
+    assert first.input_batch.atmos_vars["t"][0, 1, 0, 0, 0].item() == 100.0 + 850
+    assert first.input_batch.atmos_vars["t"][0, 1, 1, 0, 0].item() == 100.0 + 500
+
+    # Latitudes are flipped to decrease with the row index, data flipped with them
+    lat = first.input_batch.metadata.lat
+    assert lat[0] > lat[-1]
+    assert surf_in[0, 0, 0, 0] > surf_in[0, 0, -1, 0]
+    assert first.input_batch.metadata.lon.min() >= 0
+    assert first.input_batch.metadata.time == (times[1],)
+    assert second.target_batch.metadata.time == (times[3],)
+
+
+def test_selection_filters_messages_on_header_keys():
+    selection = GribSelection(
+        short_names=("2t", "t"),
+        levels=(850,),
+        start_time=datetime(2024, 1, 1, 6),
+        end_time=datetime(2024, 1, 1, 12),
+    )
+
+    def message(short_name, level=0, hour=6):
+        return SimpleNamespace(
+            shortName=short_name, level=level, validDate=datetime(2024, 1, 1, hour)
+        )
+
+    assert _selects_message(message("2t"), selection, pressure_level_file=False)
+    assert not _selects_message(message("tcc"), selection, pressure_level_file=False)
+    assert not _selects_message(message("2t", hour=0), selection, pressure_level_file=False)
+    assert not _selects_message(message("2t", hour=18), selection, pressure_level_file=False)
+    assert _selects_message(message("t", level=850), selection, pressure_level_file=True)
+    assert not _selects_message(message("t", level=500), selection, pressure_level_file=True)
+
+    # Only the model's variables are decoded when building cubes
+    restricted = model_selection(selection)
+    assert "tcc" not in restricted.short_names and "lsm" in restricted.short_names
+    assert restricted.levels == (850,)
+
+
+def test_window_slices_cover_requested_sub_window():
+    lons, lats = np.meshgrid(np.arange(-10.0, 10.5, 0.5), np.arange(50.0, 29.5, -0.5))
+    rows, cols = _window_slices(
+        lats, lons, GribSelection(lat_range=(40.0, 45.0), lon_range=(355.0, 2.0))
+    )
+    assert lats[rows, 0].max() == 45.0 and lats[rows, 0].min() == 40.0
+    assert lons[0, cols].min() == -5.0 and lons[0, cols].max() == 2.0
+
+    with pytest.raises(ValueError, match="no grid points"):
+        _window_slices(lats, lons, GribSelection(lat_range=(60.0, 70.0)))
+
+
+def test_parallel_decoding_matches_serial():
+    """Process-pool decoding, including message-range shards, assembles the same fields."""
+    single_level_file = TESTS_DIR / "inputs/era5_single_level_western_usa_jan_1_to_7.grib"
+    pressure_level_file = TESTS_DIR / "inputs/era5_pressure_level_western_usa_jan_1_to_7.grib"
+
+    serial = extract_raw_data_from_grib_files(single_level_file, pressure_level_file)
+    # 4 workers over 2 files: each file is split into 2 message ranges
+    parallel = extract_raw_data_from_grib_files(single_level_file, pressure_level_file, workers=4)
+
+    assert parallel["sorted_times"] == serial["sorted_times"]
+    assert parallel["pressure_levels"] == serial["pressure_levels"]
+    np.testing.assert_array_equal(parallel["lats"], serial["lats"])
+    np.testing.assert_array_equal(parallel["lons"], serial["lons"])
+    for group in ("surf_data", "atmos_data"):
+        assert parallel[group].keys() == serial[group].keys()
+        for name, fields in serial[group].items():
+            assert parallel[group][name].keys() == fields.keys()
+            for key, field in fields.items():
+                np.testing.assert_array_equal(parallel[group][name][key], field)
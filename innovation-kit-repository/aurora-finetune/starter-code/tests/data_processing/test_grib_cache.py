@@ -0,0 +1,192 @@
+"""Tests for the on-disk cache of decoded GRIB cubes."""
+
+import json
+import os
+import pickle
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from vibe_tune_aurora.data_processing import extract_data_from_grib, grib_cache
+from vibe_tune_aurora.data_processing.data_utils import create_lazy_dataset
+from vibe_tune_aurora.types import GribCubes, GribSelection
+
+
+def _write_fake_gribs(tmp_path: Path) -> tuple[Path, Path]:
+    """The cache only hashes file bytes, so arbitrary content stands in for GRIB files."""
+    single_level_file = tmp_path / "single.grib"
+    pressure_level_file = tmp_path / "pressure.grib"
+    single_level_file.write_bytes(b"single-level v1")
+    pressure_level_file.write_bytes(b"pressure-level v1")
+    return single_level_file, pressure_level_file
+
+
+def _raw_grib_data(n_times=4, height=8, width=8, levels=(850, 500)):
+    times = [datetime(2024, 1, 1) + timedelta(hours=6 * i) for i in range(n_times)]
+    lons, lats = np.meshgrid(np.linspace(235.0, 250.0, width), np.linspace(48.0, 30.0, height))
+    field = np.ones((height, width))
+    surf_data = {
+        name: {t: field * i for i, t in enumerate(times)} for name in ("2t", "10u", "10v", "msl")
+    }
+    surf_data["lsm"] = {times[0]: field}
+    atmos_data = {
+        name: {(t, level): field * level for t in times for level in levels}
+        for name in ("t", "u", "v", "q", "z")
+    }
+    return {
+        "surf_data": surf_data,
+        "atmos_data": atmos_data,
+        "sorted_times": times,
+        "lats": lats,
+        "lons": lons,
+        "pressure_levels": list(levels),
+    }
+
+
+def _count_decodes(monkeypatch) -> list[int]:
+    calls = []
+
+    def fake_extract(single_level_file, pressure_level_file, selection=None, workers=1):
+        calls.append(1)
+        return _raw_grib_data()
+
+    monkeypatch.setattr(extract_data_from_grib, "extract_raw_data_from_grib_files", fake_extract)
+    return calls
+
+
+def test_save_and_load_round_trip(tmp_path):
+    cubes = GribCubes(
+        surf_vars={"2t": torch.arange(2 * 4 * 4, dtype=torch.float32).reshape(2, 4, 4)},
+        static_vars={"lsm": torch.ones(4, 4, dtype=torch.float64)},
+        atmos_vars={"t": torch.zeros(2, 3, 4, 4)},
+        times=[datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 6)],
+        lat=torch.linspace(40.0, 37.0, 4),
+        lon=torch.linspace(240.0, 243.0, 4),
+        pressure_levels=[850, 500, 250],
+    )
+    entry_dir = tmp_path / "entry"
+    grib_cache.save_cubes(cubes, entry_dir)
+    loaded = grib_cache.load_cubes(entry_dir)
+
+    assert loaded is not None
+    assert torch.equal(loaded.surf_vars["2t"], cubes.surf_vars["2t"])
+    assert loaded.static_vars["lsm"].dtype == torch.float64
+    assert loaded.atmos_vars["t"].shape == (2, 3, 4, 4)
+    assert loaded.times == cubes.times
+    assert loaded.pressure_levels == [850, 500, 250]
+    assert torch.equal(loaded.lat, cubes.lat)
+
+
+def test_incomplete_or_stale_entries_are_ignored(tmp_path):
+    assert grib_cache.load_cubes(tmp_path / "missing") is None
+
+    entry_dir = tmp_path / "entry"
+    entry_dir.mkdir()
+    (entry_dir / grib_cache.METADATA_FILE).write_text('{"version": 0}')
+    assert grib_cache.load_cubes(entry_dir) is None
+
+
+def test_cache_key_tracks_content_and_patch_size(tmp_path):
+    cache_dir = tmp_path / "cache"
+    single, pressure = _write_fake_gribs(tmp_path)
+    key = grib_cache.cache_key(single, pressure, 4, cache_dir)
+
+    assert grib_cache.cache_key(single, pressure, 4, cache_dir) == key
+    assert grib_cache.cache_key(single, pressure, 8, cache_dir) != key
+
+    # Touching a file re-hashes it but keeps the same key
+    stat = single.stat()
+    os.utime(single, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert grib_cache.cache_key(single, pressure, 4, cache_dir) == key
+
+    # A GRIB selection produces different cubes and gets its own entry
+    window = GribSelection(lat_range=(30.0, 40.0))
+    assert grib_cache.cache_key(single, pressure, 4, cache_dir, window) != key
+    # ... but an empty selection decodes the same data as none
+    assert grib_cache.cache_key(single, pressure, 4, cache_dir, GribSelection()) == key
+
+    # Changing the content invalidates the entry
+    pressure.write_bytes(b"pressure-level v2")
+    assert grib_cache.cache_key(single, pressure, 4, cache_dir) != key
+
+    # The digest index keeps one entry per file, however often it changes
+    index = json.loads((cache_dir / grib_cache.HASH_INDEX_FILE).read_text())
+    assert sorted(key.rsplit(":", 2)[0] for key in index) == sorted(
+        [str(single.resolve()), str(pressure.resolve())]
+    )
+
+
+def test_extraction_uses_cache_until_files_change(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    single, pressure = _write_fake_gribs(tmp_path)
+    decodes = _count_decodes(monkeypatch)
+
+    first = extract_data_from_grib.extract_training_data_from_grib(
+        single, pressure, patch_size=4, cache_dir=cache_dir
+    )
+    second = extract_data_from_grib.extract_training_data_from_grib(
+        single, pressure, patch_size=4, skip_first_n_timesteps=1, cache_dir=cache_dir
+    )
+    assert len(decodes) == 1
+    assert len(first) == 2 and len(second) == 1
+    assert torch.equal(
+        first[1].input_batch.surf_vars["2t"], second[0].input_batch.surf_vars["2t"]
+    )
+
+    single.write_bytes(b"single-level v2")
+    extract_data_from_grib.extract_training_data_from_grib(
+        single, pressure, patch_size=4, cache_dir=cache_dir
+    )
+    assert len(decodes) == 2
+
+
+def test_cache_many_decodes_each_missing_entry_once(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    single, pressure = _write_fake_gribs(tmp_path)
+    decodes = _count_decodes(monkeypatch)
+
+    entries = extract_data_from_grib.cache_variable_cubes_many(
+        [(single, pressure), (single, pressure)], patch_size=4, cache_dir=cache_dir
+    )
+    assert len(decodes) == 1
+    assert entries[0] == entries[1]
+    assert grib_cache.load_times(entries[0]) is not None
+
+
+def test_extraction_without_cache_dir_always_decodes(tmp_path, monkeypatch):
+    single, pressure = _write_fake_gribs(tmp_path)
+    decodes = _count_decodes(monkeypatch)
+
+    for _ in range(2):
+        extract_data_from_grib.extract_training_data_from_grib(single, pressure, patch_size=4)
+    assert len(decodes) == 2
+    assert not list(tmp_path.glob("*/metadata.json"))
+
+
+def test_lazy_dataset_matches_eager_pairs(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    single, pressure = _write_fake_gribs(tmp_path)
+    decodes = _count_decodes(monkeypatch)
+
+    eager = extract_data_from_grib.extract_training_data_from_grib(
+        single, pressure, patch_size=4, skip_first_n_timesteps=1
+    )
+    lazy = create_lazy_dataset(
+        single, pressure, patch_size=4, skip_first_n_timesteps=1, cache_dir=cache_dir
+    )
+    assert len(decodes) == 2
+    assert len(lazy) == len(eager) == 1
+    # Nothing is mapped until a sample is requested
+    assert lazy._cubes is None
+
+    input_batch, target_batch = lazy[0]
+    assert input_batch.metadata.time == eager[0].input_batch.metadata.time
+    assert torch.equal(input_batch.surf_vars["2t"], eager[0].input_batch.surf_vars["2t"])
+    assert torch.equal(target_batch.atmos_vars["z"], eager[0].target_batch.atmos_vars["z"])
+
+    # Pickled copies (DataLoader workers) carry only the index, not the mapped arrays
+    restored = pickle.loads(pickle.dumps(lazy))
+    assert restored._cubes is None
+    assert torch.equal(restored[0][0].surf_vars["2t"], input_batch.surf_vars["2t"])
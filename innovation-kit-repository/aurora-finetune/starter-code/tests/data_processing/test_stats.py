@@ -0,0 +1,80 @@
+"""Tests for streaming normalization statistics and the stats-file loaders."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from vibe_tune_aurora.data_processing import data_utils
+from vibe_tune_aurora.data_processing.stats import (
+    WelfordAccumulator,
+    accumulate_netcdf_file,
+    write_stats_file,
+)
+
+
+def test_welford_updates_and_merges_match_numpy():
+    rng = np.random.default_rng(0)
+    chunks = [rng.normal(300.0, 20.0, size=(16, 16)) for _ in range(6)]
+    chunks[2][0, 0] = np.nan  # NaNs are ignored
+
+    left, right = WelfordAccumulator(), WelfordAccumulator()
+    for chunk in chunks[:4]:
+        left.update(chunk)
+    for chunk in chunks[4:]:
+        right.update(chunk)
+    left.merge(right)
+
+    values = np.concatenate([chunk.ravel() for chunk in chunks])
+    values = values[np.isfinite(values)]
+    assert left.count == values.size
+    assert left.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert left.std == pytest.approx(values.std(), rel=1e-12)
+
+
+def test_stats_file_round_trip_and_process_cache(tmp_path, monkeypatch):
+    surface = WelfordAccumulator()
+    surface.update(np.array([1.0, 3.0]))
+    stats_file = tmp_path / "stats.json"
+    write_stats_file({"2t": surface}, stats_file)
+
+    assert json.loads(stats_file.read_text())["2t"]["count"] == 2
+    assert data_utils.load_surface_stats(stats_file) == {"2t": (2.0, 1.0)}
+    assert data_utils.load_normalization_stats(("2t",), stats_file) == {"2t": (2.0, 1.0)}
+
+    # Repeated loads reuse the parsed file until it changes on disk
+    reads = []
+    monkeypatch.setattr(data_utils.json, "load", lambda f: reads.append(f) or {})
+    data_utils.load_surface_stats(stats_file)
+    assert reads == []
+
+    stat = stats_file.stat()
+    os.utime(stats_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert data_utils.load_surface_stats(stats_file) == {}
+    assert len(reads) == 1
+
+
+def test_netcdf_stats_use_grib_short_names_and_skip_pressure_levels(tmp_path):
+    xr = pytest.importorskip("xarray")
+    rng = np.random.default_rng(0)
+    t2m = rng.normal(280.0, 5.0, size=(3, 4, 5))
+    dims = ("valid_time", "latitude", "longitude")
+    ds = xr.Dataset(
+        {
+            "t2m": (dims, t2m),
+            "u10": (dims, rng.normal(size=(3, 4, 5))),
+            "t": (("valid_time", "pressure_level", "latitude", "longitude"), np.ones((3, 2, 4, 5))),
+        },
+        coords={"pressure_level": [850, 500]},
+    )
+    path = tmp_path / "era5.nc"
+    ds.to_netcdf(path)
+
+    accumulators = accumulate_netcdf_file(path)
+    assert sorted(accumulators) == ["10u", "2t"]
+    assert accumulators["2t"].mean == pytest.approx(t2m.mean())
+
+    stats_file = tmp_path / "stats.json"
+    write_stats_file(accumulators, stats_file)
+    assert data_utils.load_normalization_stats(("2t", "10u"), stats_file).keys() == {"2t", "10u"}
@@ -3,7 +3,22 @@ Tests for aurora_module.py
 """
 
 from pathlib import Path
+
+import torch
+from torch.utils.data import ConcatDataset
+
+from vibe_tune_aurora import aurora_module
 from vibe_tune_aurora.aurora_module import LitAurora, create_default_aurora_lightning_module
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS
+from vibe_tune_aurora.cli.benchmark_dataloader import synthetic_cubes
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.data_processing.data_utils import (
+    IndexedDataset,
+    LazyERA5Dataset,
+    create_dataloader,
+    load_normalization_stats,
+    load_surface_stats,
+)
 
 TESTS_DIR = Path(__file__).parent
 
@@ -11,6 +26,150 @@ TESTS_DIR = Path(__file__).parent
 def test_create_default_aurora_lit_module():
     lit_module = create_default_aurora_lightning_module(
         log_dir=TESTS_DIR / "outputs/tb_logs",
-        num_training_samples=100,  # arbitrary num samples for this test
+        steps_per_epoch=100,  # arbitrary number of steps for this test
     )
     assert isinstance(lit_module, LitAurora)
+
+
+def test_restore_from_checkpoint_skips_initialization(tmp_path, monkeypatch):
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("2t",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t",)),
+    )
+    checkpoint = {
+        "hyper_parameters": dict(lit_module.hparams),
+        "state_dict": lit_module.state_dict(),
+    }
+    lit_module.on_save_checkpoint(checkpoint)
+    checkpoint_path = tmp_path / "model.ckpt"
+    torch.save(checkpoint, checkpoint_path)
+
+    def fail(**kwargs):
+        raise AssertionError("restoring must not initialize (or download) a model")
+
+    monkeypatch.setattr(aurora_module, "create_aurora_model", fail)
+    restored = LitAurora.restore_from_checkpoint(checkpoint_path)
+
+    assert restored.model.surf_vars == lit_module.model.surf_vars
+    assert restored.hparams.init_mode == "initialized_and_custom"
+    for name, tensor in lit_module.state_dict().items():
+        assert torch.equal(restored.state_dict()[name], tensor)
+
+    # Checkpoints without a recorded architecture are rebuilt from their state dict
+    del checkpoint["aurora_architecture"]
+    torch.save(checkpoint, checkpoint_path)
+    assert LitAurora.restore_from_checkpoint(checkpoint_path).model.surf_vars == (
+        lit_module.model.surf_vars
+    )
+
+
+def test_frozen_parameters_are_left_out_of_the_optimizer(tmp_path):
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("uvb",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("uvb",)),
+        trainable="lora",
+    )
+    optimizer = lit_module.configure_optimizers()
+    optimized = {id(p) for group in optimizer.param_groups for p in group["params"]}
+    assert optimized == {id(p) for p in lit_module.parameters() if p.requires_grad}
+    assert len(optimized) < len(list(lit_module.parameters()))
+
+    # LoRA adapters are recreated from hparams, so the checkpoint restores strictly
+    checkpoint = {
+        "hyper_parameters": dict(lit_module.hparams),
+        "state_dict": lit_module.state_dict(),
+    }
+    lit_module.on_save_checkpoint(checkpoint)
+    torch.save(checkpoint, tmp_path / "lora.ckpt")
+    restored = LitAurora.restore_from_checkpoint(tmp_path / "lora.ckpt")
+    assert restored.state_dict().keys() == lit_module.state_dict().keys()
+
+
+def test_restore_without_architecture_keeps_custom_surface_variables(tmp_path, monkeypatch):
+    # Custom variables in a non-default order; the encoder also embeds the static variables
+    surf_vars = ("msl", "2t", "uvb", "10u", "10v")
+    lit_module = LitAurora(
+        surf_vars=surf_vars,
+        target_vars=("2t",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t",)),
+    )
+    checkpoint = {
+        "hyper_parameters": dict(lit_module.hparams),
+        "state_dict": lit_module.state_dict(),
+    }
+    checkpoint_path = tmp_path / "old.ckpt"
+    torch.save(checkpoint, checkpoint_path)
+
+    def fail(**kwargs):
+        raise AssertionError("restoring must not initialize (or download) a model")
+
+    monkeypatch.setattr(aurora_module, "create_aurora_model", fail)
+    restored = LitAurora.restore_from_checkpoint(checkpoint_path, map_location="cpu")
+
+    assert restored.model.surf_vars == surf_vars
+    restored_state = restored.state_dict()
+    assert restored_state.keys() == checkpoint["state_dict"].keys()
+    for name, tensor in checkpoint["state_dict"].items():
+        assert torch.equal(restored_state[name], tensor)
+
+
+def test_checkpoints_with_num_training_samples_hparam_still_restore(tmp_path):
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("2t",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t",)),
+        steps_per_epoch=12,
+    )
+    hparams = dict(lit_module.hparams)
+    # Checkpoints saved before the rename carry the former hparam name
+    hparams["num_training_samples"] = hparams.pop("steps_per_epoch")
+    checkpoint_path = tmp_path / "old.ckpt"
+    checkpoint = {"hyper_parameters": hparams, "state_dict": lit_module.state_dict()}
+    torch.save(checkpoint, checkpoint_path)
+
+    restored = LitAurora.restore_from_checkpoint(checkpoint_path, map_location="cpu")
+
+    assert restored.steps_per_epoch == restored.hparams["steps_per_epoch"] == 12
+    assert "num_training_samples" not in restored.hparams
+
+
+def test_validation_target_cache_keeps_regions_with_equal_times_apart(tmp_path):
+    # Two regions covering the same dates, as several GRIB files joined with ConcatDataset
+    regions = []
+    for name in ("north", "south"):
+        cubes = synthetic_cubes(n_times=4, height=16, width=32, pressure_levels=(1000, 850, 500))
+        grib_cache.save_cubes(cubes, tmp_path / name)
+        regions.append(LazyERA5Dataset(tmp_path / name))
+    dataset = ConcatDataset(regions)
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("2t", "msl"),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t", "msl")),
+        val_target_cache_mb=1,
+    ).eval()
+
+    with torch.no_grad():
+        expected = [
+            lit_module.compute_mae_loss(lit_module(input_batch), target_batch)[0]
+            for input_batch, target_batch in create_dataloader(dataset, shuffle=False)
+        ]
+        loader = create_dataloader(IndexedDataset(dataset), shuffle=False)
+        for _ in range(2):  # Fills the cache, then validates from it
+            losses = [
+                lit_module.validation_losses(lit_module.on_before_batch_transfer(batch, 0))[0]
+                for batch in loader
+            ]
+            assert torch.allclose(torch.stack(losses), torch.stack(expected))
+    assert sorted(lit_module._val_target_cache) == list(range(len(dataset)))
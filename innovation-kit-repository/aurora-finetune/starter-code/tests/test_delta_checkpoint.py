@@ -0,0 +1,81 @@
+"""
+Tests for delta_checkpoint.py
+"""
+
+import pytest
+import torch
+
+from vibe_tune_aurora.aurora_module import LitAurora
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS
+from vibe_tune_aurora.data_processing.data_utils import (
+    load_normalization_stats,
+    load_surface_stats,
+)
+from vibe_tune_aurora.delta_checkpoint import save_delta_checkpoint
+
+
+def _lit_module(**kwargs) -> LitAurora:
+    return LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("uvb",),
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("uvb",)),
+        **kwargs,
+    )
+
+
+def _save_full_checkpoint(lit_module: LitAurora, path) -> None:
+    checkpoint = {
+        "hyper_parameters": dict(lit_module.hparams),
+        "state_dict": lit_module.state_dict(),
+    }
+    lit_module.on_save_checkpoint(checkpoint)
+    torch.save(checkpoint, path)
+
+
+def _assert_same_weights(restored: LitAurora, lit_module: LitAurora) -> None:
+    restored_state = restored.state_dict()
+    for name, tensor in lit_module.state_dict().items():
+        assert torch.equal(restored_state[name], tensor), name
+
+
+def test_delta_stores_only_trainable_weights_of_a_base(tmp_path):
+    base_path = tmp_path / "base.ckpt"
+    _save_full_checkpoint(_lit_module(init_mode="initialized_and_custom"), base_path)
+
+    lit_module = _lit_module(
+        init_mode="initializer_checkpoint",
+        initializer_checkpoint_path=str(base_path),
+        trainable="heads-only",
+    )
+    with torch.no_grad():
+        lit_module.model.decoder.surf_heads["uvb"].weight.add_(1.0)
+    delta_path = tmp_path / "last.ckpt"
+    save_delta_checkpoint(lit_module, delta_path, epoch=2, global_step=10)
+
+    assert delta_path.stat().st_size < base_path.stat().st_size / 5
+    delta = torch.load(delta_path, weights_only=False)
+    assert delta["base"]["path"] == str(base_path.resolve())
+    assert all(
+        name.startswith(("model.encoder.surf_token_embeds.", "model.decoder.surf_heads."))
+        for name in delta["state_dict"]
+    )
+
+    restored = LitAurora.restore_from_checkpoint(delta_path)
+    _assert_same_weights(restored, lit_module)
+
+    # A changed base checkpoint would silently give other frozen weights
+    base_path.write_bytes(base_path.read_bytes() + b"\0")
+    with pytest.raises(ValueError, match="has changed"):
+        LitAurora.restore_from_checkpoint(delta_path)
+
+
+def test_delta_without_base_stores_every_weight(tmp_path):
+    lit_module = _lit_module(init_mode="initialized_and_custom", trainable="heads-only")
+    delta_path = tmp_path / "init.ckpt"
+    save_delta_checkpoint(lit_module, delta_path)
+
+    delta = torch.load(delta_path, weights_only=False)
+    assert delta["base"] is None
+    assert delta["state_dict"].keys() == lit_module.state_dict().keys()
+    _assert_same_weights(LitAurora.restore_from_checkpoint(delta_path), lit_module)
@@ -1,10 +1,28 @@
 from pathlib import Path
 
-from vibe_tune_aurora.aurora_module import create_default_aurora_lightning_module
+import numpy as np
+import pytest
+import torch
+
+from vibe_tune_aurora.aurora_module import LitAurora, create_default_aurora_lightning_module
+from vibe_tune_aurora.cli.benchmark_dataloader import synthetic_cubes
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS
+from vibe_tune_aurora.data_processing import grib_cache
+from vibe_tune_aurora.data_processing.data_utils import (
+    LazyERA5Dataset,
+    load_normalization_stats,
+    load_surface_stats,
+)
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
     extract_training_data_from_grib,
+    extract_variable_cubes,
+)
+from vibe_tune_aurora.evaluation import (
+    evaluate_checkpoints,
+    evaluate_model,
+    evaluate_rollout,
+    format_comparison_table,
 )
-from vibe_tune_aurora.evaluation import evaluate_model
 
 TESTS_DIR = Path(__file__).parent
 
@@ -20,16 +38,19 @@ def test_evaluation_pretrained_model_2t_var():
 
     # Output path
     output_json = TESTS_DIR / "outputs/evaluation_results_test.json"
+    output_npz = TESTS_DIR / "outputs/evaluation_error_maps_test.npz"
 
     # Run evaluation
     results = evaluate_model(
         aurora_lightning_module=create_default_aurora_lightning_module(
             log_dir=TESTS_DIR / "outputs/tb_logs",
-            num_training_samples=len(training_data_pairs),
+            steps_per_epoch=len(training_data_pairs),
         ),
         evaluation_data_pairs=training_data_pairs,
         target_vars=("2t",),
         output_json=output_json,
+        output_npz=output_npz,
+        batch_size=2,
     )
 
     # Assertions
@@ -52,3 +73,104 @@ def test_evaluation_pretrained_model_2t_var():
     assert results["std_mae"] >= 0, "Std MAE should be non-negative"
     assert results["min_mae"] >= 0, "Min MAE should be non-negative"
     assert results["max_mae"] >= 0, "Max MAE should be non-negative"
+
+    # Per-variable metrics and per-grid-cell error maps
+    assert set(results["per_variable"]["2t"]) == {"mae", "rmse", "bias"}
+    assert results["per_variable"]["2t"]["rmse"] >= results["per_variable"]["2t"]["mae"]
+    with np.load(output_npz) as maps:
+        assert maps["2t_mae"].shape == (len(maps["lat"]), len(maps["lon"]))
+
+
+def _save_checkpoint(path: Path, seed: int) -> Path:
+    torch.manual_seed(seed)
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("2t",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t",)),
+    )
+    checkpoint = {
+        "hyper_parameters": dict(lit_module.hparams),
+        "state_dict": lit_module.state_dict(),
+    }
+    lit_module.on_save_checkpoint(checkpoint)
+    torch.save(checkpoint, path)
+    return path
+
+
+def test_evaluate_checkpoints_sequential_and_parallel_agree(tmp_path):
+    cubes = synthetic_cubes(n_times=4, height=16, width=32, pressure_levels=(1000, 850, 500))
+    grib_cache.save_cubes(cubes, tmp_path / "entry")
+    dataset = LazyERA5Dataset(tmp_path / "entry")
+    first = _save_checkpoint(tmp_path / "init.ckpt", seed=0)
+    second = _save_checkpoint(tmp_path / "last.ckpt", seed=1)
+
+    with pytest.raises(FileNotFoundError, match="missing.ckpt"):
+        evaluate_checkpoints([first, tmp_path / "missing.ckpt"], dataset, ("2t",))
+
+    # Repeated paths are evaluated once
+    sequential = evaluate_checkpoints([first, second, first], dataset, ("2t",), batch_size=2)
+    parallel = evaluate_checkpoints(
+        [first, second], dataset, ("2t",), batch_size=2, parallel_models=2
+    )
+
+    assert list(sequential) == list(parallel) == [str(first), str(second)]
+    assert sequential[str(first)]["mean_mae"] != sequential[str(second)]["mean_mae"]
+    for path, results in sequential.items():
+        assert results["num_samples"] == parallel[path]["num_samples"] == len(dataset)
+        for key in ("mean_mae", "std_mae", "min_mae", "max_mae"):
+            assert parallel[path][key] == pytest.approx(results[key], rel=1e-5)
+        assert parallel[path]["per_variable"]["2t"] == pytest.approx(
+            results["per_variable"]["2t"], rel=1e-5
+        )
+
+
+def test_format_comparison_table_has_one_row_per_checkpoint():
+    def results(mae):
+        return {
+            "num_samples": 24,
+            "mean_mae": mae,
+            "std_mae": 0.1,
+            "per_variable": {"2t": {"mae": mae * 20, "rmse": mae * 25, "bias": -0.5}},
+        }
+
+    table = format_comparison_table(
+        {"runs/init.ckpt": results(0.5), "runs/last.ckpt": results(0.25)}, ("2t",)
+    )
+    lines = table.splitlines()
+    assert lines[0].split() == [
+        "checkpoint", "samples", "mean_mae", "std_mae", "2t_mae", "2t_rmse", "2t_bias"
+    ]
+    assert lines[3].split()[:3] == ["runs/last.ckpt", "24", "0.250000"]
+    assert len({len(line) for line in lines}) == 1
+
+
+def test_rollout_evaluation_reports_each_lead_time():
+    single_level = TESTS_DIR / "inputs/era5_single_level_western_usa_jan_1_to_7.grib"
+    pressure_level = TESTS_DIR / "inputs/era5_pressure_level_western_usa_jan_1_to_7.grib"
+    cubes = extract_variable_cubes(single_level, pressure_level)
+
+    results = evaluate_rollout(
+        aurora_lightning_module=create_default_aurora_lightning_module(
+            log_dir=TESTS_DIR / "outputs/tb_logs",
+            steps_per_epoch=1,
+        ),
+        cubes=cubes,
+        target_vars=("2t",),
+        steps=2,
+        batch_size=2,
+    )
+
+    # Each rollout needs one timestep of history and two later timesteps
+    assert results["num_rollouts"] == len(cubes.times) - 3
+    assert [entry["lead_time_hours"] for entry in results["lead_times"]] == [6.0, 12.0]
+    for entry in results["lead_times"]:
+        assert entry["num_samples"] == results["num_rollouts"]
+        assert entry["per_variable"]["2t"]["rmse"] >= entry["per_variable"]["2t"]["mae"] >= 0
+
+
+def test_rollout_longer_than_data_is_rejected():
+    cubes = synthetic_cubes(n_times=4, height=8, width=8, pressure_levels=(850,))
+    with pytest.raises(ValueError, match="3-step rollout"):
+        evaluate_rollout(None, cubes, ("2t",), steps=3)
@@ -0,0 +1,81 @@
+"""
+Tests for losses.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from vibe_tune_aurora.losses import (
+    compute_mae_loss,
+    fused_mae_loss,
+    inverse_std_tensor,
+    stack_targets,
+    stacked_mae_loss,
+)
+
+NORM_STATS = {"2t": (280.0, 20.0), "tcc": (0.5, 0.3), "msl": (101000.0, 1000.0)}
+
+
+def _batch(surf_vars):
+    return SimpleNamespace(surf_vars=surf_vars)
+
+
+def _reference_loss(prediction, target, target_vars):
+    losses = []
+    for name in target_vars:
+        mean, std = NORM_STATS[name]
+        pred_norm = (prediction.surf_vars[name] - mean) / std
+        target_norm = (target.surf_vars[name] - mean) / std
+        losses.append(torch.mean(torch.abs(pred_norm - target_norm)))
+    return torch.stack(losses).mean()
+
+
+def test_fused_loss_matches_per_variable_normalization():
+    torch.manual_seed(0)
+    target_vars = ("2t", "tcc", "msl")
+    prediction = _batch({name: torch.randn(2, 1, 6, 8) * 10 for name in target_vars})
+    target = _batch({name: torch.randn(2, 1, 6, 8) * 10 for name in target_vars})
+
+    loss, per_variable = fused_mae_loss(
+        prediction, target, target_vars, inverse_std_tensor(target_vars, NORM_STATS)
+    )
+
+    assert torch.allclose(loss, _reference_loss(prediction, target, target_vars))
+    assert list(per_variable) == list(target_vars)
+    assert torch.allclose(per_variable["tcc"], _reference_loss(prediction, target, ("tcc",)))
+
+
+def test_loss_over_per_sample_stacked_targets_matches_fused_loss():
+    torch.manual_seed(0)
+    target_vars = ("2t", "tcc")
+    inv_std = inverse_std_tensor(target_vars, NORM_STATS)
+    prediction = _batch({name: torch.randn(3, 1, 6, 8) for name in target_vars})
+    target = _batch({name: torch.randn(3, 1, 6, 8) for name in target_vars})
+
+    # As LitAurora reassembles a batch from its validation target cache
+    stacked = stack_targets(target, target_vars)
+    samples = [stacked[:, i : i + 1].clone() for i in range(3)]
+    loss, per_variable = stacked_mae_loss(
+        prediction, torch.cat(samples, dim=1), target_vars, inv_std
+    )
+
+    expected_loss, expected_per_variable = fused_mae_loss(prediction, target, target_vars, inv_std)
+    assert torch.allclose(loss, expected_loss)
+    assert torch.allclose(per_variable["tcc"], expected_per_variable["tcc"])
+
+
+def test_variables_missing_from_a_batch_are_skipped():
+    prediction = _batch({"2t": torch.ones(1, 1, 4, 4), "tcc": torch.zeros(1, 1, 4, 4)})
+    target = _batch({"2t": torch.zeros(1, 1, 4, 4)})
+
+    loss, n_vars = compute_mae_loss(prediction, target, ("2t", "tcc"), NORM_STATS, "cpu")
+
+    assert n_vars == 1
+    assert loss.item() == pytest.approx(1.0 / 20.0)
+
+
+def test_missing_statistics_raise():
+    with pytest.raises(ValueError, match="uvb"):
+        inverse_std_tensor(("2t", "uvb"), NORM_STATS)
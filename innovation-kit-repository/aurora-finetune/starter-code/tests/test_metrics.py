@@ -0,0 +1,67 @@
+"""
+Tests for metrics.py
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from vibe_tune_aurora.metrics import ErrorMapAccumulator, StreamingErrorMetrics
+
+
+def _batch(surf_vars):
+    return SimpleNamespace(surf_vars=surf_vars)
+
+
+def test_error_maps_match_full_statistics_across_batches():
+    torch.manual_seed(0)
+    errors = torch.randn(7, 1, 5, 6) * 3 + 1
+    accumulator = ErrorMapAccumulator(errors.shape[-2:], torch.device("cpu"))
+    for chunk in errors.split([3, 1, 3]):
+        accumulator.update(chunk)
+
+    maps = accumulator.maps()
+    expected = errors.squeeze(1).double().numpy()
+    np.testing.assert_allclose(maps["bias"], expected.mean(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(maps["error_std"], expected.std(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(maps["mae"], np.abs(expected).mean(axis=0), rtol=1e-6)
+
+    with pytest.raises(ValueError, match="grid"):
+        accumulator.update(torch.zeros(1, 1, 4, 6))
+
+
+def test_streaming_metrics_per_variable_and_per_sample():
+    torch.manual_seed(0)
+    target_vars = ("2t", "tcc")
+    inv_std = torch.tensor([1 / 20.0, 1 / 0.3])
+    metrics = StreamingErrorMetrics(target_vars, inv_std, "cpu")
+    predictions = {name: torch.randn(4, 1, 3, 3) for name in target_vars}
+    targets = {name: torch.randn(4, 1, 3, 3) for name in target_vars}
+    for batch in (slice(0, 3), slice(3, 4)):
+        metrics.update(
+            _batch({name: tensor[batch] for name, tensor in predictions.items()}),
+            _batch({name: tensor[batch] for name, tensor in targets.items()}),
+        )
+
+    results = metrics.compute()
+    assert results["num_samples"] == 4
+    errors = (predictions["2t"] - targets["2t"]).double()
+    assert results["per_variable"]["2t"]["mae"] == pytest.approx(errors.abs().mean().item())
+    assert results["per_variable"]["2t"]["rmse"] == pytest.approx(
+        errors.square().mean().sqrt().item()
+    )
+    assert results["per_variable"]["2t"]["bias"] == pytest.approx(errors.mean().item())
+
+    # Per-sample losses are the normalized MAE averaged over variables
+    sample_losses = torch.stack(
+        [
+            (predictions[name] - targets[name]).abs().flatten(1).mean(dim=1) * inv_std[i]
+            for i, name in enumerate(target_vars)
+        ]
+    ).mean(dim=0)
+    assert results["max_mae"] == pytest.approx(sample_losses.max().item())
+    assert set(metrics.maps()) == {
+        f"{name}_{kind}" for name in target_vars for kind in ("bias", "error_std", "mae")
+    }
@@ -0,0 +1,71 @@
+"""
+Tests for trainable.py
+"""
+
+import pytest
+from aurora.model.lora import LoRARollout
+
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS
+from vibe_tune_aurora.data_processing.data_utils import load_surface_stats
+from vibe_tune_aurora.model_init import build_aurora_architecture
+from vibe_tune_aurora.trainable import (
+    backbone_blocks,
+    configure_trainable,
+    count_parameters,
+    parse_trainable,
+)
+
+
+def _model():
+    return build_aurora_architecture(DEFAULT_SURF_VARS, load_surface_stats())
+
+
+def _trainable_names(model):
+    return {name for name, p in model.named_parameters() if p.requires_grad}
+
+
+def test_parse_trainable():
+    assert parse_trainable("full") == ("full", 0)
+    assert parse_trainable("heads+last-3-blocks") == ("heads+last-N-blocks", 3)
+    with pytest.raises(ValueError, match="Invalid trainable"):
+        parse_trainable("heads+last-blocks")
+
+
+def test_heads_only_trains_embeddings_and_heads():
+    model = _model()
+    configure_trainable(model, "heads-only")
+
+    names = _trainable_names(model)
+    assert "encoder.surf_token_embeds.weights.uvb" in names
+    assert any(name.startswith("decoder.surf_heads.") for name in names)
+    assert all(
+        name.startswith(("encoder.surf_token_embeds.", "decoder.surf_heads.")) for name in names
+    )
+
+
+def test_last_blocks_are_trained_in_forward_order():
+    model = _model()
+    configure_trainable(model, "heads+last-2-blocks")
+
+    blocks = backbone_blocks(model)
+    assert all(p.requires_grad for block in blocks[-2:] for p in block.parameters())
+    assert not any(p.requires_grad for p in blocks[-3].parameters())
+    with pytest.raises(ValueError, match="backbone blocks"):
+        configure_trainable(_model(), f"heads+last-{len(blocks) + 1}-blocks")
+
+
+def test_lora_adds_trainable_adapters_once():
+    model = _model()
+    _, total_before = count_parameters(model)
+    configure_trainable(model, "lora")
+    n_adapters = sum(isinstance(module, LoRARollout) for module in model.modules())
+    n_trainable, total = count_parameters(model)
+
+    assert n_adapters > 0
+    assert total > total_before
+    assert n_trainable < total / 10
+    assert any(".lora_qkv.loras.0.lora_A" in name for name in _trainable_names(model))
+
+    # Configuring again (e.g. when restoring a checkpoint) keeps the existing adapters
+    configure_trainable(model, "lora")
+    assert sum(isinstance(module, LoRARollout) for module in model.modules()) == n_adapters
@@ -1,10 +1,20 @@
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
 
-from vibe_tune_aurora.config import TrainingConfig
+import torch
+
+from vibe_tune_aurora.aurora_module import LitAurora
+from vibe_tune_aurora.callbacks import FullValidationAtEpochEnd
+from vibe_tune_aurora.config import DEFAULT_SURF_VARS, TrainingConfig
+from vibe_tune_aurora.data_processing.data_utils import (
+    load_normalization_stats,
+    load_surface_stats,
+)
 from vibe_tune_aurora.data_processing.extract_data_from_grib import (
     extract_training_data_from_grib,
 )
-from vibe_tune_aurora.training import train_era5_model
+from vibe_tune_aurora.training import apply_execution_options, train_era5_model
 
 TESTS_DIR = Path(__file__).parent
 
@@ -44,3 +54,50 @@ def test_finetuning_2t_var_pretrained():
     )
 
     assert model is not None
+
+
+def test_execution_options_keep_checkpoint_keys():
+    """Activation checkpointing and compilation must not change saved state dict keys."""
+    lit_module = LitAurora(
+        surf_vars=DEFAULT_SURF_VARS,
+        target_vars=("2t",),
+        init_mode="initialized_and_custom",
+        surf_stats=load_surface_stats(),
+        norm_stats=load_normalization_stats(("2t",)),
+    )
+    keys = lit_module.state_dict().keys()
+
+    apply_execution_options(lit_module, activation_checkpointing=True, compile_model=True)
+
+    assert lit_module.state_dict().keys() == keys
+
+
+class _EmptyShardLoader(list):
+    sampler = SimpleNamespace(full_pass=False)
+
+
+def test_full_validation_reduces_every_loss_on_an_empty_shard():
+    """A process without validation samples must still join every all-reduce."""
+    reduced, logged = [], {}
+
+    def reduce(total, reduce_op):
+        reduced.append(total.clone())
+        # Samples seen by the other processes
+        return total + torch.tensor([6.0, 3.0])
+
+    trainer = SimpleNamespace(
+        strategy=SimpleNamespace(batch_to_device=lambda batch: batch, reduce=reduce),
+        precision_plugin=SimpleNamespace(val_step_context=nullcontext),
+    )
+    pl_module = SimpleNamespace(
+        target_vars=("2t", "msl"),
+        device=torch.device("cpu"),
+        eval=lambda: None,
+        train=lambda: None,
+        log=lambda name, value, **kwargs: logged.__setitem__(name, float(value)),
+    )
+
+    FullValidationAtEpochEnd(_EmptyShardLoader()).on_train_epoch_end(trainer, pl_module)
+
+    assert [total.tolist() for total in reduced] == [[0.0, 0.0]] * 3
+    assert logged == {"val_full_loss": 2.0, "val_full_loss_2t": 2.0, "val_full_loss_msl": 2.0}
@@ -8,6 +8,7 @@ try:
     from ..event_agent.itinerary import ItineraryBuilder  # type: ignore
     from ..event_agent.models import InterestProfile  # type: ignore
     from ..event_agent.main import MOCK_SESSIONS  # type: ignore
+    from ..event_agent.telemetry import NULL_TIMER  # type: ignore
     from . import graph_sources  # type: ignore
 except ImportError:
     # Fallback when executed outside package context
@@ -15,6 +16,7 @@ except ImportError:
     from event_agent.itinerary import ItineraryBuilder  # type: ignore
     from event_agent.models import InterestProfile  # type: ignore
     from event_agent.main import MOCK_SESSIONS  # type: ignore
+    from event_agent.telemetry import NULL_TIMER  # type: ignore
     import graph_sources  # type: ignore
 
 
@@ -32,14 +34,20 @@ class RecommendActivity:
         self.publish_itinerary = publish_itinerary
 
     def run(
-        self, interests: List[str], max_sessions: int = 3, user_name: str = "User"
+        self,
+        interests: List[str],
+        max_sessions: int = 3,
+        user_name: str = "User",
+        timer=NULL_TIMER,
     ) -> Dict[str, Any]:
-        profile = InterestProfile(
-            raw_terms=interests, weights={t.lower(): 1.0 for t in interests}
-        )
+        with timer.stage("normalize"):
+            profile = InterestProfile(
+                raw_terms=interests, weights={t.lower(): 1.0 for t in interests}
+            )
 
         # Fetch sessions with telemetry capture
-        dynamic_sessions = graph_sources.fetch_sessions()
+        with timer.stage("session_load"):
+            dynamic_sessions = graph_sources.fetch_sessions()
         if dynamic_sessions:
             source_sessions = dynamic_sessions
             session_source = "graph"
@@ -47,8 +55,9 @@ class RecommendActivity:
             source_sessions = MOCK_SESSIONS
             session_source = "mock"
 
-        ranked = self.scoring.score(source_sessions, profile)
-        itinerary = self.itinerary_builder.build(ranked, max_sessions)
+        ranked = self.scoring.score(source_sessions, profile, timer)
+        with timer.stage("conflicts"):
+            itinerary = self.itinerary_builder.build(ranked, max_sessions)
 
         result: Dict[str, Any] = {
             "sessions": [s.model_dump() for s in itinerary.sessions],
@@ -70,7 +79,8 @@ class RecommendActivity:
                 from .adaptive_cards import build_itinerary_card  # type: ignore
             except ImportError:
                 from adaptive_cards import build_itinerary_card  # type: ignore
-            result["adaptiveCard"] = build_itinerary_card(result)
+            with timer.stage("card_build"):
+                result["adaptiveCard"] = build_itinerary_card(result)
 
         # Publish itinerary to SharePoint if enabled
         if self.publish_itinerary:
@@ -86,13 +96,17 @@ class ExplainActivity:
     def __init__(self, scoring: ScoringEngine | None = None):
         self.scoring = scoring or ScoringEngine()
 
-    def run(self, session_title: str, interests: List[str]) -> Dict[str, Any]:
-        profile = InterestProfile(
-            raw_terms=interests, weights={t.lower(): 1.0 for t in interests}
-        )
-        dynamic_sessions = graph_sources.fetch_sessions()
+    def run(
+        self, session_title: str, interests: List[str], timer=NULL_TIMER
+    ) -> Dict[str, Any]:
+        with timer.stage("normalize"):
+            profile = InterestProfile(
+                raw_terms=interests, weights={t.lower(): 1.0 for t in interests}
+            )
+        with timer.stage("session_load"):
+            dynamic_sessions = graph_sources.fetch_sessions()
         source_sessions = dynamic_sessions if dynamic_sessions else MOCK_SESSIONS
-        ranked = self.scoring.score(source_sessions, profile)
+        ranked = self.scoring.score(source_sessions, profile, timer)
         for r in ranked:
             if r.session.title.lower() == session_title.lower():
                 return {
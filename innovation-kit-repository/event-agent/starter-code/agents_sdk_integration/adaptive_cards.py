@@ -1,107 +1,107 @@
 """Adaptive Card builders for Event Guide responses.
 Produces JSON ready for Teams or other channels supporting Adaptive Cards.
+
+Cards are assembled from a precompiled template: the static header and schema
+are module constants and only per-session slots (title, time range, room) are
+filled in. Rendered cards are cached per (displayed session fields, card
+version) so bursts of identical recommendations (e.g. at session breaks) skip
+card construction, while edited titles/times/rooms render a fresh card.
+Cached cards are shared between callers and must be treated as read-only.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 
 CARD_VERSION = "1.5"
+CARD_SCHEMA = "http://adaptivecards.io/schemas/adaptive-card.json"
+CARD_CACHE_MAX_ENTRIES = 512
 
+_HEADER_BLOCK: Dict[str, Any] = {
+    "type": "TextBlock",
+    "text": "Event Guide Recommendations",
+    "weight": "Bolder",
+    "size": "Medium",
+}
 
-def build_itinerary_card(recommend_result: Dict[str, Any]) -> Dict[str, Any]:
-    sessions: List[Dict[str, Any]] = recommend_result.get("sessions", [])
-    body_items: List[Dict[str, Any]] = [
-        {
-            "type": "TextBlock",
-            "text": "Event Guide Recommendations",
-            "weight": "Bolder",
-            "size": "Medium",
-        }
-    ]
-    body = list(body_items)
-    actions = []
+CardKey = Tuple[Tuple[Tuple[Any, ...], ...], str]
+
+_card_cache: "OrderedDict[CardKey, Dict[str, Any]]" = OrderedDict()
+
+
+def _session_container(idx: int, title: Any, time_range: str, loc: Any) -> Dict[str, Any]:
+    return {
+        "type": "Container",
+        "items": [
+            {"type": "TextBlock", "text": f"{idx}. {title}", "weight": "Bolder"},
+            {
+                "type": "TextBlock",
+                "text": f"{time_range} @ {loc}",
+                "isSubtle": True,
+                "spacing": "None",
+            },
+        ],
+        "style": "default",
+    }
+
+
+def _explain_action(idx: int, title: Any, s: Dict[str, Any], loc: Any) -> Dict[str, Any]:
+    return {
+        "type": "Action.Submit",
+        "title": f"Explain #{idx}",
+        "data": {
+            "action": "explainSession",
+            "sessionTitle": title,
+            "start": s.get("start"),
+            "end": s.get("end"),
+            "room": loc,
+        },
+    }
+
+
+def _render_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    body: List[Dict[str, Any]] = [_HEADER_BLOCK]
+    actions: List[Dict[str, Any]] = []
     for idx, s in enumerate(sessions, start=1):
         title = s.get("title")
-        time_range = f"{s.get('start')} - {s.get('end')}"
         loc = s.get("location")
-        body_items.append(
-            {
-                "type": "Container",
-                "items": [
-                    {"type": "TextBlock", "text": title, "weight": "Bolder"},
-                    {
-                        "type": "TextBlock",
-                        "text": f"{time_range} @ {loc}",
-                        "isSubtle": True,
-                        "spacing": "None",
-                    },
-                ],
-                "style": "emphasis",
-            }
-        )
-        body.append(
-            {
-                "type": "Container",
-                "items": [
-                    {
-                        "type": "TextBlock",
-                        "text": f"{idx}. {title}",
-                        "weight": "Bolder",
-                    },
-                    {
-                        "type": "TextBlock",
-                        "text": f"{time_range} @ {loc}",
-                        "isSubtle": True,
-                        "spacing": "None",
-                    },
-                ],
-                "style": "default",
-            }
-        )
-        actions.append(
-            {
-                "type": "Action.Submit",
-                "title": f"Explain #{idx}",
-                "data": {
-                    "action": "explainSession",
-                    "sessionTitle": title,
-                    "start": s.get("start"),
-                    "end": s.get("end"),
-                    "room": loc,
-                },
-            }
-        )
-    scoring_rows = []
-    for r in recommend_result.get("scoring", []):
-        scoring_rows.append(
-            {
-                "type": "TextBlock",
-                "text": f"{r['title']}: {r['score']:.2f}",
-                "wrap": True,
-            }
-        )
-    if scoring_rows:
-        body_items.append(
-            {
-                "type": "TextBlock",
-                "text": "Scoring",
-                "weight": "Bolder",
-                "spacing": "Medium",
-            }
-        )
-        body_items.extend(scoring_rows)
-    card = {
+        time_range = f"{s.get('start')} - {s.get('end')}"
+        body.append(_session_container(idx, title, time_range, loc))
+        actions.append(_explain_action(idx, title, s, loc))
+    card: Dict[str, Any] = {
         "type": "AdaptiveCard",
         "version": CARD_VERSION,
         "body": body,
-        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+        "$schema": CARD_SCHEMA,
     }
     if actions:
         card["actions"] = actions
     return card
-    return {
-        "type": "AdaptiveCard",
-        "version": CARD_VERSION,
-        "body": body_items,
-        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-    }
+
+
+def card_cache_key(sessions: List[Dict[str, Any]]) -> CardKey:
+    """Cache key for a card: (fields each session renders, card version)."""
+    fields = tuple(
+        (s.get("id"), s.get("title"), s.get("start"), s.get("end"), s.get("location"))
+        for s in sessions
+    )
+    return fields, CARD_VERSION
+
+
+def build_itinerary_card(recommend_result: Dict[str, Any]) -> Dict[str, Any]:
+    sessions: List[Dict[str, Any]] = recommend_result.get("sessions", [])
+    key = card_cache_key(sessions)
+    card = _card_cache.get(key)
+    if card is not None:
+        _card_cache.move_to_end(key)
+        return card
+    card = _render_card(sessions)
+    _card_cache[key] = card
+    if len(_card_cache) > CARD_CACHE_MAX_ENTRIES:
+        _card_cache.popitem(last=False)
+    return card
+
+
+def clear_card_cache() -> None:
+    """Drop cached cards (e.g. when the session catalog is replaced)."""
+    _card_cache.clear()
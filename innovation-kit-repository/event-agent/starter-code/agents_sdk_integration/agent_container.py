@@ -20,6 +20,7 @@ from ..event_agent.scoring import ScoringEngine
 from ..event_agent.itinerary import ItineraryBuilder
 from ..event_agent.authoring import SharePointAuthor
 from ..event_agent.work_iq import load_interest_profile
+from .serialization import dumps
 
 
 class EventGuideAgent:
@@ -89,7 +90,7 @@ if HAVE_SDK:
                 interests_part = text.split(":", 1)[1]
                 interests = [t.strip() for t in interests_part.split(",") if t.strip()]
                 result = agent.recommend(interests)
-                await turn_context.send_activity(str(result))
+                await turn_context.send_activity(dumps(result).decode("utf-8"))
             elif text.startswith("explain:"):
                 parts = text.split(":", 2)
                 if len(parts) >= 3:
@@ -99,7 +100,7 @@ if HAVE_SDK:
                         t.strip() for t in interests_part.split(",") if t.strip()
                     ]
                     result = agent.explain(session_title, interests)
-                    await turn_context.send_activity(str(result))
+                    await turn_context.send_activity(dumps(result).decode("utf-8"))
                 else:
                     await turn_context.send_activity(
                         "Format: explain:<session>:<interests>"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark POST /api/messages under concurrent load with a local aiohttp client.
+Starts the lightweight host from run_agent.build_app on a local port, fires
+requests from N concurrent workers and prints throughput and latency as JSON.
+Usage:
+  python bench_messages.py --requests 2000 --concurrency 32
+  python bench_messages.py --text "explain:Generative Agents in Production:agents" --gzip
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import pathlib
+import socket
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+_here = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(_here))
+sys.path.insert(0, str(_here.parent))
+
+from run_agent import build_app  # type: ignore  # noqa: E402
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run_benchmark(
+    total: int, concurrency: int, text: str, port: int, accept_gzip: bool
+) -> Dict[str, Any]:
+    from aiohttp import ClientSession, web  # type: ignore
+
+    runner = web.AppRunner(build_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    url = f"http://127.0.0.1:{port}/api/messages"
+    headers = {"Accept-Encoding": "gzip" if accept_gzip else "identity"}
+    latencies: List[float] = []
+    errors = 0
+    bytes_received = 0
+    remaining = iter(range(total))
+
+    async def worker(session: ClientSession) -> None:
+        nonlocal errors, bytes_received
+        for _ in remaining:
+            t0 = time.perf_counter()
+            try:
+                async with session.post(url, json={"text": text}, headers=headers) as resp:
+                    body = await resp.read()
+                    if resp.status != 200:
+                        errors += 1
+                    bytes_received += int(resp.headers.get("Content-Length", len(body)))
+            except Exception:  # noqa: BLE001
+                errors += 1
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    try:
+        async with ClientSession(auto_decompress=True) as session:
+            # Warm-up request so imports / first card build are not measured
+            async with session.post(url, json={"text": text}) as resp:
+                await resp.read()
+            started = time.perf_counter()
+            await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+    finally:
+        await runner.cleanup()
+
+    ordered = sorted(latencies)
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "gzip": accept_gzip,
+        "elapsed_s": elapsed,
+        "rps": total / elapsed if elapsed else None,
+        "errors": errors,
+        "bytes_per_response": bytes_received / total if total else 0,
+        "latency_ms": {
+            "median": statistics.median(ordered) if ordered else None,
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "max": ordered[-1] if ordered else None,
+        },
+    }
+
+
+def main():  # pragma: no cover
+    p = argparse.ArgumentParser(description="Benchmark /api/messages")
+    p.add_argument("--requests", type=int, default=1000)
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--text", default="recommend:AI safety, agents")
+    p.add_argument("--port", type=int, default=None, help="Default: a free local port")
+    p.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    args = p.parse_args()
+    result = asyncio.run(
+        run_benchmark(
+            args.requests,
+            args.concurrency,
+            args.text,
+            args.port or _free_port(),
+            args.gzip,
+        )
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
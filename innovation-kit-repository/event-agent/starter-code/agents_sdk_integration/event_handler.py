@@ -18,10 +18,30 @@ try:  # Support running as loose script without package context
     from .activities import RecommendActivity, ExplainActivity  # type: ignore
     from .integration_telemetry import StructuredTelemetry  # type: ignore
     from .storage import StorageFacade  # type: ignore
+    from .serialization import dumps  # type: ignore
+    from .settings import get_settings  # type: ignore
+    from ..event_agent.telemetry import StageTimer, NULL_TIMER  # type: ignore
 except ImportError:  # pragma: no cover - fallback when executed directly
     from activities import RecommendActivity, ExplainActivity  # type: ignore
     from integration_telemetry import StructuredTelemetry  # type: ignore
     from storage import StorageFacade  # type: ignore
+    from serialization import dumps  # type: ignore
+    from settings import get_settings  # type: ignore
+    from event_agent.telemetry import StageTimer, NULL_TIMER  # type: ignore
+
+
+async def send_result(turn_context: TurnContext, result: Dict[str, Any]) -> None:
+    """Send a structured result.
+
+    Contexts exposing ``send_result`` (the lightweight aiohttp host) receive the
+    dict as-is and serialize it once for the HTTP response; SDK contexts get the
+    compact JSON text.
+    """
+    structured = getattr(turn_context, "send_result", None)
+    if structured is not None:
+        await structured(result)
+        return
+    await turn_context.send_activity(dumps(result).decode("utf-8"))
 
 
 class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
@@ -30,11 +50,16 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
         self.explain_activity = ExplainActivity()
         self.telemetry = StructuredTelemetry()
         self.storage = StorageFacade()
+        self.stage_timings = get_settings().enable_stage_timings
+
+    def _new_timer(self):
+        return StageTimer() if self.stage_timings else NULL_TIMER
 
     async def on_message_activity(self, turn_context: TurnContext):  # type: ignore[override]
-        activity = getattr(turn_context, "activity", {}) if HAVE_SDK else {}
-        value: Dict[str, Any] = getattr(activity, "value", {}) if HAVE_SDK else {}
-        text = getattr(activity, "text", "") if HAVE_SDK else ""
+        # Read fields off any context exposing .activity (SDK or lightweight host)
+        activity = getattr(turn_context, "activity", {})
+        value: Dict[str, Any] = getattr(activity, "value", {})
+        text = getattr(activity, "text", "")
         # Card action handling first (Adaptive Card Action.Submit payload)
         if (
             value
@@ -52,7 +77,8 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
                 interests = [str(t) for t in stored_interests]
 
             start_ts = time.time()
-            result = self.explain_activity.run(session_title, interests)
+            timer = self._new_timer()
+            result = self.explain_activity.run(session_title, interests, timer=timer)
             result["profileUsed"] = profile_key if interests else None
             self.telemetry.log(
                 "explainCardAction",
@@ -62,8 +88,9 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
                 start_ts=start_ts,
                 success="error" not in result,
                 error=result.get("error"),
+                stages=timer.stages,
             )
-            await turn_context.send_activity(str(result))
+            await send_result(turn_context, result)
             return
         if not text:
             await turn_context.send_activity(
@@ -81,7 +108,8 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
                 profile_key = f"profile_{user_id}"
                 self.storage.set(profile_key, interests)
 
-            result = self.recommend_activity.run(interests)
+            timer = self._new_timer()
+            result = self.recommend_activity.run(interests, timer=timer)
             self.telemetry.log(
                 "recommend",
                 {"sessions": len(result.get("sessions", []))},
@@ -89,8 +117,9 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
                 channel="teams" if HAVE_SDK else "local",
                 start_ts=start_ts,
                 success=True,
+                stages=timer.stages,
             )
-            await turn_context.send_activity(str(result))
+            await send_result(turn_context, result)
             return
         if text.startswith("explain:"):
             parts = text.split(":", 2)
@@ -100,7 +129,8 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
             session_title = parts[1].strip()
             interests_part = parts[2].strip()
             interests = [t.strip() for t in interests_part.split(",") if t.strip()]
-            result = self.explain_activity.run(session_title, interests)
+            timer = self._new_timer()
+            result = self.explain_activity.run(session_title, interests, timer=timer)
             self.telemetry.log(
                 "explain",
                 {"session": session_title},
@@ -109,8 +139,9 @@ class EventGuideActivityHandler:  # pragma: no cover - runtime depends on SDK
                 start_ts=start_ts,
                 success="error" not in result,
                 error=result.get("error"),
+                stages=timer.stages,
             )
-            await turn_context.send_activity(str(result))
+            await send_result(turn_context, result)
             return
         await turn_context.send_activity(
             "Commands: recommend:<interests> | explain:<session>:<interests>"
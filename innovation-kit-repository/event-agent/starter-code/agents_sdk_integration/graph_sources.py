@@ -20,14 +20,18 @@ try:
     from .auth import MsalClientCredentials  # type: ignore
     from .session_cache import SessionCache  # type: ignore
     from .settings import get_settings  # type: ignore
+    from .adaptive_cards import clear_card_cache  # type: ignore
 except ImportError:
     from auth import MsalClientCredentials  # type: ignore
     from session_cache import SessionCache  # type: ignore
     from settings import get_settings  # type: ignore
+    from adaptive_cards import clear_card_cache  # type: ignore
 
 
 # Global cache instance
 _cache: Optional[SessionCache] = None
+# Sessions from the last successful Graph fetch (to detect catalog changes)
+_last_graph_sessions: Optional[List[Session]] = None
 
 
 def get_cache() -> SessionCache:
@@ -142,8 +146,14 @@ def fetch_sessions() -> List[Session]:
     result = fetch_sessions_from_graph()
     sessions = result.get("sessions", [])
 
-    if sessions and settings.enable_session_cache:
-        cache.set(sessions)
+    if sessions:
+        global _last_graph_sessions
+        # Cards for a replaced catalog can no longer be hit; drop them only then
+        if sessions != _last_graph_sessions:
+            clear_card_cache()
+            _last_graph_sessions = sessions
+        if settings.enable_session_cache:
+            cache.set(sessions)
 
     return sessions
 
@@ -1,5 +1,6 @@
 """Structured telemetry logger for SDK integration.
-Adds channel, user_hash, latency, action fields.
+Adds channel, user_hash, latency, action fields and an optional per-stage
+breakdown (stages_ms) when stage timings are enabled.
 """
 
 from __future__ import annotations
@@ -28,6 +29,7 @@ class StructuredTelemetry:
         start_ts: float | None = None,
         success: bool | None = None,
         error: str | None = None,
+        stages: Dict[str, float] | None = None,
     ) -> None:
         record = {
             "ts": time.time(),
@@ -39,5 +41,7 @@ class StructuredTelemetry:
             "success": success,
             "error": error,
         }
+        if stages:
+            record["stages_ms"] = stages
         with self.path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(record) + "\n")
@@ -84,58 +84,84 @@ def parse_args():
     return p.parse_args()
 
 
-def run_sdk(port: int):  # pragma: no cover - requires SDK
-    if not HAVE_SDK:
-        print("SDK packages not available; install microsoft-agents-* to enable.")
-        return
+def _load_handler():
     try:
-        from aiohttp import web  # type: ignore
-    except Exception as e:  # noqa: BLE001
-        print(f"Unable to import aiohttp: {e}")
-        return
+        from event_handler import EventGuideActivityHandler  # type: ignore
+    except ImportError:
+        from .event_handler import EventGuideActivityHandler  # type: ignore
+    return EventGuideActivityHandler()
+
+
+def build_app(handler=None):  # pragma: no cover - requires aiohttp
+    """Build the lightweight aiohttp app exposing POST /api/messages.
+
+    Responses are serialized exactly once with the compact encoder and gzipped
+    for large payloads when the client sends ``Accept-Encoding: gzip``.
+    """
+    from aiohttp import web  # type: ignore
+
+    try:
+        from serialization import dumps, maybe_gzip  # type: ignore
+    except ImportError:
+        from .serialization import dumps, maybe_gzip  # type: ignore
+
     # Lightweight local hosting wrapper (does not yet use CloudAdapter due to additional
     # connection/token requirements). It simulates a TurnContext sufficient for our
     # EventGuideActivityHandler to process 'recommend:' and 'explain:' messages.
-    try:
-        from event_handler import EventGuideActivityHandler  # type: ignore
-    except ImportError:
-        try:
-            from .event_handler import EventGuideActivityHandler  # type: ignore
-        except ImportError as e:  # noqa: BLE001
-            print(f"Could not import EventGuideActivityHandler: {e}")
-            return
-    handler = EventGuideActivityHandler()
+    if handler is None:
+        handler = _load_handler()
 
     class FakeTurnContext:  # pragma: no cover - simple adapter shim
         def __init__(self, activity):
             self.activity = activity
             self._response = None
 
+        async def send_result(self, result):  # structured path, no text round-trip
+            self._response = result
+
         async def send_activity(self, message):  # handler expects awaited call
             if isinstance(message, str):
-                try:
-                    self._response = json.loads(message)
-                except Exception:  # noqa: BLE001
-                    self._response = {"text": message}
+                self._response = {"text": message}
             else:
                 self._response = message
 
+    # Build minimal activity object with 'text' and optional 'value'
+    class ActivityObj:  # noqa: D401 - simple container
+        pass
+
     async def messages(request):  # type: ignore
         data = await request.json()
-
-        # Build minimal activity object with 'text' and optional 'value'
-        class ActivityObj:  # noqa: D401 - simple container
-            pass
-
         activity = ActivityObj()
         for k, v in data.items():
             setattr(activity, k, v)
         tc = FakeTurnContext(activity)
         await handler.on_message_activity(tc)
-        return web.json_response(tc._response or {"status": "no response"})
+        body, encoding = maybe_gzip(
+            dumps(tc._response or {"status": "no response"}),
+            request.headers.get("Accept-Encoding"),
+        )
+        headers = {"Content-Encoding": encoding} if encoding else None
+        return web.Response(body=body, content_type="application/json", headers=headers)
 
     app = web.Application()
     app.router.add_post("/api/messages", messages)
+    return app
+
+
+def run_sdk(port: int):  # pragma: no cover - requires SDK
+    if not HAVE_SDK:
+        print("SDK packages not available; install microsoft-agents-* to enable.")
+        return
+    try:
+        from aiohttp import web  # type: ignore
+    except Exception as e:  # noqa: BLE001
+        print(f"Unable to import aiohttp: {e}")
+        return
+    try:
+        app = build_app()
+    except ImportError as e:  # noqa: BLE001
+        print(f"Could not import EventGuideActivityHandler: {e}")
+        return
     print(
         f"Starting lightweight Event Guide server on port {port} (POST /api/messages)"
     )
@@ -0,0 +1,61 @@
+"""Compact JSON encoding for Event Guide responses.
+Uses orjson when installed, else stdlib json with compact separators.
+Large payloads (Adaptive Cards) can be gzipped for clients that accept it.
+"""
+
+from __future__ import annotations
+import gzip
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+    HAVE_ORJSON = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+GZIP_MIN_BYTES = 1024
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 refuses a coding).
+
+    An explicit ``gzip`` entry wins over a ``*`` wildcard.
+    """
+    qualities: dict[str, float] = {}
+    for token in (accept_encoding or "").lower().split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def maybe_gzip(
+    body: bytes, accept_encoding: str | None, min_bytes: int = GZIP_MIN_BYTES
+) -> tuple[bytes, str | None]:
+    """Gzip body when the client accepts it and it is large enough to pay off.
+
+    Returns (body, content_encoding) where content_encoding is "gzip" or None.
+    """
+    if len(body) < min_bytes or not accepts_gzip(accept_encoding):
+        return body, None
+    # Level 5 keeps card payloads small without dominating request latency
+    return gzip.compress(body, compresslevel=5), "gzip"
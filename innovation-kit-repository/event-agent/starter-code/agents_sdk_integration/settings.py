@@ -55,6 +55,7 @@ class Settings(BaseSettings):
     telemetry_file: str = Field(
         default="integration_telemetry.jsonl", alias="TELEMETRY_FILE"
     )
+    enable_stage_timings: bool = Field(default=False, alias="ENABLE_STAGE_TIMINGS")
 
     # SDK Hosting
     agent_port: int = Field(default=3978, alias="AGENT_PORT")
@@ -7,6 +7,9 @@ Tests:
 3. Explain with profile auto-load
 4. Publish capability (feature flag driven)
 5. Telemetry capture
+6. Adaptive card cache
+7. Stage timings
+8. Response encoding (compact JSON, gzip negotiation)
 
 Run: python test_mvp.py
 """
@@ -16,6 +19,7 @@ import sys
 import os
 import pathlib
 import json
+from types import SimpleNamespace
 
 # Add integration and parent directories to path
 _here = pathlib.Path(__file__).resolve().parent
@@ -195,6 +199,176 @@ def test_adaptive_card_actions():
     return True
 
 
+def test_adaptive_card_cache():
+    """Test 8: Adaptive cards cached per rendered session content."""
+    print("✓ Test 8: Adaptive card cache")
+    try:
+        from adaptive_cards import build_itinerary_card, clear_card_cache
+
+        clear_card_cache()
+        activity = RecommendActivity(include_card=True)
+        first = activity.run(interests=["agents"], max_sessions=2)
+        second = activity.run(interests=["agents"], max_sessions=2)
+        assert first["adaptiveCard"] is second["adaptiveCard"]
+
+        # Same ids with an edited room must not serve the stale card
+        moved = [dict(s) for s in first["sessions"]]
+        moved[0]["location"] = "Hall Z"
+        moved_card = build_itinerary_card({"sessions": moved})
+        assert moved_card is not first["adaptiveCard"]
+        assert "@ Hall Z" in moved_card["body"][1]["items"][1]["text"]
+
+        clear_card_cache()
+        rebuilt = build_itinerary_card(first)
+        assert rebuilt is not first["adaptiveCard"]
+        assert rebuilt == first["adaptiveCard"]
+
+        # Graph refreshes clear the cache only when the catalog changed
+        from event_agent.main import MOCK_SESSIONS
+
+        fetched = {"sessions": MOCK_SESSIONS[:2]}
+        clears = []
+        saved = (
+            graph_sources.get_settings,
+            graph_sources.fetch_sessions_from_graph,
+            graph_sources.clear_card_cache,
+        )
+        graph_sources.get_settings = lambda: SimpleNamespace(
+            enable_graph_fetch=True,
+            enable_session_cache=False,
+            session_cache_ttl_minutes=1,
+            graph_enabled=lambda: True,
+        )
+        graph_sources.fetch_sessions_from_graph = lambda: fetched
+        graph_sources.clear_card_cache = lambda: clears.append(1)
+        try:
+            graph_sources.fetch_sessions()
+            graph_sources.fetch_sessions()
+            assert len(clears) == 1
+            fetched = {"sessions": MOCK_SESSIONS[1:3]}
+            graph_sources.fetch_sessions()
+            assert len(clears) == 2
+        finally:
+            (
+                graph_sources.get_settings,
+                graph_sources.fetch_sessions_from_graph,
+                graph_sources.clear_card_cache,
+            ) = saved
+            graph_sources._last_graph_sessions = None
+
+        print("  ✓ Cached card reused, rebuilt on content change and after clear")
+        print("  ✓ Graph refresh clears cards only when sessions change")
+    except Exception as e:
+        print(f"  ✗ Card cache test failed: {e}")
+        return False
+    return True
+
+
+def test_stage_timings():
+    """Test 9: Activities report a per-stage breakdown into telemetry."""
+    print("✓ Test 9: Stage timings")
+    try:
+        import tempfile
+        from event_agent.telemetry import StageTimer, NULL_TIMER
+        from integration_telemetry import StructuredTelemetry
+
+        timer = StageTimer()
+        RecommendActivity(include_card=True).run(["agents"], timer=timer)
+        expected = {"normalize", "session_load", "scoring", "ranking", "conflicts"}
+        assert expected | {"card_build"} <= set(timer.stages)
+        explain_timer = StageTimer()
+        ExplainActivity().run("AI Safety Foundations", ["ai"], timer=explain_timer)
+        assert {"normalize", "session_load", "scoring"} <= set(explain_timer.stages)
+
+        RecommendActivity(include_card=False).run(["agents"], timer=NULL_TIMER)
+        assert NULL_TIMER.stages == {}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "t.jsonl"
+            StructuredTelemetry(str(path)).log("recommend", {}, stages=timer.stages)
+            record = json.loads(path.read_text().splitlines()[-1])
+            assert set(record["stages_ms"]) == set(timer.stages)
+
+        print(f"  ✓ Stages recorded: {', '.join(sorted(timer.stages))}")
+    except Exception as e:
+        print(f"  ✗ Stage timing test failed: {e}")
+        return False
+    return True
+
+
+def test_response_encoding():
+    """Test 10: Compact JSON and gzip only when the client accepts it."""
+    print("✓ Test 10: Response encoding")
+    try:
+        import gzip
+        from serialization import dumps, maybe_gzip
+
+        payload = {"sessions": [{"title": "Agents", "room": "Hall A"}] * 40}
+        body = dumps(payload)
+        assert b", " not in body and b'": ' not in body
+        assert json.loads(body) == payload
+        assert len(body) > 1024
+
+        assert maybe_gzip(b"{}", "gzip") == (b"{}", None)  # below min_bytes
+        assert maybe_gzip(body, None) == (body, None)
+        assert maybe_gzip(body, "gzip;q=0") == (body, None)
+        assert maybe_gzip(body, "identity, gzip;q=0") == (body, None)
+        assert maybe_gzip(body, "*, gzip;q=0") == (body, None)
+        for header in ("gzip", "deflate, GZIP;q=0.5", "*"):
+            compressed, encoding = maybe_gzip(body, header)
+            assert encoding == "gzip" and len(compressed) < len(body)
+            assert gzip.decompress(compressed) == body
+
+        print("  ✓ Gzip honors Accept-Encoding tokens, q=0 and min_bytes")
+    except Exception as e:
+        print(f"  ✗ Response encoding test failed: {e}")
+        return False
+    return True
+
+
+def test_messages_gzip_response():
+    """Test 11: /api/messages gzips large responses for gzip-accepting clients."""
+    print("✓ Test 11: /api/messages gzip response")
+    try:
+        import asyncio
+        import gzip
+
+        try:
+            from aiohttp.test_utils import TestClient, TestServer
+        except ImportError:
+            print("  - aiohttp not installed; skipped")
+            return True
+        from run_agent import build_app
+
+        async def post(client, accept_encoding):
+            resp = await client.post(
+                "/api/messages",
+                json={"text": "recommend:AI safety, agents"},
+                headers={"Accept-Encoding": accept_encoding},
+            )
+            assert resp.status == 200
+            return resp.headers.get("Content-Encoding"), await resp.read()
+
+        async def run():
+            client = TestClient(TestServer(build_app()), auto_decompress=False)
+            await client.start_server()
+            try:
+                return await post(client, "gzip"), await post(client, "gzip;q=0")
+            finally:
+                await client.close()
+
+        (encoding, compressed), (plain_encoding, plain) = asyncio.run(run())
+        assert encoding == "gzip" and plain_encoding is None
+        assert gzip.decompress(compressed) == plain
+        assert "sessions" in json.loads(plain)
+
+        print(f"  ✓ {len(plain)} byte response sent as {len(compressed)} gzip bytes")
+    except Exception as e:
+        print(f"  ✗ Messages gzip test failed: {e}")
+        return False
+    return True
+
+
 def main():
     print("\n" + "=" * 60)
     print("EVENT GUIDE AGENT - MVP END-TO-END TEST")
@@ -208,6 +382,10 @@ def main():
         test_publish_skip_when_disabled,
         test_cache_functionality,
         test_adaptive_card_actions,
+        test_adaptive_card_cache,
+        test_stage_timings,
+        test_response_encoding,
+        test_messages_gzip_response,
     ]
 
     passed = 0
@@ -10,7 +10,7 @@ from .work_iq import load_interest_profile
 from .scoring import ScoringEngine
 from .itinerary import ItineraryBuilder
 from .authoring import SharePointAuthor
-from .telemetry import TelemetryLogger
+from .telemetry import TelemetryLogger, StageTimer, NULL_TIMER
 
 __all__ = [
     "Session",
@@ -24,4 +24,6 @@ __all__ = [
     "ItineraryBuilder",
     "SharePointAuthor",
     "TelemetryLogger",
+    "StageTimer",
+    "NULL_TIMER",
 ]
@@ -7,7 +7,7 @@ from .work_iq import load_interest_profile
 from .scoring import ScoringEngine
 from .itinerary import ItineraryBuilder
 from .authoring import SharePointAuthor
-from .telemetry import TelemetryLogger
+from .telemetry import TelemetryLogger, StageTimer, NULL_TIMER
 from .graph_client import GraphClient
 
 MOCK_SESSIONS = [
@@ -73,6 +73,11 @@ def parse_args():
     p.add_argument(
         "--show-calendar", action="store_true", help="Fetch mock/real calendar events"
     )
+    p.add_argument(
+        "--stage-timings",
+        action="store_true",
+        help="Record per-stage timings (ms) in the telemetry line",
+    )
     return p.parse_args()
 
 
@@ -82,6 +87,7 @@ def build_sessions() -> List[Session]:
 
 def main():
     args = parse_args()
+    timer = StageTimer() if args.stage_timings else NULL_TIMER
     if args.work_iq_json:
         profile = load_interest_profile(args.work_iq_json)
     else:
@@ -94,11 +100,13 @@ def main():
 
         profile = InterestProfile(raw_terms=raw_terms, weights=weights)
 
-    sessions = build_sessions()
+    with timer.stage("session_load"):
+        sessions = build_sessions()
     scoring = ScoringEngine()
-    ranked = scoring.score(sessions, profile)
+    ranked = scoring.score(sessions, profile, timer)
     itinerary_builder = ItineraryBuilder(walking_buffer_minutes=args.walking_buffer)
-    itinerary = itinerary_builder.build(ranked, max_sessions=args.max_sessions)
+    with timer.stage("conflicts"):
+        itinerary = itinerary_builder.build(ranked, max_sessions=args.max_sessions)
 
     author = SharePointAuthor()
     telemetry = TelemetryLogger()
@@ -129,7 +137,9 @@ def main():
             print(f"Event: {e.get('subject', '(no subject)')}")
 
     telemetry.log(
-        "run", {"sessions": len(itinerary.sessions), "conflicts": itinerary.conflicts}
+        "run",
+        {"sessions": len(itinerary.sessions), "conflicts": itinerary.conflicts},
+        stages=timer.stages,
     )
 
     if args.output:
@@ -6,6 +6,7 @@ from .models import (
     RecommendationResult,
     RecommendationFeatureContribution,
 )
+from .telemetry import NULL_TIMER
 
 
 class ScoringEngine:
@@ -20,6 +21,14 @@ class ScoringEngine:
         self.w_diversity = w_diversity
 
     def score(
+        self, sessions: List[Session], profile: InterestProfile, timer=NULL_TIMER
+    ) -> List[RecommendationResult]:
+        with timer.stage("scoring"):
+            results = self._score_all(sessions, profile)
+        with timer.stage("ranking"):
+            return sorted(results, key=lambda r: r.score, reverse=True)
+
+    def _score_all(
         self, sessions: List[Session], profile: InterestProfile
     ) -> List[RecommendationResult]:
         results: List[RecommendationResult] = []
@@ -49,4 +58,4 @@ class ScoringEngine:
                     session=s, score=total, contributions=contributions
                 )
             )
-        return sorted(results, key=lambda r: r.score, reverse=True)
+        return results
@@ -1,19 +1,58 @@
 from __future__ import annotations
 import json
 import time
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+
+# StageTimer/_NullTimer/NULL_TIMER are kept identical to eventkit/telemetry.py
+# (the two kits ship separately); eventkit/tests/test_telemetry.py checks both.
+class StageTimer:
+    """Accumulates per-stage wall time (ms) for one request."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - t0) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+
+class _NullTimer:
+    """Disabled timer: stage() hands back one shared no-op context manager."""
+
+    stages: Dict[str, float] = {}
+    _ctx = nullcontext()
+
+    def stage(self, name: str):
+        return self._ctx
+
+
+NULL_TIMER = _NullTimer()
 
 
 class TelemetryLogger:
     def __init__(self, path: str = "telemetry.jsonl"):
         self.path = Path(path)
 
-    def log(self, event_type: str, payload: Dict[str, Any]) -> None:
+    def log(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        stages: Optional[Dict[str, float]] = None,
+    ) -> None:
         record = {
             "ts": time.time(),
             "type": event_type,
             "payload": payload,
         }
+        if stages:
+            record["stages_ms"] = stages
         with self.path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(record) + "\n")